@@ -7,22 +7,43 @@ do problema de distribuição de tarefas entre máquinas.
 Uso:
     python gerar_graficos.py                          # usa o .txt mais recente na pasta
     python gerar_graficos.py Resultado_15_02_2026.txt # ou especifica o arquivo
+    python gerar_graficos.py --only fig2,fig5         # gera só algumas figuras
+    python gerar_graficos.py -j 5                     # renderiza em 5 processos
+    python gerar_graficos.py Resultado_X.res          # formato binário de controle.py
+    python gerar_graficos.py --reamostras 2000        # bootstrap mais rápido para os ICs
+    python gerar_graficos.py --prever 100000          # custo previsto pelo ajuste log-log
+    python gerar_graficos.py --only fig6              # convergência (controle.py --trajetoria)
+    python gerar_graficos.py --only fig7              # tempo por fase (controle.py --perfil)
+    python gerar_graficos.py --only fig8              # por solução inicial (controle.py --partida)
+    python gerar_graficos.py --multi Resultados_Tarefas  # agrega todas as execuções da pasta
+    python gerar_graficos.py --acompanhar             # atualiza enquanto o experimento roda
+    python gerar_graficos.py --estatisticas           # só o resumo, sem figuras nem matplotlib
+    python gerar_graficos.py Resultado_X.res --formato json > resumo.json   # ou --formato csv
 """
 
 import sys
 import os
+import argparse
 import glob
 import csv
+import contextlib
 import io
+import json
 import math
-import matplotlib
-import matplotlib.pyplot as plt
-import matplotlib.gridspec as gridspec
+import time
+import functools
+import zlib
+from array import array
 import numpy as np
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
 
 # ── Estilo ──────────────────────────────────────────────────────────────────
-matplotlib.rcParams.update({
+# matplotlib só é importado (e o estilo aplicado) quando alguma figura é
+# desenhada: o resumo em texto, JSON ou CSV (--estatisticas) não o carrega.
+plt = gridspec = None
+
+ESTILO = {
     'figure.facecolor':  '#0d1117',
     'axes.facecolor':    '#161b22',
     'axes.edgecolor':    '#30363d',
@@ -39,17 +60,26 @@ matplotlib.rcParams.update({
     'font.size':         10,
     'axes.titlesize':    12,
     'axes.labelsize':    10,
-})
+}
 
 PALETTE = {
     'Monótona primeira escolha': '#38bdf8',   # azul
     'Monótona melhor escolha':   '#f87171',   # vermelho
     'BLM randomizada':           '#86efac',   # verde
+    'Melhor escolha com trocas': '#e879f9',   # fúcsia
 }
+# Acima deste total de pontos, gráficos por registro (dispersão e linhas por
+# replicação) passam a mostrar faixas de percentis em vez de um marcador por
+# registro. Configurável com --limiar-pontos.
+LIMIAR_PONTOS = 20_000
+# Reamostras do bootstrap dos intervalos de confiança (--reamostras)
+REAMOSTRAS = 10_000
+
 MARKERS = {
     'Monótona primeira escolha': 'o',
     'Monótona melhor escolha':   's',
     'BLM randomizada':           '^',
+    'Melhor escolha com trocas': 'D',
 }
 
 
@@ -97,77 +127,636 @@ def encontrar_arquivo():
              "   python gerar_graficos.py \"caminho\\completo\\Resultado.txt\"")
 
 
-def ler_dados(caminho):
-    """Lê o arquivo de resultados e retorna lista de dicionários."""
-    registros = []
-    with open(caminho, encoding='utf-8-sig') as f:
-        conteudo = f.read()
+Registro = namedtuple('Registro', 'heuristica n m rep tempo iteracoes mk_inicial mk_final alpha extras',
+                      defaults=(None,))
 
-    # Normaliza line endings Windows (CRLF → LF)
-    conteudo = conteudo.replace('\r\n', '\n').replace('\r', '\n')
-
-    linhas = conteudo.strip().splitlines()
-    for linha in linhas:
-        linha = linha.strip()
-        if not linha or linha.lower().startswith('heur'):
-            continue
 
-        partes = [p.strip() for p in linha.split(',')]
-        # O arquivo tem formato:
-        # heuristica, n, m, rep, INTEIRO,DECIMAL ms, iteracoes, mk_i, mk_f, alpha
-        # A vírgula decimal do tempo divide o campo em dois → temos 10 partes
-        if len(partes) < 9:
-            continue
+def _parse_linha(linha):
+    """Converte uma linha do arquivo em `Registro`; retorna None se inválida."""
+    linha = linha.strip()
+    if not linha or linha.lower().startswith('heur'):
+        return None
 
+    partes = [p.strip() for p in linha.split(',')]
+    # O arquivo tem formato:
+    # heuristica, n, m, rep, INTEIRO,DECIMAL ms, iteracoes, mk_i, mk_f, alpha[, chave=valor ...]
+    # A vírgula decimal do tempo divide o campo em dois → temos 10 partes
+    # Colunas opcionais vêm no fim como chave=valor, com ponto decimal
+    # (ex.: instancia=123)
+    extras = None
+    while partes and '=' in partes[-1]:
+        chave, _, valor = partes.pop().partition('=')
         try:
-            heuristica = partes[0]
-            n          = int(partes[1])
-            m          = int(partes[2])
-            rep        = int(partes[3])
-
-            # Detecta se o tempo foi partido em dois (vírgula decimal)
-            # Tentamos: partes[4] = inteiro, partes[5] = "decimal ms"
-            if 'ms' in partes[5] if len(partes) > 5 else False:
-                tempo_raw  = partes[4] + '.' + partes[5].replace(' ms', '').strip()
-                tempo      = float(tempo_raw)
-                offset     = 1   # deslocamento dos índices seguintes
-            else:
-                tempo      = float(partes[4].replace(',', '.').replace(' ms', '').strip())
-                offset     = 0
-
-            iteracoes  = int(partes[5 + offset])
-            mk_inicial = int(partes[6 + offset])
-            mk_final   = int(partes[7 + offset])
-            alpha_str  = partes[8 + offset].strip()
-            alpha      = None if alpha_str.upper() == 'NA' else float(alpha_str.replace(',', '.'))
-
-            registros.append({
-                'heuristica': heuristica,
-                'n': n, 'm': m, 'rep': rep,
-                'tempo': tempo,
-                'iteracoes': iteracoes,
-                'mk_inicial': mk_inicial,
-                'mk_final': mk_final,
-                'alpha': alpha,
-                'reducao_pct': (mk_inicial - mk_final) / mk_inicial * 100,
-                'razao': mk_final / mk_inicial,
-            })
-        except (ValueError, IndexError):
-            continue
-
-    return registros
-
-
-def agrupar(registros, chave='heuristica'):
-    grupos = defaultdict(list)
-    for r in registros:
-        grupos[r[chave]].append(r)
-    return dict(grupos)
+            extras = extras or {}
+            extras[chave.strip()] = float(valor)
+        except ValueError:
+            return None
+    if len(partes) < 9:
+        return None
+
+    try:
+        heuristica = partes[0]
+        n          = int(partes[1])
+        m          = int(partes[2])
+        rep        = int(partes[3])
+
+        # Detecta se o tempo foi partido em dois (vírgula decimal)
+        # Tentamos: partes[4] = inteiro, partes[5] = "decimal ms"
+        if 'ms' in partes[5]:
+            tempo_raw  = partes[4] + '.' + partes[5].replace(' ms', '').strip()
+            tempo      = float(tempo_raw)
+            offset     = 1   # deslocamento dos índices seguintes
+        else:
+            tempo      = float(partes[4].replace(',', '.').replace(' ms', '').strip())
+            offset     = 0
+
+        iteracoes  = int(partes[5 + offset])
+        mk_inicial = int(partes[6 + offset])
+        mk_final   = int(partes[7 + offset])
+        # alpha também usa vírgula decimal ("0,4" → "0", "4")
+        alpha_str  = '.'.join(partes[8 + offset:10 + offset])
+        alpha      = math.nan if alpha_str.upper() == 'NA' else float(alpha_str)
+    except (ValueError, IndexError):
+        return None
+
+    return Registro(heuristica, n, m, rep, tempo, iteracoes, mk_inicial, mk_final, alpha, extras)
+
+
+def iterar_registros(caminho):
+    """Gera os registros do arquivo sob demanda, lendo uma linha por vez.
+
+    O modo texto com newline=None já converte CRLF/CR em LF durante a leitura,
+    então o arquivo nunca é carregado inteiro na memória.
+    """
+    with open(caminho, encoding='utf-8-sig', newline=None) as f:
+        for linha in f:
+            registro = _parse_linha(linha)
+            if registro is not None:
+                yield registro
+
+
+# ── Armazenamento colunar ───────────────────────────────────────────────────
+# Tipo de cada coluna numérica (códigos de array.array → dtype NumPy)
+COLUNAS = {
+    'n':          'q',
+    'm':          'q',
+    'rep':        'q',
+    'tempo':      'd',
+    'iteracoes':  'q',
+    'mk_inicial': 'q',
+    'mk_final':   'q',
+    'alpha':      'd',   # NaN quando a heurística não usa alpha (NA)
+}
 
 
-def media(lst, campo):
-    vals = [r[campo] for r in lst]
-    return sum(vals) / len(vals) if vals else 0
+class ConstrutorColunar:
+    """Acumula registros em buffers tipados (array.array), coluna a coluna."""
+
+    def __init__(self):
+        self.buffers    = {c: array(t) for c, t in COLUNAS.items()}
+        self.codigos    = array('b')
+        self.categorias = {}
+
+    def __len__(self):
+        return len(self.codigos)
+
+    def adicionar(self, r):
+        extras = r.extras or {}
+        for c in extras:
+            if c not in self.buffers:
+                # Coluna opcional nova: linhas anteriores ficam com NaN
+                self.buffers[c] = array('d', [math.nan]) * len(self.codigos)
+        self.codigos.append(self.categorias.setdefault(r.heuristica, len(self.categorias)))
+        for c, buf in self.buffers.items():
+            buf.append(getattr(r, c) if c in COLUNAS else extras.get(c, math.nan))
+
+    def resultados(self, copiar=False):
+        """Converte em `Resultados`.
+
+        Sem cópia, os arrays NumPy apontam para os buffers e o construtor não
+        pode mais crescer; use `copiar=True` para continuar adicionando depois.
+        """
+        def _np(buf, dtype):
+            if not len(buf):
+                return np.empty(0, dtype=dtype)
+            v = np.frombuffer(buf, dtype=dtype)
+            return v.copy() if copiar else v
+        colunas = {c: _np(buf, buf.typecode) for c, buf in self.buffers.items()}
+        return Resultados(colunas, _np(self.codigos, np.int8), self.categorias)
+
+
+class Resultados:
+    """Registros em colunas NumPy tipadas; heurísticas como códigos categóricos.
+
+    `dados['tempo']` devolve a coluna inteira; `reducao_pct` e `razao` são
+    derivadas uma única vez para o arquivo todo. Médias e intervalos de
+    confiança ficam em cache, então as figuras não recalculam os mesmos valores.
+    """
+
+    def __init__(self, colunas, codigos, categorias):
+        self.colunas    = colunas
+        self.codigos    = codigos
+        self.categorias = list(categorias)
+        self._medias    = {}
+        self._bootstrap = {}
+        self._ajustes   = {}
+        self.trajetorias = None   # curvas de convergência (ver ler_trajetorias)
+
+        if 'reducao_pct' not in colunas:
+            mk_i = colunas['mk_inicial'].astype(np.float64)
+            mk_f = colunas['mk_final'].astype(np.float64)
+            colunas['reducao_pct'] = (mk_i - mk_f) / mk_i * 100
+            colunas['razao']       = mk_f / mk_i
+
+    @classmethod
+    def de_registros(cls, registros):
+        """Monta o armazenamento consumindo um iterável de `Registro`."""
+        construtor = ConstrutorColunar()
+        for r in registros:
+            construtor.adicionar(r)
+        return construtor.resultados()
+
+    def __len__(self):
+        return len(self.codigos)
+
+    def __getitem__(self, campo):
+        if campo == 'heuristica':
+            return np.asarray(self.categorias, dtype=object)[self.codigos]
+        return self.colunas[campo]
+
+    def filtrar(self, mascara):
+        """Subconjunto (cópia) das linhas selecionadas pela máscara booleana."""
+        return Resultados({c: v[mascara] for c, v in self.colunas.items()},
+                          self.codigos[mascara], self.categorias)
+
+    def ordenado(self, campo):
+        """Subconjunto ordenado (estável) por um campo."""
+        return self.filtrar(np.argsort(self.colunas[campo], kind='stable'))
+
+    def media(self, campo):
+        """Média de um campo, calculada uma vez e guardada em cache."""
+        if campo not in self._medias:
+            col = self.colunas[campo]
+            self._medias[campo] = float(col.mean()) if len(col) else 0
+        return self._medias[campo]
+
+    def bootstrap(self, campo):
+        """Médias bootstrap de um campo (NaN ignorados), guardadas em cache.
+
+        A semente depende só do nome das heurísticas presentes (CRC32), não da
+        ordem em que aparecem no arquivo: todos os campos de um grupo reamostram
+        as mesmas linhas e o resultado é o mesmo em todo processo e arquivo.
+        """
+        if campo not in self._bootstrap:
+            col = self.colunas[campo]
+            col = col[~np.isnan(col)] if col.dtype.kind == 'f' else col
+            nomes = sorted(self.categorias[c] for c in np.unique(self.codigos))
+            semente = zlib.crc32('|'.join(nomes).encode())
+            self._bootstrap[campo] = (distribuicao_bootstrap(col, rng=_rng_bootstrap(semente))
+                                      if len(col) else np.empty(0))
+        return self._bootstrap[campo]
+
+    def intervalo(self, campo):
+        """IC bootstrap da média de um campo (`IntervaloConfianca`)."""
+        return _intervalo(self.media(campo), self.bootstrap(campo))
+
+    def ajuste(self, campo):
+        """Ajuste log-log de um campo contra n e m (`Ajuste`), guardado em cache."""
+        if campo not in self._ajustes:
+            self._ajustes[campo] = ajustar_escalonamento(self, campo)
+        return self._ajustes[campo]
+
+
+# ── Cache binário ───────────────────────────────────────────────────────────
+# Ao lado de Resultado_X.txt ficam Resultado_X.cache.npy (array estruturado
+# com todas as colunas) e Resultado_X.cache.json (categorias + assinatura da
+# fonte). O .npy é aberto com memmap: leitura quase instantânea e páginas
+# compartilhadas entre processos que leem o mesmo arquivo.
+VERSAO_CACHE = 2
+
+
+def _caminhos_cache(caminho):
+    base = os.path.splitext(caminho)[0]
+    return base + '.cache.npy', base + '.cache.json'
+
+
+def _assinatura(caminho):
+    st = os.stat(caminho)
+    return {'versao': VERSAO_CACHE, 'mtime_ns': st.st_mtime_ns, 'tamanho': st.st_size}
+
+
+def _carregar_cache(caminho):
+    """Abre o cache via memmap se ele corresponder à fonte; senão retorna None."""
+    arq_npy, arq_json = _caminhos_cache(caminho)
+    try:
+        with open(arq_json, encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('fonte') != _assinatura(caminho):
+            return None
+        tabela = np.load(arq_npy, mmap_mode='r')
+    except (OSError, ValueError):
+        return None
+
+    colunas = {c: tabela[c] for c in tabela.dtype.names if c != 'codigo'}
+    return Resultados(colunas, tabela['codigo'], meta['categorias'])
+
+
+def _salvar_cache(caminho, dados):
+    """Grava o cache de forma atômica; falhas de escrita são apenas avisadas."""
+    arq_npy, arq_json = _caminhos_cache(caminho)
+    campos = [('codigo', np.int8)] + [(c, v.dtype) for c, v in dados.colunas.items()]
+    tabela = np.empty(len(dados), dtype=campos)
+    tabela['codigo'] = dados.codigos
+    for c, v in dados.colunas.items():
+        tabela[c] = v
+
+    meta = {'fonte': _assinatura(caminho), 'categorias': dados.categorias}
+    try:
+        with open(arq_npy + '.tmp', 'wb') as f:
+            np.save(f, tabela)
+        os.replace(arq_npy + '.tmp', arq_npy)
+        # O .json é gravado por último: sem ele o cache nunca é considerado válido
+        with open(arq_json + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(arq_json + '.tmp', arq_json)
+    except OSError as e:
+        print(f'   Aviso: não foi possível gravar o cache ({e})')
+
+
+# ── Formato binário (.res) ──────────────────────────────────────────────────
+# Gravado por controle.py --binario ao lado do .txt. Layout: b'RESTAREF',
+# tamanho do cabeçalho (uint32 LE), cabeçalho JSON com o esquema
+# {"campos": [[nome, dtype], ...], "heuristicas": [...]} e registros de
+# largura fixa. O esquema explícito dispensa qualquer heurística de parse.
+MAGICO_BINARIO = b'RESTAREF'
+
+
+def ler_binario(caminho):
+    """Abre um .res via memmap: as colunas são vistas do arquivo, sem cópia."""
+    with open(caminho, 'rb') as f:
+        if f.read(len(MAGICO_BINARIO)) != MAGICO_BINARIO:
+            raise ValueError(f'{caminho}: não é um arquivo de resultados binário')
+        tamanho = int.from_bytes(f.read(4), 'little')
+        esquema = json.loads(f.read(tamanho))
+    inicio = len(MAGICO_BINARIO) + 4 + tamanho
+    dtype = np.dtype([tuple(c) for c in esquema['campos']])
+
+    # Um registro parcial no fim (escrita em andamento) fica de fora
+    qtd = (os.path.getsize(caminho) - inicio) // dtype.itemsize
+    if qtd == 0:
+        tabela = np.zeros(0, dtype=dtype)
+    else:
+        tabela = np.memmap(caminho, dtype=dtype, mode='r', offset=inicio, shape=(qtd,))
+    colunas = {c: tabela[c] for c in dtype.names if c != 'heuristica'}
+    return Resultados(colunas, tabela['heuristica'], esquema['heuristicas'])
+
+
+def _caminho_binario(caminho):
+    """O .res correspondente a um .txt, se existir e estiver em dia com ele.
+
+    controle.py grava cada linha no .txt e em seguida no .res, então um .res
+    mais antigo que o .txt perdeu linhas (ex.: grade retomada sem --binario)
+    e o texto é lido no lugar dele.
+    """
+    if caminho.endswith('.res'):
+        return caminho
+    res = os.path.splitext(caminho)[0] + '.res'
+    if not os.path.exists(res):
+        return None
+    if os.path.exists(caminho) and os.stat(res).st_mtime_ns < os.stat(caminho).st_mtime_ns:
+        return None
+    return res
+
+
+def ler_trajetorias(caminho):
+    """Curvas de convergência do .traj.npz ao lado (controle.py --trajetoria).
+
+    Retorna um dict de arrays no layout de controle.GravadorTrajetorias, ou
+    None se o arquivo não existir.
+    """
+    arquivo = os.path.splitext(caminho)[0] + '.traj.npz'
+    if not os.path.exists(arquivo):
+        return None
+    with np.load(arquivo) as npz:
+        return {c: npz[c] for c in npz.files}
+
+
+def ler_dados(caminho, usar_cache=True):
+    """Lê o arquivo de resultados e retorna um armazenamento colunar.
+
+    Se houver um .res em dia ao lado (controle.py --binario), ele é lido
+    direto, sem parse. Senão, com `usar_cache`, reaproveita o cache binário quando mtime e
+    tamanho da fonte não mudaram; caso contrário faz o parse e regrava o cache.
+    As curvas de convergência, se houver, ficam em `dados.trajetorias`.
+    """
+    dados = _ler_registros(caminho, usar_cache)
+    dados.trajetorias = ler_trajetorias(caminho)
+    return dados
+
+
+def _ler_registros(caminho, usar_cache):
+    binario = _caminho_binario(caminho)
+    if binario is not None:
+        return ler_binario(binario)
+
+    if usar_cache:
+        dados = _carregar_cache(caminho)
+        if dados is not None:
+            return dados
+
+    dados = Resultados.de_registros(iterar_registros(caminho))
+    if usar_cache and len(dados):
+        _salvar_cache(caminho, dados)
+    return dados
+
+
+def agrupar(dados, chave='heuristica'):
+    """Divide o armazenamento por chave (uma máscara por grupo, ordem de aparição)."""
+    if chave == 'heuristica':
+        presentes = np.flatnonzero(np.bincount(dados.codigos, minlength=len(dados.categorias)))
+        return {dados.categorias[i]: dados.filtrar(dados.codigos == i) for i in presentes}
+    col = dados[chave]
+    _, primeiros = np.unique(col, return_index=True)
+    valores = col[np.sort(primeiros)]
+    return {v.item(): dados.filtrar(col == v) for v in valores}
+
+
+def media(dados, campo):
+    return dados.media(campo)
+
+
+def _media_por_instancia(dados, campo):
+    """(instâncias, média de `campo` por instância); várias linhas por
+    instância (ex.: um alpha por linha na BLM) viram uma média."""
+    inst = dados['instancia']
+    ok = ~np.isnan(inst)
+    ids, pos = np.unique(inst[ok], return_inverse=True)
+    soma = np.bincount(pos, weights=dados[campo][ok], minlength=len(ids))
+    return ids, soma / np.bincount(pos, minlength=len(ids))
+
+
+# ── Estatística (bootstrap vetorizado) ──────────────────────────────────────
+# Cada bootstrap sorteia uma matriz de índices (reamostras × n) e tira a média
+# por eixo: nenhum laço Python por reamostra. A matriz é gerada em blocos de até
+# BLOCO_BOOTSTRAP elementos para limitar a memória, e grupos muito grandes usam
+# menos reamostras (ORCAMENTO_BOOTSTRAP elementos no total, nunca menos que
+# MIN_REAMOSTRAS); o número usado vai junto em cada resultado e a saída impressa
+# avisa quando ficou abaixo do pedido.
+NIVEL_CONFIANCA     = 0.95
+SEMENTE_BOOTSTRAP   = 0
+MIN_REAMOSTRAS      = 200
+BLOCO_BOOTSTRAP     = 1 << 22
+ORCAMENTO_BOOTSTRAP = 20_000_000
+
+IntervaloConfianca = namedtuple('IntervaloConfianca', 'estimativa inferior superior reamostras')
+Comparacao = namedtuple('Comparacao', 'diferenca inferior superior p pareado tamanhos reamostras')
+
+
+def _rng_bootstrap(*chave):
+    """Gerador com semente fixa: o mesmo arquivo dá sempre os mesmos intervalos."""
+    return np.random.default_rng([SEMENTE_BOOTSTRAP, *chave])
+
+
+def _reamostras_efetivas(elementos, reamostras=None):
+    reamostras = REAMOSTRAS if reamostras is None else reamostras
+    limite = ORCAMENTO_BOOTSTRAP // max(elementos, 1)
+    return max(min(reamostras, limite), min(reamostras, MIN_REAMOSTRAS))
+
+
+def _nota_reamostras(usadas):
+    """Aviso para a saída quando o orçamento reduziu as reamostras pedidas."""
+    if not usadas or usadas >= REAMOSTRAS:
+        return ''
+    return f'  ({usadas:,} de {REAMOSTRAS:,} reamostras: ORCAMENTO_BOOTSTRAP)'.replace(',', '.')
+
+
+def _blocos(reamostras, elementos):
+    """Fatias [ini, fim) de reamostras com até BLOCO_BOOTSTRAP elementos cada."""
+    passo = max(1, BLOCO_BOOTSTRAP // max(elementos, 1))
+    for ini in range(0, reamostras, passo):
+        yield ini, min(ini + passo, reamostras)
+
+
+def _intervalo(estimativa, dist, nivel=NIVEL_CONFIANCA):
+    """IC percentil a partir de uma distribuição bootstrap."""
+    if not len(dist):
+        return IntervaloConfianca(math.nan, math.nan, math.nan, 0)
+    cauda = (1 - nivel) / 2 * 100
+    inf, sup = np.percentile(dist, (cauda, 100 - cauda), axis=-1)
+    return IntervaloConfianca(estimativa, inf, sup, dist.shape[-1])
+
+
+def distribuicao_bootstrap(valores, reamostras=None, rng=None):
+    """Média de cada reamostra: array (..., reamostras).
+
+    `valores` pode ter várias linhas de mesmo tamanho (k, n): todas usam a
+    mesma matriz de índices, então k células custam um único sorteio.
+    """
+    valores = np.asarray(valores, dtype=np.float64)
+    n = valores.shape[-1]
+    rng = rng if rng is not None else _rng_bootstrap()
+    reamostras = _reamostras_efetivas(valores.size, reamostras)
+    saida = np.empty(valores.shape[:-1] + (reamostras,))
+    for ini, fim in _blocos(reamostras, valores.size):
+        indices = rng.integers(0, n, size=(fim - ini, n), dtype=np.int32)
+        saida[..., ini:fim] = valores[..., indices].mean(axis=-1)
+    return saida
+
+
+def _resumo(valores, ic, quantis):
+    p10, p25, p50, p75, p90 = quantis
+    return {'registros': len(valores), 'media': float(ic.estimativa),
+            'media_inf': float(ic.inferior), 'media_sup': float(ic.superior),
+            'mediana': float(p50), 'p10': float(p10), 'p25': float(p25),
+            'p75': float(p75), 'p90': float(p90), 'reamostras': ic.reamostras}
+
+
+def resumir(dados, campo):
+    """Média com IC bootstrap, mediana e quantis 10/25/75/90 de um campo."""
+    col = np.asarray(dados[campo], dtype=np.float64)
+    col = col[~np.isnan(col)]
+    if not len(col):
+        return None
+    return _resumo(col, dados.intervalo(campo), np.percentile(col, (10, 25, 50, 75, 90)))
+
+
+def resumir_por_celula(dados, campo, reamostras=None):
+    """`resumir` para cada célula (n, m), em ordem de n e m.
+
+    Células com o mesmo número de linhas viram uma matriz (células × linhas)
+    e compartilham o mesmo sorteio de índices. O orçamento de reamostras vale
+    para o campo inteiro, não para cada célula.
+    """
+    col = np.asarray(dados[campo], dtype=np.float64)
+    ok = ~np.isnan(col)
+    n, m, col = dados['n'][ok], dados['m'][ok], col[ok]
+    if not len(col):
+        return []
+    celulas, pos = np.unique(np.stack([n, m], axis=1), axis=0, return_inverse=True)
+    pos = pos.ravel()
+    col = col[np.argsort(pos, kind='stable')]
+    tamanhos = np.bincount(pos, minlength=len(celulas))
+    inicios = np.r_[0, np.cumsum(tamanhos)[:-1]]
+
+    saida = [None] * len(celulas)
+    rng = _rng_bootstrap()
+    reamostras = _reamostras_efetivas(len(col), reamostras)
+    for tam in np.unique(tamanhos):
+        sel = np.flatnonzero(tamanhos == tam)
+        matriz = col[inicios[sel, None] + np.arange(tam)]
+        ics = _intervalo(matriz.mean(axis=1), distribuicao_bootstrap(matriz, reamostras, rng))
+        quantis = np.percentile(matriz, (10, 25, 50, 75, 90), axis=1)
+        for i, c in enumerate(sel):
+            ic = IntervaloConfianca(*(v[i] for v in ics[:3]), ics.reamostras)
+            saida[c] = {'n': int(celulas[c, 0]), 'm': int(celulas[c, 1]),
+                        **_resumo(matriz[i], ic, quantis[:, i])}
+    return saida
+
+
+def _valor_p(extremos, reamostras):
+    return (extremos + 1) / (reamostras + 1)
+
+
+def _teste_pareado(d, reamostras=None):
+    """IC bootstrap da média das diferenças e teste de permutação por troca de sinal."""
+    rng = _rng_bootstrap()
+    obs = d.mean()
+    dist = distribuicao_bootstrap(d, reamostras, rng)
+    extremos = 0
+    for ini, fim in _blocos(dist.shape[-1], len(d)):
+        sinais = rng.integers(0, 2, size=(fim - ini, len(d))) * 2 - 1
+        extremos += int(np.count_nonzero(np.abs((sinais * d).mean(axis=1)) >= abs(obs) - 1e-12))
+    return obs, dist, _valor_p(extremos, dist.shape[-1])
+
+
+def comparar(grupos, campo, nivel=NIVEL_CONFIANCA):
+    """Diferença de `campo` entre cada par de heurísticas, com IC e valor-p.
+
+    Com a coluna `instancia` (controle.py --pareado) nas duas heurísticas, o
+    teste é pareado sobre as instâncias comuns (troca de sinal). Senão, as
+    amostras são independentes: a diferença das médias bootstrap em cache de
+    cada grupo dá o IC, e o valor-p vem dessa distribuição centrada em zero.
+    Retorna {(a, b): Comparacao} com a − b.
+    """
+    saida = {}
+    nomes = list(grupos)
+    for i, a in enumerate(nomes):
+        for b in nomes[i + 1:]:
+            da, db = grupos[a], grupos[b]
+            if 'instancia' in da.colunas and 'instancia' in db.colunas:
+                ids_a, va = _media_por_instancia(da, campo)
+                ids_b, vb = _media_por_instancia(db, campo)
+                _, ia, ib = np.intersect1d(ids_a, ids_b, return_indices=True)
+                if len(ia) < 2:
+                    continue
+                obs, dist, p = _teste_pareado(va[ia] - vb[ib])
+                pareado, tamanhos = True, (len(ia),)
+            else:
+                dist_a, dist_b = da.bootstrap(campo), db.bootstrap(campo)
+                r = min(len(dist_a), len(dist_b))
+                if min(len(da), len(db)) < 2 or not r:
+                    continue
+                obs = da.media(campo) - db.media(campo)
+                dist = dist_a[:r] - dist_b[:r]
+                extremos = int(np.count_nonzero(np.abs(dist - obs) >= abs(obs) - 1e-12))
+                p = _valor_p(extremos, r)
+                pareado, tamanhos = False, (len(da), len(db))
+            ic = _intervalo(float(obs), dist, nivel)
+            saida[(a, b)] = Comparacao(ic.estimativa, float(ic.inferior), float(ic.superior),
+                                       p, pareado, tamanhos, ic.reamostras)
+    return saida
+
+
+# ── Escalonamento empírico (ajuste log-log) ─────────────────────────────────
+# log y = c + a·log n + b·log m por mínimos quadrados. Em Controle n = m^r, então
+# com um só m ou um só r as colunas de n e m são colineares e só o expoente de n
+# é ajustado. Os ICs vêm de bootstrap por linhas: as reamostras de cada bloco são
+# resolvidas juntas pelas equações normais ponderadas (reamostras × k × k).
+CAMPOS_ESCALONAMENTO = ('tempo', 'iteracoes')
+# n da previsão impressa no resumo (--prever)
+N_PREVISAO = 100_000
+
+Ajuste = namedtuple('Ajuste', 'termos coef inferior superior r2 registros distribuicao')
+
+
+def _matriz_escalonamento(n, m, termos=('intercepto', 'n', 'm')):
+    colunas = {'intercepto': np.ones(np.shape(n)), 'n': np.log(n), 'm': np.log(m)}
+    return np.stack([colunas[t] for t in termos], axis=-1)
+
+
+def ajustar_escalonamento(dados, campo, reamostras=None, nivel=NIVEL_CONFIANCA):
+    """Expoentes de n e m para `campo` (linhas com valor ≤ 0 ficam de fora)."""
+    y = np.asarray(dados[campo], dtype=np.float64)
+    ok = y > 0
+    if np.count_nonzero(ok) < 3 or len(np.unique(dados['n'][ok])) < 2:
+        return None
+    n, m, ly = dados['n'][ok], dados['m'][ok], np.log(y[ok])
+    termos = ('intercepto', 'n', 'm')
+    X = _matriz_escalonamento(n, m, termos)
+    if np.linalg.matrix_rank(X) < 3:
+        termos = termos[:2]
+        X = X[:, :2]
+
+    coef = np.linalg.lstsq(X, ly, rcond=None)[0]
+    residuo = ly - X @ coef
+    total = ly - ly.mean()
+    r2 = 1 - (residuo @ residuo) / (total @ total) if total @ total > 0 else 1.0
+
+    # Cada reamostra vira um vetor de contagens w; X'WX e X'Wy saem de um único
+    # produto matricial (reamostras × linhas) @ (linhas × k²) por bloco.
+    linhas, k = X.shape
+    externos = (X[:, :, None] * X[:, None, :]).reshape(linhas, k * k)
+    Xy = X * ly[:, None]
+    rng = _rng_bootstrap(linhas, k)
+    b = _reamostras_efetivas(linhas, reamostras)
+    dist = np.empty((b, k))
+    for ini, fim in _blocos(b, linhas):
+        indices = rng.integers(0, linhas, size=(fim - ini, linhas))
+        indices += np.arange(fim - ini)[:, None] * linhas
+        pesos = np.bincount(indices.ravel(), minlength=(fim - ini) * linhas)
+        pesos = pesos.reshape(fim - ini, linhas).astype(np.float64)
+        XtX = (pesos @ externos).reshape(-1, k, k)
+        Xty = pesos @ Xy
+        # Reamostras degeneradas (um só n sorteado) têm X'WX singular: det ≈ 0
+        # diante do produto da diagonal (Hadamard). Ficam NaN e fora do IC;
+        # só as demais vão para o solve
+        diagonal = np.prod(np.diagonal(XtX, axis1=1, axis2=2), axis=1)
+        regulares = np.linalg.det(XtX) > 1e-9 * diagonal
+        dist[ini:fim] = np.nan
+        dist[ini:fim][regulares] = np.linalg.solve(XtX[regulares],
+                                                   Xty[regulares][..., None])[..., 0]
+    dist = dist[~np.isnan(dist[:, 0])]
+    ic = _intervalo(coef, dist.T, nivel)
+    return Ajuste(termos, coef, ic.inferior, ic.superior, float(r2), linhas, dist)
+
+
+def prever(ajuste, n, m, nivel=NIVEL_CONFIANCA):
+    """Valor previsto pelo ajuste em (n, m), com IC: arrays (estimativa, inf, sup)."""
+    X = _matriz_escalonamento(np.asarray(n, dtype=np.float64),
+                              np.asarray(m, dtype=np.float64), ajuste.termos)
+    estimativa = np.exp(X @ ajuste.coef)
+    ic = _intervalo(estimativa, np.exp(ajuste.distribuicao @ X.T).T, nivel)
+    return estimativa, ic.inferior, ic.superior
+
+
+def _r_por_linha(dados):
+    """r = log_m n de cada linha, com 1 casa (NaN onde m = 1)."""
+    n, m = dados['n'].astype(np.float64), dados['m'].astype(np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(m > 1, np.round(np.log(n) / np.log(m), 1), np.nan)
+
+
+def razoes_r(dados, maximo=3):
+    """Valores de r = log_m n presentes nos dados, dos mais frequentes."""
+    r = _r_por_linha(dados)
+    valores, contagem = np.unique(r[~np.isnan(r)], return_counts=True)
+    return [float(v) for v in valores[np.argsort(-contagem, kind='stable')][:maximo]]
+
+
+def _descrever_ajuste(ajuste):
+    partes = [f'{t}^{c:.3f} [{i:.3f}, {s:.3f}]' for t, c, i, s in
+              zip(ajuste.termos[1:], ajuste.coef[1:], ajuste.inferior[1:], ajuste.superior[1:])]
+    return '  '.join(partes) + f'  R² {ajuste.r2:.3f}'
 
 
 def cor(h):
@@ -179,32 +768,84 @@ def marcador(h):
 
 
 # ── Helpers de plot ──────────────────────────────────────────────────────────
-def barra_comparativa(ax, grupos, campo, titulo, ylabel, log=False, fmt=None):
+def carregar_matplotlib():
+    """Importa pyplot e gridspec e aplica ESTILO, uma única vez por processo."""
+    global plt, gridspec
+    if plt is None:
+        import matplotlib
+        matplotlib.rcParams.update(ESTILO)
+        import matplotlib.pyplot
+        import matplotlib.gridspec
+        plt, gridspec = matplotlib.pyplot, matplotlib.gridspec
+
+
+def figura(funcao):
+    """Decorador das figuras: carrega matplotlib antes de desenhar."""
+    @functools.wraps(funcao)
+    def desenhar(*args, **kwargs):
+        carregar_matplotlib()
+        return funcao(*args, **kwargs)
+    return desenhar
+
+
+def _limites_y(ax):
+    """Limites do eixo y calculados a partir dos dados, sem renderizar a figura.
+
+    autoscale_view() aplica margens e escala (inclusive log) exatamente como o
+    draw faria, mas só atualiza os limites — nenhum pixel é rasterizado.
+    """
+    ax.autoscale_view()
+    return ax.get_ylim()
+
+
+def _rotular_barras_log(ax, grupos_barras, fontsize):
+    """Rótulos dentro do topo de barras em eixo log (makespan inicial/final)."""
+    y_min, _ = _limites_y(ax)
+    log_min = math.log10(max(y_min, 1e-9))
+    for bars, valores in grupos_barras:
+        for bar, val in zip(bars, valores):
+            log_h   = math.log10(max(bar.get_height(), 1e-9))
+            log_pos = log_h - (log_h - log_min) * 0.12
+            y_pos   = max(10 ** log_pos, y_min * 1.2)
+            ax.text(bar.get_x() + bar.get_width() / 2, y_pos,
+                    f'{int(val):,}'.replace(',', '.'),
+                    ha='center', va='top', fontsize=fontsize,
+                    color='#0d1117', fontweight='bold')
+
+
+def barra_comparativa(ax, grupos, campo, titulo, ylabel, log=False, fmt=None, ic=True):
+    """Barras das médias; com `ic`, barras de erro do IC bootstrap de 95%."""
     heuristicas = list(grupos.keys())
     medias = [media(grupos[h], campo) for h in heuristicas]
     cores  = [cor(h) for h in heuristicas]
     labels = [h.replace(' ', '\n') for h in heuristicas]
 
-    bars = ax.bar(labels, medias, color=cores, edgecolor='none', width=0.5, zorder=3)
+    yerr, limites = None, [(v, v) for v in medias]
+    if ic:
+        limites = [(i.inferior, i.superior) for i in
+                   (grupos[h].intervalo(campo) for h in heuristicas)]
+        yerr = np.maximum([[v - inf for v, (inf, _) in zip(medias, limites)],
+                           [sup - v for v, (_, sup) in zip(medias, limites)]], 0)
+
+    bars = ax.bar(labels, medias, color=cores, edgecolor='none', width=0.5, zorder=3,
+                  yerr=yerr, capsize=4,
+                  error_kw=dict(ecolor='#e6edf3', elinewidth=1.2, capthick=1.2, zorder=4))
     ax.set_title(titulo)
     ax.set_ylabel(ylabel)
     ax.grid(axis='y', zorder=0)
     if log:
         ax.set_yscale('log')
 
-    # Renderiza primeiro para obter os limites reais do eixo
-    ax.figure.canvas.draw()
-    y_min, y_max = ax.get_ylim()
+    y_min, y_max = _limites_y(ax)
 
-    import math as _math
-    for bar, val in zip(bars, medias):
+    for bar, val, (ic_inf, ic_sup) in zip(bars, medias, limites):
         label = fmt(val) if fmt else f'{val:.2f}'
         h = bar.get_height()
 
         if log:
-            log_min = _math.log10(max(y_min, 1e-9))
-            log_max = _math.log10(y_max)
-            log_h   = _math.log10(max(h, 1e-9))
+            log_min = math.log10(max(y_min, 1e-9))
+            log_max = math.log10(y_max)
+            log_h   = math.log10(max(h, 1e-9))
             frac    = (log_h - log_min) / (log_max - log_min)  # 0..1
         else:
             frac = (h - y_min) / (y_max - y_min)
@@ -222,27 +863,104 @@ def barra_comparativa(ax, grupos, campo, titulo, ylabel, log=False, fmt=None):
                 y_pos = max(y_pos, y_min * 1.2)
             else:
                 y_pos = h * 0.92  # 92% da altura
+            # Fundo da cor da barra: a barra de erro passa por trás do rótulo
             ax.text(bar.get_x() + bar.get_width() / 2, y_pos,
                     label, ha='center', va='top',
-                    fontsize=9, color='#0d1117', fontweight='bold')
+                    fontsize=9, color='#0d1117', fontweight='bold', zorder=5,
+                    bbox=dict(facecolor=bar.get_facecolor(), edgecolor='none', pad=1))
         else:
             # Fora da barra, logo acima — garante que não ultrapasse y_max
             if log:
-                y_pos = min(h * 1.5, y_max * 0.85)
+                y_pos = min(max(h, ic_sup) * 1.5, y_max * 0.85)
             else:
-                y_pos = h + (y_max - y_min) * 0.02
+                y_pos = max(h, ic_sup) + (y_max - y_min) * 0.02
             ax.text(bar.get_x() + bar.get_width() / 2, y_pos,
                     label, ha='center', va='bottom',
                     fontsize=9, color='#e6edf3', fontweight='bold')
     return ax
 
 
+def _agregar(grupos):
+    """True quando há pontos demais para desenhar um marcador por registro."""
+    return sum(len(v) for v in grupos.values()) > LIMIAR_PONTOS
+
+
+def _faixas(x, y, max_faixas=200):
+    """Mediana e percentis 10/90 de y por valor de x.
+
+    Com mais de `max_faixas` valores distintos de x, agrupa x em intervalos
+    iguais. O custo depende só do número de faixas, não do número de pontos
+    desenhados.
+    """
+    ordem = np.argsort(x, kind='stable')
+    x, y  = x[ordem], y[ordem]
+    valores = np.unique(x)
+    if len(valores) > max_faixas:
+        bordas = np.linspace(x[0], x[-1], max_faixas + 1)
+        rotulo = np.clip(np.searchsorted(bordas, x, side='right') - 1, 0, max_faixas - 1)
+    else:
+        rotulo = np.searchsorted(valores, x)
+    inicios = np.flatnonzero(np.r_[True, rotulo[1:] != rotulo[:-1]])
+    partes_x = np.split(x, inicios[1:])
+    partes_y = np.split(y, inicios[1:])
+    centros = np.array([np.median(px) for px in partes_x])
+    p10, p50, p90 = np.array([np.percentile(py, (10, 50, 90)) for py in partes_y]).T
+    return centros, p10, p50, p90
+
+
+def _plot_faixas(ax, h, x, y, linewidth=1.8):
+    xs, p10, p50, p90 = _faixas(x, y)
+    ax.fill_between(xs, p10, p90, color=cor(h), alpha=0.25, linewidth=0, zorder=2)
+    ax.plot(xs, p50, color=cor(h), label=f'{h} (mediana, p10–p90)',
+            linewidth=linewidth, zorder=3)
+
+
+def _linha_por_replicacao(ax, grupos, campo, linewidth, markersize):
+    agregar = _agregar(grupos)
+    for h, dados in grupos.items():
+        if agregar:
+            _plot_faixas(ax, h, dados['rep'], dados[campo], linewidth=linewidth)
+            continue
+        dados_ord = dados.ordenado('rep')
+        ax.plot(dados_ord['rep'], dados_ord[campo], color=cor(h), marker=marcador(h),
+                label=h, linewidth=linewidth, markersize=markersize, zorder=3)
+
+
+def _plot_ajuste(ax, grupos, campo):
+    """Curvas do ajuste log-log (uma por r = log_m n) e expoentes no canto."""
+    estilos = ('--', ':', '-.')
+    linha = 0
+    for h, dados in grupos.items():
+        ajuste = dados.ajuste(campo)
+        if ajuste is None:
+            continue
+        razoes = razoes_r(dados) if 'm' in ajuste.termos else [None]
+        r_linhas = _r_por_linha(dados)
+        for r, estilo in zip(razoes, estilos):
+            # Cada curva cobre só a faixa de n observada com aquele r
+            ns = dados['n'][r_linhas == r] if r else dados['n']
+            xs = np.geomspace(ns.min(), ns.max(), 100)
+            ms = xs ** (1 / r) if r else np.full_like(xs, np.median(dados['m']))
+            ax.plot(xs, prever(ajuste, xs, ms)[0], color=cor(h), linestyle=estilo,
+                    linewidth=1.2, alpha=0.8, zorder=2)
+        expoentes = '  '.join(f'{t}^{c:.2f}' for t, c in zip(ajuste.termos[1:], ajuste.coef[1:]))
+        ax.text(0.98, 0.03 + 0.06 * linha, expoentes, transform=ax.transAxes,
+                ha='right', va='bottom', fontsize=7, color=cor(h), zorder=5)
+        linha += 1
+
+
 def scatter_vs_n(ax, grupos, campo, titulo, ylabel, log=False):
+    agregar = _agregar(grupos)
     for h, dados in grupos.items():
-        xs = [d['n'] for d in dados]
-        ys = [d[campo] for d in dados]
+        if agregar:
+            _plot_faixas(ax, h, dados['n'], dados[campo])
+            continue
+        xs = dados['n']
+        ys = dados[campo]
         ax.scatter(xs, ys, color=cor(h), marker=marcador(h),
                    label=h, s=60, zorder=3, alpha=0.9)
+    if campo in CAMPOS_ESCALONAMENTO:
+        _plot_ajuste(ax, grupos, campo)
     ax.set_title(titulo)
     ax.set_xlabel('n (número de tarefas)')
     ax.set_ylabel(ylabel)
@@ -253,6 +971,7 @@ def scatter_vs_n(ax, grupos, campo, titulo, ylabel, log=False):
 
 
 # ── Figura 1: Visão Geral (2×3) ──────────────────────────────────────────────
+@figura
 def fig_visao_geral(registros, grupos, destino):
     fig = plt.figure(figsize=(18, 11))
     fig.suptitle('Comparação de Heurísticas — Visão Geral',
@@ -280,12 +999,7 @@ def fig_visao_geral(registros, grupos, destino):
 
     # 4. Makespan final por replicação (linha)
     ax4 = fig.add_subplot(gs[1, :2])
-    for h, dados in grupos.items():
-        dados_ord = sorted(dados, key=lambda d: d['rep'])
-        xs = [d['rep'] for d in dados_ord]
-        ys = [d['mk_final'] for d in dados_ord]
-        ax4.plot(xs, ys, color=cor(h), marker=marcador(h),
-                 label=h, linewidth=1.8, markersize=6, zorder=3)
+    _linha_por_replicacao(ax4, grupos, 'mk_final', linewidth=1.8, markersize=6)
     ax4.set_title('Makespan Final por Replicação')
     ax4.set_xlabel('Replicação')
     ax4.set_ylabel('Makespan Final (log)')
@@ -303,6 +1017,7 @@ def fig_visao_geral(registros, grupos, destino):
 
 
 # ── Figura 2: Tempo de Execução ──────────────────────────────────────────────
+@figura
 def fig_tempo(registros, grupos, destino):
     fig, axes = plt.subplots(1, 2, figsize=(14, 6))
     fig.suptitle('Análise de Tempo de Execução', fontsize=14, fontweight='bold')
@@ -310,14 +1025,26 @@ def fig_tempo(registros, grupos, destino):
 
     # Scatter: tempo por experimento
     ax = axes[0]
-    for i, (h, dados) in enumerate(grupos.items()):
-        xs = [i + np.random.uniform(-0.15, 0.15) for _ in dados]  # jitter
-        ys = [d['tempo'] for d in dados]
-        ax.scatter(xs, ys, color=cor(h), marker=marcador(h), s=70, alpha=0.85, zorder=3)
+    if _agregar(grupos):
+        # Muitos pontos: boxplot sem outliers no lugar da nuvem com jitter
+        bp = ax.boxplot([grupos[h]['tempo'] for h in grupos], positions=range(len(grupos)),
+                        patch_artist=True, showfliers=False,
+                        medianprops=dict(color='#fff', linewidth=2),
+                        whiskerprops=dict(color='#555'), capprops=dict(color='#555'))
+        for patch, h in zip(bp['boxes'], grupos):
+            patch.set_facecolor(cor(h))
+            patch.set_alpha(0.7)
+        titulo = 'Distribuição de Tempo (p25–p75, bigodes 1,5·IQR)'
+    else:
+        for i, (h, dados) in enumerate(grupos.items()):
+            xs = i + np.random.uniform(-0.15, 0.15, len(dados))  # jitter
+            ys = dados['tempo']
+            ax.scatter(xs, ys, color=cor(h), marker=marcador(h), s=70, alpha=0.85, zorder=3)
+        titulo = 'Distribuição de Tempo (cada ponto = 1 replicação)'
     ax.set_xticks(range(len(grupos)))
     ax.set_xticklabels([h.replace(' ', '\n') for h in grupos], fontsize=9)
     ax.set_yscale('log')
-    ax.set_title('Distribuição de Tempo (cada ponto = 1 replicação)')
+    ax.set_title(titulo)
     ax.set_ylabel('Tempo (ms, log)')
     ax.grid(zorder=0)
 
@@ -331,6 +1058,7 @@ def fig_tempo(registros, grupos, destino):
 
 
 # ── Figura 3: Qualidade — Makespan ───────────────────────────────────────────
+@figura
 def fig_makespan(registros, grupos, destino):
     fig, axes = plt.subplots(1, 3, figsize=(18, 6))
     fig.suptitle('Análise de Qualidade — Makespan', fontsize=14, fontweight='bold')
@@ -355,33 +1083,7 @@ def fig_makespan(registros, grupos, destino):
     ax.grid(axis='y', zorder=0)
     
     # Adiciona rótulos nas barras
-    ax.figure.canvas.draw()
-    y_min, y_max = ax.get_ylim()
-    import math as _math
-    
-    # Rótulos para barras iniciais (laranjas)
-    for bar, val in zip(bars_i, medias_i):
-        h = bar.get_height()
-        log_min = _math.log10(max(y_min, 1e-9))
-        log_max = _math.log10(max(y_max, 1e-9))
-        log_h   = _math.log10(max(h, 1e-9))
-        log_pos = log_h - (log_h - log_min) * 0.12
-        y_pos = max(10 ** log_pos, y_min * 1.2)
-        ax.text(bar.get_x() + bar.get_width() / 2, y_pos,
-                f'{int(val):,}'.replace(',', '.'),
-                ha='center', va='top', fontsize=8, 
-                color='#0d1117', fontweight='bold')
-    
-    # Rótulos para barras finais (coloridas)
-    for bar, val in zip(bars_f, medias_f):
-        h = bar.get_height()
-        log_h   = _math.log10(max(h, 1e-9))
-        log_pos = log_h - (log_h - log_min) * 0.12
-        y_pos = max(10 ** log_pos, y_min * 1.2)
-        ax.text(bar.get_x() + bar.get_width() / 2, y_pos,
-                f'{int(val):,}'.replace(',', '.'),
-                ha='center', va='top', fontsize=8,
-                color='#0d1117', fontweight='bold')
+    _rotular_barras_log(ax, [(bars_i, medias_i), (bars_f, medias_f)], fontsize=8)
 
     # Scatter: makespan final vs n
     scatter_vs_n(axes[1], grupos, 'mk_final',
@@ -390,7 +1092,7 @@ def fig_makespan(registros, grupos, destino):
 
     # Boxplot de redução %
     ax3 = axes[2]
-    dados_box = [[ d['reducao_pct'] for d in grupos[h] ] for h in heuristicas]
+    dados_box = [grupos[h]['reducao_pct'] for h in heuristicas]
     bp = ax3.boxplot(dados_box, patch_artist=True,
                      medianprops=dict(color='#fff', linewidth=2),
                      whiskerprops=dict(color='#555'),
@@ -410,6 +1112,7 @@ def fig_makespan(registros, grupos, destino):
 
 
 # ── Figura 4: Iterações ───────────────────────────────────────────────────────
+@figura
 def fig_iteracoes(registros, grupos, destino):
     fig, axes = plt.subplots(1, 2, figsize=(14, 6))
     fig.suptitle('Análise de Iterações', fontsize=14, fontweight='bold')
@@ -418,16 +1121,20 @@ def fig_iteracoes(registros, grupos, destino):
     # Barras agrupadas por replicação
     ax = axes[0]
     heuristicas = list(grupos.keys())
-    n_reps = max(len(v) for v in grupos.values())
-    x = np.arange(n_reps)
-    w = 0.28
-    for i, h in enumerate(heuristicas):
-        dados_ord = sorted(grupos[h], key=lambda d: d['rep'])
-        ys = [d['iteracoes'] for d in dados_ord]
-        ax.bar(x[:len(ys)] + i*w - w, ys, w,
-               color=cor(h), alpha=0.85, label=h, zorder=3)
-    ax.set_xticks(x)
-    ax.set_xticklabels([f'Rep {i}' for i in range(n_reps)], fontsize=7, rotation=45)
+    if _agregar(grupos):
+        # Uma barra por replicação seria ilegível: faixas de percentis
+        _linha_por_replicacao(ax, grupos, 'iteracoes', linewidth=1.8, markersize=0)
+        ax.set_xlabel('Replicação')
+    else:
+        n_reps = max(len(v) for v in grupos.values())
+        x = np.arange(n_reps)
+        w = 0.28
+        for i, h in enumerate(heuristicas):
+            ys = grupos[h].ordenado('rep')['iteracoes']
+            ax.bar(x[:len(ys)] + i*w - w, ys, w,
+                   color=cor(h), alpha=0.85, label=h, zorder=3)
+        ax.set_xticks(x)
+        ax.set_xticklabels([f'Rep {i}' for i in range(n_reps)], fontsize=7, rotation=45)
     ax.set_yscale('log')
     ax.set_title('Iterações por Replicação')
     ax.set_ylabel('Iterações (log)')
@@ -444,6 +1151,7 @@ def fig_iteracoes(registros, grupos, destino):
 
 
 # ── Figura 5: Painel completo (para apresentação) ────────────────────────────
+@figura
 def fig_painel(registros, grupos, destino):
     fig = plt.figure(figsize=(20, 14))
     fig.suptitle('Painel Geral — Heurísticas para Distribuição de Tarefas',
@@ -484,31 +1192,7 @@ def fig_painel(registros, grupos, destino):
     ax_mk.grid(axis='y', zorder=0)
     
     # Adiciona rótulos nas barras
-    ax_mk.figure.canvas.draw()
-    y_min, y_max = ax_mk.get_ylim()
-    import math as _math
-    log_min = _math.log10(max(y_min, 1e-9))
-    log_max = _math.log10(max(y_max, 1e-9))
-    
-    for bar, val in zip(bars_i, medias_i):
-        h = bar.get_height()
-        log_h = _math.log10(max(h, 1e-9))
-        log_pos = log_h - (log_h - log_min) * 0.12
-        y_pos = max(10 ** log_pos, y_min * 1.2)
-        ax_mk.text(bar.get_x() + bar.get_width() / 2, y_pos,
-                   f'{int(val):,}'.replace(',', '.'),
-                   ha='center', va='top', fontsize=7,
-                   color='#0d1117', fontweight='bold')
-    
-    for bar, val in zip(bars_f, medias_f):
-        h = bar.get_height()
-        log_h = _math.log10(max(h, 1e-9))
-        log_pos = log_h - (log_h - log_min) * 0.12
-        y_pos = max(10 ** log_pos, y_min * 1.2)
-        ax_mk.text(bar.get_x() + bar.get_width() / 2, y_pos,
-                   f'{int(val):,}'.replace(',', '.'),
-                   ha='center', va='top', fontsize=7,
-                   color='#0d1117', fontweight='bold')
+    _rotular_barras_log(ax_mk, [(bars_i, medias_i), (bars_f, medias_f)], fontsize=7)
     ax_mk.grid(axis='y', zorder=0)
 
     # Linha 2: scatter tempo×n e iterações×n
@@ -522,12 +1206,7 @@ def fig_painel(registros, grupos, destino):
 
     # Linha 3: makespan final por replicação + boxplot redução
     ax_line = fig.add_subplot(gs[2, :3])
-    for h, dados in grupos.items():
-        dados_ord = sorted(dados, key=lambda d: d['rep'])
-        xs = [d['rep'] for d in dados_ord]
-        ys = [d['mk_final'] for d in dados_ord]
-        ax_line.plot(xs, ys, color=cor(h), marker=marcador(h),
-                     label=h, linewidth=2, markersize=7, zorder=3)
+    _linha_por_replicacao(ax_line, grupos, 'mk_final', linewidth=2, markersize=7)
     ax_line.set_title('Makespan Final por Replicação')
     ax_line.set_xlabel('Replicação')
     ax_line.set_ylabel('Makespan Final (log)')
@@ -536,7 +1215,7 @@ def fig_painel(registros, grupos, destino):
     ax_line.grid(zorder=0)
 
     ax_box = fig.add_subplot(gs[2, 3])
-    dados_box = [[d['reducao_pct'] for d in grupos[h]] for h in heuristicas]
+    dados_box = [grupos[h]['reducao_pct'] for h in heuristicas]
     bp = ax_box.boxplot(dados_box, patch_artist=True,
                         medianprops=dict(color='#fff', linewidth=2),
                         whiskerprops=dict(color='#555'), capprops=dict(color='#555'),
@@ -553,6 +1232,259 @@ def fig_painel(registros, grupos, destino):
     _salvar(fig, destino, 'fig5_painel_completo.png')
 
 
+# ── Figura 6: Convergência (makespan × tempo) ────────────────────────────────
+# Acima deste número de curvas por heurística, só mediana e faixa p10–p90
+MAX_CURVAS = 30
+
+
+def _curvas_convergencia(traj):
+    """{heurística: [(tempos, iterações, makespan relativo), ...]} das trajetórias."""
+    categorias = [str(c) for c in traj['categorias']]
+    inicio = traj['inicio']
+    curvas = defaultdict(list)
+    for k in range(len(inicio) - 1):
+        fatia = slice(inicio[k], inicio[k + 1])
+        mk = traj['makespan'][fatia].astype(np.float64)
+        if len(mk) < 2 or mk[0] <= 0:
+            continue
+        t = traj['tempo'][fatia].copy()
+        # A amostra inicial é t = 0: põe na metade da seguinte para caber no eixo log
+        t[0] = t[1] / 2 if t[1] > 0 else 1e-3
+        curvas[categorias[traj['heuristica'][k]]].append(
+            (t, traj['iteracao'][fatia] + 1, mk / mk[0]))
+    return curvas
+
+
+def _faixa_convergencia(ax, h, curvas, eixo):
+    """Mediana e p10–p90 das curvas (em degrau) numa grade log comum do eixo x."""
+    xs = [c[eixo] for c in curvas]
+    grade = np.geomspace(min(x[0] for x in xs), max(x[-1] for x in xs), 200)
+    # Antes da primeira amostra vale o valor inicial; depois da última, o final
+    valores = np.array([c[2][np.clip(np.searchsorted(x, grade, side='right') - 1, 0, None)]
+                        for x, c in zip(xs, curvas)])
+    p10, p50, p90 = np.percentile(valores, (10, 50, 90), axis=0)
+    ax.fill_between(grade, p10, p90, step='post', color=cor(h), alpha=0.2, linewidth=0)
+    ax.step(grade, p50, where='post', color=cor(h), linewidth=2, label=h, zorder=3)
+
+
+@figura
+def fig_convergencia(registros, grupos, destino):
+    traj = getattr(registros, 'trajetorias', None)
+    if traj is None:
+        print('  --  fig6: sem trajetórias (gere com controle.py --trajetoria)')
+        return
+    curvas = _curvas_convergencia(traj)
+
+    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    fig.suptitle('Convergência — Makespan ao Longo da Busca',
+                 fontsize=14, fontweight='bold')
+    fig.patch.set_facecolor('#0d1117')
+
+    for ax, eixo, xlabel in ((axes[0], 0, 'Tempo (ms, log)'),
+                             (axes[1], 1, 'Iteração (log)')):
+        for h, lista in curvas.items():
+            if len(lista) <= MAX_CURVAS:
+                for c in lista:
+                    ax.step(c[eixo], c[2], where='post', color=cor(h),
+                            linewidth=0.8, alpha=0.35, zorder=2)
+            _faixa_convergencia(ax, h, lista, eixo)
+        ax.set_xscale('log')
+        ax.set_yscale('log')
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel('Makespan / makespan inicial (log)')
+        ax.legend(fontsize=8)
+        ax.grid(zorder=0)
+    axes[0].set_title('Makespan × Tempo (mediana e p10–p90)')
+    axes[1].set_title('Makespan × Iterações (mediana e p10–p90)')
+
+    plt.tight_layout()
+    _salvar(fig, destino, 'fig6_convergencia.png')
+
+
+# ── Figura 7: Perfil por fase da busca ───────────────────────────────────────
+CORES_FASES = {
+    'vizinho':  '#fbbf24',   # âmbar
+    'troca':    '#fb923c',   # laranja
+    'elegivel': '#c084fc',   # lilás
+    'mover':    '#f472b6',   # rosa
+    'indice':   '#818cf8',   # índigo
+    'redefine': '#2dd4bf',   # turquesa
+    'outros':   '#6e7681',   # cinza
+}
+ROTULOS_FASES = {
+    'vizinho':  'Escolha do vizinho',
+    'troca':    'Busca de troca',
+    'elegivel': 'Elegibilidade',
+    'mover':    'Movimento',
+    'indice':   'Atualização do IndiceMakespan',
+    'redefine': 'RedefineMaquinaMakespan',
+    'outros':   'Outros (laço, sorteio, medição)',
+}
+
+NOMES_CURTOS = {
+    'Monótona primeira escolha': 'primeira',
+    'Monótona melhor escolha':   'melhor',
+    'BLM randomizada':           'BLM',
+    'Melhor escolha com trocas': 'trocas',
+}
+
+
+def fases_perfil(dados):
+    """Fases com coluna perfil_<fase>_ms no arquivo (controle.py --perfil)."""
+    return [c[len('perfil_'):-len('_ms')] for c in dados.colunas
+            if c.startswith('perfil_') and c.endswith('_ms')]
+
+
+def _tempos_fases(dados, fases):
+    """Média do tempo próprio de cada fase (ms) + 'outros' (tempo total − fases).
+
+    Linhas sem perfil (arquivo com execuções misturadas) ficam de fora.
+    """
+    ms = np.stack([dados[f'perfil_{f}_ms'] for f in fases], axis=1)
+    ok = ~np.isnan(ms).any(axis=1)
+    if not ok.any():
+        return None
+    ms = ms[ok]
+    outros = np.maximum(dados['tempo'][ok] - ms.sum(axis=1), 0)
+    return np.append(ms.mean(axis=0), outros.mean())
+
+
+def _barras_empilhadas(ax, rotulos, tempos, fases, percentual=False):
+    """Uma barra por rótulo, com um segmento por fase (+ outros)."""
+    tempos = np.asarray(tempos, dtype=np.float64)
+    if percentual:
+        tempos = tempos / tempos.sum(axis=1, keepdims=True) * 100
+    base = np.zeros(len(rotulos))
+    for k, f in enumerate(list(fases) + ['outros']):
+        ax.bar(rotulos, tempos[:, k], bottom=base, width=0.6, zorder=3,
+               color=CORES_FASES.get(f, '#a78bfa'), edgecolor='#0d1117', linewidth=0.5,
+               label=ROTULOS_FASES.get(f, f))
+        base += tempos[:, k]
+    return base
+
+
+@figura
+def fig_perfil(registros, grupos, destino):
+    fases = fases_perfil(registros) if hasattr(registros, 'colunas') else []
+    if not fases:
+        print('  --  fig7: sem colunas de perfil (gere com controle.py --perfil)')
+        return
+
+    medias = {h: _tempos_fases(d, fases) for h, d in grupos.items()}
+    medias = {h: v for h, v in medias.items() if v is not None}
+    if not medias:
+        print('  --  fig7: nenhuma linha com perfil')
+        return
+
+    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    fig.suptitle('Perfil da Busca — Tempo por Fase', fontsize=14, fontweight='bold')
+    fig.patch.set_facecolor('#0d1117')
+
+    # Tempo médio absoluto por heurística
+    ax = axes[0]
+    rotulos = [h.replace(' ', '\n') for h in medias]
+    totais = _barras_empilhadas(ax, rotulos, list(medias.values()), fases)
+    for x, total in enumerate(totais):
+        ax.text(x, total, f'{total:.1f} ms', ha='center', va='bottom',
+                fontsize=9, color='#e6edf3', fontweight='bold')
+    ax.set_title('Tempo Médio por Fase')
+    ax.set_ylabel('Tempo (ms)')
+    ax.grid(axis='y', zorder=0)
+
+    # Participação de cada fase por heurística e m
+    ax = axes[1]
+    rotulos, tempos = [], []
+    for h, dados in grupos.items():
+        for m, sub in sorted(agrupar(dados, 'm').items()):
+            t = _tempos_fases(sub, fases)
+            if t is not None:
+                rotulos.append(f'{NOMES_CURTOS.get(h, h)}\nm={m}')
+                tempos.append(t)
+    _barras_empilhadas(ax, rotulos, tempos, fases, percentual=True)
+    ax.set_title('Participação das Fases por Heurística e m')
+    ax.set_ylabel('% do tempo')
+    ax.set_ylim(0, 100)
+    ax.tick_params(axis='x', labelsize=8)
+    ax.grid(axis='y', zorder=0)
+
+    handles, labels = axes[0].get_legend_handles_labels()
+    fig.legend(handles[::-1], labels[::-1], loc='center right', fontsize=8)
+    plt.tight_layout(rect=(0, 0, 0.84, 1))
+    _salvar(fig, destino, 'fig7_perfil.png')
+
+
+# ── Figura 8: Solução inicial (partida) ──────────────────────────────────────
+# Códigos da coluna partida=, na ordem de resolucao_tarefas.PARTIDAS
+PARTIDAS = ('maquina0', 'rodizio', 'guloso', 'lpt')
+ROTULOS_PARTIDAS = {
+    'maquina0': 'Tudo na\nmáquina 0',
+    'rodizio':  'Rodízio',
+    'guloso':   'Guloso\n(menor carga)',
+    'lpt':      'LPT',
+}
+
+
+def codigos_partida(dados):
+    """Código da partida de cada linha; sem a coluna, todas são a máquina 0."""
+    if 'partida' not in dados.colunas:
+        return np.zeros(len(dados), dtype=np.int64)
+    return np.nan_to_num(dados['partida'], nan=0).astype(np.int64)
+
+
+@figura
+def fig_partida(registros, grupos, destino):
+    codigos = codigos_partida(registros) if hasattr(registros, 'colunas') else np.zeros(0)
+    presentes = np.unique(codigos)
+    if len(presentes) < 2:
+        print('  --  fig8: uma só solução inicial (gere com controle.py --grade --partida ...)')
+        return
+
+    # Iterações em symlog: com --gap, uma partida já no alvo para com 0 iterações
+    campos = [('iteracoes', 'Iterações Médias', 'iterações (symlog)', 'symlog', 1),
+              ('tempo', 'Tempo Médio', 'ms (log)', 'log', 1)]
+    if 'gap' in registros.colunas:
+        campos.append(('gap', 'Gap Médio ao Limite Inferior', 'gap (%)', 'linear', 100))
+    else:
+        campos.append(('mk_final', 'Makespan Final Médio', 'makespan', 'linear', 1))
+
+    fig, axes = plt.subplots(1, len(campos), figsize=(6 * len(campos), 6))
+    fig.suptitle('Solução Inicial — Custo e Qualidade da Busca',
+                 fontsize=14, fontweight='bold')
+    fig.patch.set_facecolor('#0d1117')
+
+    x = np.arange(len(presentes))
+    largura = 0.8 / len(grupos)
+    for ax, (campo, titulo, ylabel, escala_y, escala) in zip(axes, campos):
+        for i, (h, dados) in enumerate(grupos.items()):
+            cod = codigos_partida(dados)
+            medias = [dados[campo][cod == p].mean() * escala if (cod == p).any() else np.nan
+                      for p in presentes]
+            posicoes = x + (i - (len(grupos) - 1) / 2) * largura
+            ax.bar(posicoes, medias, largura,
+                   color=cor(h), edgecolor='none', zorder=3, label=h)
+            if escala_y == 'symlog':
+                # Barra de altura zero não aparece: marca o 0 explicitamente
+                for xi, v in zip(posicoes, medias):
+                    if v == 0:
+                        ax.text(xi, 0, '0', ha='center', va='bottom', fontsize=8,
+                                color=cor(h), zorder=4)
+        ax.set_xticks(x)
+        ax.set_xticklabels([ROTULOS_PARTIDAS.get(PARTIDAS[p], str(p)) if p < len(PARTIDAS)
+                            else str(p) for p in presentes], fontsize=9)
+        ax.set_title(titulo)
+        ax.set_ylabel(ylabel)
+        if escala_y == 'symlog':
+            ax.set_yscale('symlog', linthresh=1)
+            ax.set_ylim(bottom=0)
+        elif escala_y == 'log':
+            ax.set_yscale('log')
+        ax.grid(axis='y', zorder=0)
+    axes[0].legend(fontsize=8)
+
+    plt.tight_layout()
+    _salvar(fig, destino, 'fig8_partida.png')
+
+
 # ── Salvar ────────────────────────────────────────────────────────────────────
 def _salvar(fig, destino, nome):
     caminho = os.path.join(destino, nome)
@@ -563,44 +1495,784 @@ def _salvar(fig, destino, nome):
 
 
 # ── Respostas do enunciado ───────────────────────────────────────────────────
+# Campos resumidos em estatisticas.csv e no modo --estatisticas
+CAMPOS_RESUMO = ('reducao_pct', 'tempo', 'iteracoes')
+COLUNAS_ESTATISTICAS = ['heuristica', 'campo', 'n', 'm', 'registros', 'media', 'media_inf',
+                        'media_sup', 'mediana', 'p10', 'p25', 'p75', 'p90', 'reamostras']
+COLUNAS_ESCALONAMENTO = ['heuristica', 'campo', 'termo', 'coef', 'inferior', 'superior',
+                         'r2', 'registros', 'reamostras']
+
+
 def imprimir_respostas(grupos):
     print('\n' + '='*60)
     print('  RESPOSTAS — QUESTÕES DO ENUNCIADO')
     print('='*60)
 
+    # Agregados do índice (--multi) só têm somas: sem bootstrap nem testes
+    amostras = all(isinstance(v, Resultados) for v in grupos.values())
+
     def melhor(campo, inverso=False):
         medias = {h: media(v, campo) for h, v in grupos.items()}
         return (min if inverso else max)(medias, key=medias.get), medias
 
+    def empates(vencedor, campo):
+        """Heurísticas sem diferença significativa (p ≥ 0,05) para a vencedora."""
+        if not amostras:
+            return {}
+        testes = comparar(grupos, campo)
+        return {(b if a == vencedor else a): c.p for (a, b), c in testes.items()
+                if vencedor in (a, b) and c.p >= 1 - NIVEL_CONFIANCA}
+
+    def imprimir_empates(vencedor, campo):
+        iguais = empates(vencedor, campo)
+        if iguais:
+            lista = ', '.join(f'{h} (p = {p:.3f})' for h, p in iguais.items())
+            print(f'    (sem diferença significativa para: {lista})')
+
     h_iter, medias_iter = melhor('iteracoes')
     print(f'\n▸ Mais iterações:   {h_iter}')
     for h, v in medias_iter.items():
         print(f'    {h:<35} {int(v):>8,}'.replace(',','.') + ' iter')
+    imprimir_empates(h_iter, 'iteracoes')
 
     h_tempo, medias_tempo = melhor('tempo')
     print(f'\n▸ Mais tempo:       {h_tempo}')
     for h, v in medias_tempo.items():
         print(f'    {h:<35} {v:>10.4f} ms')
+    imprimir_empates(h_tempo, 'tempo')
 
     h_qual, medias_qual = melhor('reducao_pct')
     print(f'\n▸ Maior qualidade:  {h_qual}')
     for h, v in medias_qual.items():
         print(f'    {h:<35} {v:>8.2f}% redução')
+    imprimir_empates(h_qual, 'reducao_pct')
+
+    # Coluna gap de controle.py: distância ao limite inferior do ótimo
+    if amostras and all('gap' in v.colunas for v in grupos.values()):
+        h_gap, medias_gap = melhor('gap', inverso=True)
+        print(f'\n▸ Menor gap ao limite inferior:  {h_gap}')
+        for h, v in medias_gap.items():
+            otimos = np.mean(grupos[h]['gap'] <= 0) * 100
+            print(f'    {h:<35} {v * 100:>8.2f}%   ({otimos:.0f}% no ótimo comprovado)')
+        imprimir_empates(h_gap, 'gap')
+
+    if amostras:
+        imprimir_estatisticas(grupos)
+        imprimir_escalonamento(grupos)
 
     print('='*60 + '\n')
 
 
+def imprimir_estatisticas(grupos):
+    """Tabela de médias (com IC bootstrap), medianas e quantis; diferenças de redução."""
+    pct = f'{NIVEL_CONFIANCA:.0%}'
+    for campo, titulo, unidade in (('reducao_pct', 'Redução de makespan', '%'),
+                                   ('tempo',       'Tempo de execução',   'ms')):
+        resumos = {h: resumir(v, campo) for h, v in grupos.items()}
+        reamostras = f'{REAMOSTRAS:,}'.replace(',', '.')
+        print(f'\n▸ {titulo} ({unidade}) — média [IC {pct}, {reamostras} reamostras], '
+              f'mediana, p10–p90:')
+        for h, r in resumos.items():
+            if r is None:
+                continue
+            ic = f'[{r["media_inf"]:.3f}, {r["media_sup"]:.3f}]'
+            print(f'    {h:<35} {r["media"]:>9.3f} {ic:<22} {r["mediana"]:>9.3f}'
+                  f'  {r["p10"]:.3f}–{r["p90"]:.3f}{_nota_reamostras(r["reamostras"])}')
+
+    testes = comparar(grupos, 'reducao_pct')
+    if testes:
+        print(f'\n▸ Diferença de redução (a − b, IC {pct} bootstrap, valor-p):')
+        for (a, b), c in testes.items():
+            tipo = (f'pareado, {c.tamanhos[0]} instâncias' if c.pareado
+                    else f'independente, {c.tamanhos[0]} × {c.tamanhos[1]}')
+            print(f'    {a} − {b}: {c.diferenca:+.3f} p.p. '
+                  f'[{c.inferior:+.3f}, {c.superior:+.3f}], p = {c.p:.4f} ({tipo})'
+                  f'{_nota_reamostras(c.reamostras)}')
+
+
+def imprimir_escalonamento(grupos, n_previsao=None):
+    """Expoentes do ajuste log-log e previsão de custo para um n maior."""
+    n_previsao = N_PREVISAO if n_previsao is None else n_previsao
+    ajustes = {(h, c): v.ajuste(c) for h, v in grupos.items() for c in CAMPOS_ESCALONAMENTO}
+    if not any(ajustes.values()):
+        return
+    print(f'\n▸ Escalonamento (log y = c + a·log n + b·log m, IC {NIVEL_CONFIANCA:.0%}):')
+    for (h, campo), ajuste in ajustes.items():
+        if ajuste is not None:
+            print(f'    {h:<35} {campo:<10} {_descrever_ajuste(ajuste)}')
+
+    unidades = {'tempo': 'ms', 'iteracoes': 'iter'}
+    n_fmt = f'{n_previsao:,}'.replace(',', '.')
+    print(f'\n▸ Previsão para n = {n_fmt} (m = n^(1/r), r = log_m n dos dados):')
+    for h, dados in grupos.items():
+        for r in sorted(razoes_r(dados)):
+            m = max(2, round(n_previsao ** (1 / r)))
+            partes = []
+            for campo in CAMPOS_ESCALONAMENTO:
+                ajuste = ajustes[(h, campo)]
+                if ajuste is None:
+                    continue
+                est, inf, sup = (float(v) for v in prever(ajuste, n_previsao, m))
+                partes.append(f'{campo} {est:.4g} [{inf:.4g}, {sup:.4g}] {unidades[campo]}')
+            if partes:
+                print(f'    {h:<35} r={r:g} (m={m}): ' + '; '.join(partes))
+
+
+def linhas_escalonamento(grupos):
+    """Um termo do ajuste log-log por linha (dicts com COLUNAS_ESCALONAMENTO)."""
+    for h, dados in grupos.items():
+        for campo in CAMPOS_ESCALONAMENTO:
+            ajuste = dados.ajuste(campo)
+            if ajuste is None:
+                continue
+            for t, c, i, s in zip(ajuste.termos, ajuste.coef, ajuste.inferior, ajuste.superior):
+                yield {'heuristica': h, 'campo': campo, 'termo': t, 'coef': float(c),
+                       'inferior': float(i), 'superior': float(s), 'r2': ajuste.r2,
+                       'registros': ajuste.registros, 'reamostras': len(ajuste.distribuicao)}
+
+
+def linhas_estatisticas(grupos, campos=CAMPOS_RESUMO):
+    """Resumo por heurística e por célula (n, m) (dicts com COLUNAS_ESTATISTICAS)."""
+    for h, dados in grupos.items():
+        for campo in campos:
+            geral = resumir(dados, campo)
+            if geral is not None:
+                yield {'heuristica': h, 'campo': campo, **geral}
+            for celula in resumir_por_celula(dados, campo):
+                yield {'heuristica': h, 'campo': campo, **celula}
+
+
+def _gravar_csv(caminho, colunas, linhas):
+    with open(caminho, 'w', encoding='utf-8', newline='') as f:
+        escritor = csv.DictWriter(f, colunas, restval='')
+        escritor.writeheader()
+        escritor.writerows(linhas)
+    print(f'  OK  {caminho}')
+
+
+def salvar_escalonamento(grupos, destino):
+    """Grava escalonamento.csv: um termo do ajuste log-log por linha."""
+    _gravar_csv(os.path.join(destino, 'escalonamento.csv'), COLUNAS_ESCALONAMENTO,
+                linhas_escalonamento(grupos))
+
+
+def salvar_estatisticas(grupos, destino, campos=CAMPOS_RESUMO):
+    """Grava estatisticas.csv: resumo por heurística e por célula (n, m)."""
+    _gravar_csv(os.path.join(destino, 'estatisticas.csv'), COLUNAS_ESTATISTICAS,
+                linhas_estatisticas(grupos, campos))
+
+
+# ── Resumo sem figuras (--estatisticas) ─────────────────────────────────────
+# O que imprimir_respostas calcula, em JSON ou CSV na saída padrão: nada é
+# gravado na pasta de gráficos e matplotlib nunca é importado.
+FORMATOS = ('texto', 'json', 'csv')
+COLUNAS_AGREGADO = ['heuristica', 'campo', 'registros', 'media', 'desvio', 'min', 'max']
+
+
+def _campos_resumo(grupos):
+    """CAMPOS_RESUMO, mais o gap quando todas as heurísticas têm a coluna."""
+    if all('gap' in v.colunas for v in grupos.values()):
+        return CAMPOS_RESUMO + ('gap',)
+    return CAMPOS_RESUMO
+
+
+def resumo_json(grupos):
+    """Respostas, resumo por heurística, comparações e escalonamento num dict.
+
+    Com agregados do índice (--multi) vão só média, desvio, mínimo e máximo.
+    """
+    amostras = all(isinstance(v, Resultados) for v in grupos.values())
+    campos = _campos_resumo(grupos)
+
+    def melhor(campo, inverso=False):
+        medias = {h: v.media(campo) for h, v in grupos.items()}
+        return (min if inverso else max)(medias, key=medias.get)
+
+    respostas = {'mais_iteracoes': melhor('iteracoes'), 'mais_tempo': melhor('tempo'),
+                 'maior_qualidade': melhor('reducao_pct')}
+    if 'gap' in campos:
+        respostas['menor_gap'] = melhor('gap', inverso=True)
+    saida = {'registros': sum(len(v) for v in grupos.values()), 'respostas': respostas,
+             'heuristicas': {h: {'registros': len(v),
+                                 'campos': {c: resumir(v, c) if amostras else v.resumo(c)
+                                            for c in campos}}
+                             for h, v in grupos.items()}}
+    if amostras:
+        saida['comparacoes'] = [{'a': a, 'b': b, 'campo': campo, **c._asdict()}
+                                for campo in campos
+                                for (a, b), c in comparar(grupos, campo).items()]
+        saida['escalonamento'] = list(linhas_escalonamento(grupos))
+    return saida
+
+
+def emitir_estatisticas(grupos, formato, saida=None):
+    """Escreve o resumo em `formato` ('json' ou 'csv') em `saida` (stdout)."""
+    saida = sys.stdout if saida is None else saida
+    if formato == 'json':
+        json.dump(resumo_json(grupos), saida, ensure_ascii=False, indent=1)
+        saida.write('\n')
+        return
+    if all(isinstance(v, Resultados) for v in grupos.values()):
+        colunas, linhas = COLUNAS_ESTATISTICAS, linhas_estatisticas(grupos, _campos_resumo(grupos))
+    else:
+        colunas = COLUNAS_AGREGADO
+        linhas = ({'heuristica': h, 'campo': c, **v.resumo(c)}
+                  for h, v in grupos.items() for c in CAMPOS_RESUMO)
+    escritor = csv.DictWriter(saida, colunas, restval='', lineterminator='\n')
+    escritor.writeheader()
+    escritor.writerows(linhas)
+
+
+# ── Várias execuções (índice em disco) ──────────────────────────────────────
+# Um índice JSON na pasta guarda, por arquivo, a assinatura (mtime, tamanho) e
+# somas por heurística. Só arquivos novos ou alterados são lidos de novo; as
+# figuras e o resumo agregados saem apenas do índice.
+ARQUIVO_INDICE = '.indice_resultados.json'
+VERSAO_INDICE  = 1
+CAMPOS_INDICE  = ('tempo', 'iteracoes', 'mk_inicial', 'mk_final', 'reducao_pct', 'razao')
+
+
+class Agregado:
+    """Somas de um grupo (contagem, Σx, Σx², mín., máx.) que podem ser combinadas.
+
+    Tem `media()` e `colunas` como `Resultados`, então serve direto para
+    `imprimir_respostas`.
+    """
+    colunas = {}
+
+    def __init__(self, dados=None):
+        self.cont = 0
+        self.soma = dict.fromkeys(CAMPOS_INDICE, 0.0)
+        self.soma2 = dict.fromkeys(CAMPOS_INDICE, 0.0)
+        self.min = dict.fromkeys(CAMPOS_INDICE, math.inf)
+        self.max = dict.fromkeys(CAMPOS_INDICE, -math.inf)
+        if dados is not None and len(dados):
+            self.cont = len(dados)
+            for c in CAMPOS_INDICE:
+                col = np.asarray(dados[c], dtype=np.float64)
+                self.soma[c], self.soma2[c] = float(col.sum()), float((col * col).sum())
+                self.min[c], self.max[c] = float(col.min()), float(col.max())
+
+    def somar(self, outro):
+        self.cont += outro.cont
+        for c in CAMPOS_INDICE:
+            self.soma[c] += outro.soma[c]
+            self.soma2[c] += outro.soma2[c]
+            self.min[c] = min(self.min[c], outro.min[c])
+            self.max[c] = max(self.max[c], outro.max[c])
+        return self
+
+    def __len__(self):
+        return self.cont
+
+    def media(self, campo):
+        return self.soma[campo] / self.cont if self.cont else 0
+
+    def desvio(self, campo):
+        if self.cont < 2:
+            return 0.0
+        var = (self.soma2[campo] - self.soma[campo] ** 2 / self.cont) / (self.cont - 1)
+        return math.sqrt(max(var, 0.0))
+
+    def resumo(self, campo):
+        return {'registros': self.cont, 'media': self.media(campo),
+                'desvio': self.desvio(campo), 'min': self.min[campo], 'max': self.max[campo]}
+
+    def para_json(self):
+        return {'cont': self.cont, 'soma': self.soma, 'soma2': self.soma2,
+                'min': self.min, 'max': self.max}
+
+    @classmethod
+    def de_json(cls, d):
+        a = cls()
+        a.cont = d['cont']
+        a.soma, a.soma2 = d['soma'], d['soma2']
+        a.min, a.max = d['min'], d['max']
+        return a
+
+
+def _assinatura_execucao(caminho):
+    """Assinatura do .txt e, se houver, do .res que ler_dados prefere."""
+    assinatura = _assinatura(caminho)
+    res = _caminho_binario(caminho)
+    if res is not None and res != caminho:
+        st = os.stat(res)
+        assinatura['res'] = [st.st_mtime_ns, st.st_size]
+    return assinatura
+
+
+def listar_execucoes(alvo):
+    """Arquivos de resultado de uma pasta (Resultado*.txt) ou de um glob."""
+    padrao = os.path.join(alvo, 'Resultado*.txt') if os.path.isdir(alvo) else alvo
+    return sorted(os.path.normpath(a) for a in glob.glob(padrao))
+
+
+def atualizar_indice(arquivos, caminho_indice):
+    """Atualiza o índice lendo só arquivos novos/alterados; retorna as entradas.
+
+    Entradas: {arquivo: {'fonte', 'registros', 'heuristicas': {h: Agregado}}},
+    só dos `arquivos` pedidos, na ordem de modificação. As chaves são caminhos
+    relativos à pasta do índice; as entradas de outros arquivos que ainda
+    existem continuam no índice gravado.
+    """
+    pasta = os.path.dirname(caminho_indice) or '.'
+    indice = {}
+    try:
+        with open(caminho_indice, encoding='utf-8') as f:
+            salvo = json.load(f)
+        if salvo.get('versao') == VERSAO_INDICE:
+            indice = salvo['arquivos']
+    except (OSError, ValueError):
+        pass
+    todas = {n: e for n, e in indice.items() if os.path.exists(os.path.join(pasta, n))}
+
+    entradas, lidos = {}, 0
+    for arq in arquivos:
+        nome = os.path.relpath(arq, pasta).replace(os.sep, '/')
+        fonte = _assinatura_execucao(arq)
+        entrada = todas.get(nome)
+        if entrada is None or entrada['fonte'] != fonte:
+            dados = ler_dados(arq, usar_cache=False)
+            entrada = {'fonte': fonte, 'registros': len(dados),
+                       'heuristicas': {h: Agregado(g).para_json()
+                                       for h, g in agrupar(dados).items()}}
+            todas[nome] = entrada
+            lidos += 1
+        entradas[nome] = entrada
+
+    if lidos or len(todas) != len(indice):
+        try:
+            with open(caminho_indice + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump({'versao': VERSAO_INDICE, 'arquivos': todas}, f)
+            os.replace(caminho_indice + '.tmp', caminho_indice)
+        except OSError as e:
+            print(f'   Aviso: não foi possível gravar o índice ({e})')
+    print(f'   {len(entradas)} execuções ({lidos} lidas agora; {len(todas)} no índice)')
+
+    ordem = sorted(entradas, key=lambda n: entradas[n]['fonte']['mtime_ns'])
+    return {n: {**entradas[n], 'heuristicas': {h: Agregado.de_json(a) for h, a
+                                               in entradas[n]['heuristicas'].items()}}
+            for n in ordem}
+
+
+def agregar_execucoes(entradas):
+    """Soma os agregados de todas as execuções por heurística."""
+    total = {}
+    for entrada in entradas.values():
+        for h, a in entrada['heuristicas'].items():
+            total.setdefault(h, Agregado()).somar(a)
+    return total
+
+
+@figura
+def fig_execucoes(entradas, total, destino):
+    """Médias agregadas (± desvio) e evolução por execução, só a partir do índice."""
+    fig = plt.figure(figsize=(18, 10))
+    fig.suptitle(f'Comparação entre Execuções — {len(entradas)} arquivos',
+                 fontsize=15, fontweight='bold', y=0.98)
+    gs = gridspec.GridSpec(2, 3, figure=fig, hspace=0.45, wspace=0.35)
+    heuristicas = list(total)
+
+    metricas = [('reducao_pct', 'Redução Média de Makespan', '%', False),
+                ('tempo',       'Tempo Médio de Execução',   'ms (log)', True),
+                ('iteracoes',   'Iterações Médias',          'iterações (log)', True)]
+    for col, (campo, titulo, ylabel, log) in enumerate(metricas):
+        ax = fig.add_subplot(gs[0, col])
+        medias = [total[h].media(campo) for h in heuristicas]
+        desvios = [total[h].desvio(campo) for h in heuristicas]
+        ax.bar([h.replace(' ', '\n') for h in heuristicas], medias,
+               yerr=desvios, capsize=4, ecolor='#8b949e',
+               color=[cor(h) for h in heuristicas], edgecolor='none', width=0.5, zorder=3)
+        ax.set_title(titulo)
+        ax.set_ylabel(ylabel)
+        ax.grid(axis='y', zorder=0)
+        if log:
+            ax.set_yscale('log')
+
+    ax = fig.add_subplot(gs[1, :])
+    x = np.arange(len(entradas))
+    for h in heuristicas:
+        ys = [e['heuristicas'][h].media('reducao_pct') if h in e['heuristicas'] else np.nan
+              for e in entradas.values()]
+        ax.plot(x, ys, color=cor(h), marker=marcador(h), label=h,
+                linewidth=1.8, markersize=5 if len(x) <= 100 else 0, zorder=3)
+    ax.set_title('Redução Média de Makespan por Execução (ordem de modificação)')
+    ax.set_xlabel('Execução')
+    ax.set_ylabel('Redução (%)')
+    if len(x) <= 20:
+        ax.set_xticks(x)
+        ax.set_xticklabels([os.path.splitext(n)[0].replace('Resultado_', '')
+                            for n in entradas], fontsize=7, rotation=30, ha='right')
+    ax.legend(fontsize=8)
+    ax.grid(zorder=0)
+
+    _salvar(fig, destino, 'fig_execucoes.png')
+
+
+def analisar_execucoes(alvo, figuras=True, formato='texto', saida=None):
+    """Modo --multi: índice + figura e resumo agregados de várias execuções."""
+    arquivos = listar_execucoes(alvo)
+    if not arquivos:
+        sys.exit(f'Nenhum Resultado*.txt encontrado em {alvo}')
+    # Com um glob, o índice e as figuras vão para a pasta comum dos arquivos
+    pasta = alvo if os.path.isdir(alvo) else (os.path.commonpath(
+        [os.path.dirname(a) or '.' for a in arquivos]) or '.')
+    print(f'\nIndexando {len(arquivos)} arquivos em: {pasta}/')
+
+    entradas = atualizar_indice(arquivos, os.path.join(pasta, ARQUIVO_INDICE))
+    total = agregar_execucoes(entradas)
+    print(f'   {sum(e["registros"] for e in entradas.values())} registros no total.')
+
+    if not figuras:
+        if formato == 'texto':
+            imprimir_respostas(total)
+        else:
+            emitir_estatisticas(total, formato, saida)
+        return
+
+    destino = os.path.join(pasta, 'Agregado_graficos')
+    os.makedirs(destino, exist_ok=True)
+    print(f'\nGerando graficos em: {destino}/')
+    fig_execucoes(entradas, total, destino)
+
+    imprimir_respostas(total)
+    print(f'Concluido! {destino}/')
+
+
+# ── Renderização ──────────────────────────────────────────────────────────────
+FIGURAS = {
+    'fig1': fig_visao_geral,
+    'fig2': fig_tempo,
+    'fig3': fig_makespan,
+    'fig4': fig_iteracoes,
+    'fig5': fig_painel,
+    'fig6': fig_convergencia,
+    'fig7': fig_perfil,
+    'fig8': fig_partida,
+}
+
+# Estado de cada processo worker, preenchido uma única vez pelo inicializador
+_worker = {}
+
+
+def _inicializar_worker(caminho, destino, usar_cache, limiar_pontos, reamostras):
+    global LIMIAR_PONTOS, REAMOSTRAS
+    LIMIAR_PONTOS, REAMOSTRAS = limiar_pontos, reamostras
+    # Os workers reabrem o cache via memmap em vez de receber os dados por
+    # pickle: cada figura recebe só o próprio nome.
+    dados = ler_dados(caminho, usar_cache=usar_cache)
+    _worker.update(dados=dados, grupos=agrupar(dados), destino=destino)
+
+
+def _renderizar_no_worker(nome):
+    FIGURAS[nome](_worker['dados'], _worker['grupos'], _worker['destino'])
+    return nome
+
+
+def renderizar(nomes, registros, grupos, destino, caminho, processos=1, usar_cache=True):
+    """Gera as figuras pedidas; com processos > 1 usa um pool de processos."""
+    processos = min(processos, len(nomes))
+    if processos <= 1:
+        for nome in nomes:
+            FIGURAS[nome](registros, grupos, destino)
+        return
+
+    carregar_matplotlib()   # com fork, os workers herdam o import já feito
+    with ProcessPoolExecutor(max_workers=processos,
+                             initializer=_inicializar_worker,
+                             initargs=(caminho, destino, usar_cache, LIMIAR_PONTOS,
+                                       REAMOSTRAS)) as pool:
+        # Painel (fig5) é o mais lento: submete primeiro para não ficar por último
+        ordem = sorted(nomes, key=lambda n: n != 'fig5')
+        for _ in pool.map(_renderizar_no_worker, ordem):
+            pass
+
+
+# ── Acompanhamento (modo tail) ───────────────────────────────────────────────
+class Estatistica:
+    """Contagem, média, variância (Welford), mínimo e máximo em O(1) por valor."""
+    __slots__ = ('cont', 'media', 'm2', 'min', 'max')
+
+    def __init__(self):
+        self.cont, self.media, self.m2 = 0, 0.0, 0.0
+        self.min, self.max = math.inf, -math.inf
+
+    def adicionar(self, v):
+        self.cont += 1
+        delta = v - self.media
+        self.media += delta / self.cont
+        self.m2 += delta * (v - self.media)
+        self.min = min(self.min, v)
+        self.max = max(self.max, v)
+
+    @property
+    def variancia(self):
+        return self.m2 / (self.cont - 1) if self.cont > 1 else 0.0
+
+
+class ColunasCrescentes:
+    """Colunas NumPy com folga no fim (a capacidade dobra ao encher), só acréscimos.
+
+    `resultados()` devolve visões [:n], sem cópia: as linhas já escritas nunca
+    mudam, então uma visão antiga continua válida depois de novos acréscimos
+    (uma realocação copia para um array maior e deixa o antigo com a visão).
+    """
+
+    def __init__(self, categorias):
+        self.categorias = categorias   # dict nome → código, compartilhado
+        self.colunas    = {}
+        self.codigos    = np.empty(0, dtype=np.int8)
+        self.n          = 0
+
+    def __len__(self):
+        return self.n
+
+    def _reservar(self, total):
+        if total <= len(self.codigos):
+            return
+        capacidade = max(total, 2 * len(self.codigos), 1024)
+
+        def _maior(v):
+            novo = np.empty(capacidade, dtype=v.dtype)
+            novo[:self.n] = v[:self.n]
+            return novo
+        self.codigos = _maior(self.codigos)
+        self.colunas = {c: _maior(v) for c, v in self.colunas.items()}
+
+    def anexar(self, colunas, codigos):
+        """Acrescenta um lote de linhas (`colunas` com arrays do tamanho de `codigos`)."""
+        inicio, fim = self.n, self.n + len(codigos)
+        self._reservar(fim)
+        for c, v in colunas.items():
+            if c not in self.colunas:
+                self.colunas[c] = np.empty(len(self.codigos), dtype=v.dtype)
+                if inicio:   # coluna opcional nova: linhas anteriores ficam com NaN
+                    self.colunas[c][:inicio] = np.nan
+        for c, destino in self.colunas.items():
+            destino[inicio:fim] = colunas[c] if c in colunas else np.nan
+        self.codigos[inicio:fim] = codigos
+        self.n = fim
+
+    def resultados(self):
+        colunas = {c: v[:self.n] for c, v in self.colunas.items()}
+        return Resultados(colunas, self.codigos[:self.n], self.categorias)
+
+
+class Acompanhador:
+    """Lê apenas os bytes acrescentados a um Resultado_*.txt em crescimento.
+
+    Mantém estatísticas incrementais por heurística e por (heurística, n) e
+    os registros em colunas que só crescem, no total e já separados por
+    heurística: regerar as figuras não relê o arquivo, não copia as colunas
+    e não reagrupa os registros antigos.
+    """
+    CAMPOS = ('tempo', 'iteracoes', 'mk_final', 'reducao_pct')
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self._reiniciar()
+
+    def _reiniciar(self):
+        self.posicao    = 0
+        self.pendente   = b''    # última linha ainda sem '\n'
+        self.categorias = {}
+        self.todos      = ColunasCrescentes(self.categorias)
+        self.grupos     = {}     # heurística → ColunasCrescentes
+        self.stats      = defaultdict(lambda: {c: Estatistica() for c in self.CAMPOS})
+
+    def atualizar(self):
+        """Processa os bytes novos; retorna quantos registros foram adicionados."""
+        try:
+            tamanho = os.path.getsize(self.caminho)
+        except FileNotFoundError:   # o experimento ainda não criou o arquivo
+            tamanho = 0
+        if tamanho < self.posicao:   # arquivo truncado ou recriado
+            self._reiniciar()
+        if tamanho == self.posicao:
+            return 0
+
+        with open(self.caminho, 'rb') as f:
+            f.seek(self.posicao)
+            bloco = f.read(tamanho - self.posicao)
+        if self.posicao == 0 and bloco.startswith(b'\xef\xbb\xbf'):
+            bloco = bloco[3:]
+        self.posicao = tamanho
+
+        *linhas, self.pendente = (self.pendente + bloco).split(b'\n')
+        lote = ConstrutorColunar()
+        lote.categorias = self.categorias   # mesmos códigos em todos os lotes
+        novos = 0
+        for linha in linhas:
+            r = _parse_linha(linha.decode('utf-8', errors='replace'))
+            if r is None:
+                continue
+            lote.adicionar(r)
+            mk_i, mk_f = r.mk_inicial, r.mk_final
+            valores = {'tempo': r.tempo, 'iteracoes': r.iteracoes, 'mk_final': mk_f,
+                       'reducao_pct': (mk_i - mk_f) / mk_i * 100}
+            for chave in ((r.heuristica,), (r.heuristica, r.n)):
+                for c, est in self.stats[chave].items():
+                    est.adicionar(valores[c])
+            novos += 1
+        if novos:
+            self._anexar(lote.resultados())
+        return novos
+
+    def _anexar(self, lote):
+        """Acrescenta o lote (com reducao_pct e razao já derivadas) ao total e aos grupos."""
+        self.todos.anexar(lote.colunas, lote.codigos)
+        for codigo in np.unique(lote.codigos):
+            mascara = lote.codigos == codigo
+            grupo = self.grupos.setdefault(lote.categorias[codigo],
+                                           ColunasCrescentes(self.categorias))
+            grupo.anexar({c: v[mascara] for c, v in lote.colunas.items()},
+                         lote.codigos[mascara])
+
+    def visao(self):
+        """(registros, grupos) como `agrupar` daria, por visões sem cópia."""
+        return (self.todos.resultados(),
+                {h: g.resultados() for h, g in self.grupos.items()})
+
+    def resumo(self):
+        """Uma linha por heurística e, abaixo dela, uma por n."""
+        for chave, est in self.stats.items():
+            if len(chave) != 1:
+                continue
+            self._linha_resumo(f'{chave[0]:<35}', est)
+            for n in sorted(c[1] for c in self.stats if len(c) == 2 and c[0] == chave[0]):
+                self._linha_resumo(f'  n = {n:<29}', self.stats[(chave[0], n)])
+
+    @staticmethod
+    def _linha_resumo(rotulo, est):
+        t, red = est['tempo'], est['reducao_pct']
+        print(f'    {rotulo} {t.cont:>8} reg  '
+              f'tempo {t.media:>10.4f} ± {math.sqrt(t.variancia):.4f} ms  '
+              f'redução {red.media:6.2f}% [{red.min:.1f}–{red.max:.1f}]')
+
+
+def acompanhar(caminho, nomes, destino, intervalo=5.0, ocioso=None):
+    """Modo tail: atualiza estatísticas e figuras conforme o arquivo cresce.
+
+    As figuras são regeradas no máximo uma vez por `intervalo` segundos e só
+    quando chegaram registros novos desde a última renderização. Com `ocioso`,
+    encerra após esse tempo sem o arquivo crescer.
+    """
+    acomp = Acompanhador(caminho)
+    pendentes, ultimo_dado = 0, time.monotonic()
+    print(f'\nAcompanhando {caminho} (Ctrl+C para sair)')
+    try:
+        while True:
+            novos = acomp.atualizar()
+            agora = time.monotonic()
+            if novos:
+                pendentes  += novos
+                ultimo_dado = agora
+            if pendentes and len(acomp.todos):
+                dados, grupos = acomp.visao()
+                print(f'\n  +{pendentes} registros (total {len(dados)})')
+                acomp.resumo()
+                renderizar(nomes, dados, grupos, destino, caminho)
+                pendentes = 0
+            if ocioso is not None and agora - ultimo_dado >= ocioso:
+                break
+            time.sleep(intervalo)
+    except KeyboardInterrupt:
+        pass
+    return acomp
+
+
+def _argumentos():
+    parser = argparse.ArgumentParser(description='Gera gráficos comparativos das heurísticas.')
+    parser.add_argument('arquivo', nargs='?',
+                        help='arquivo Resultado_*.txt (padrão: o mais recente)')
+    parser.add_argument('--only', default=','.join(FIGURAS),
+                        help='figuras a gerar, separadas por vírgula (ex.: fig2,fig5)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='número de processos para renderizar as figuras')
+    parser.add_argument('--sem-cache', action='store_true',
+                        help='ignora e não grava o cache binário')
+    parser.add_argument('--multi', action='store_true',
+                        help='analisa várias execuções: "arquivo" vira uma pasta ou um glob '
+                             '(padrão: a pasta de resultados)')
+    parser.add_argument('--acompanhar', action='store_true',
+                        help='modo tail: acompanha o arquivo enquanto o experimento roda')
+    parser.add_argument('--intervalo', type=float, default=5.0,
+                        help='segundos entre atualizações no modo --acompanhar')
+    parser.add_argument('--ocioso', type=float, default=None,
+                        help='no modo --acompanhar, encerra após N segundos sem dados novos')
+    parser.add_argument('--limiar-pontos', type=int, default=LIMIAR_PONTOS,
+                        help='acima deste número de registros, usa faixas de percentis '
+                             f'em vez de um ponto por registro (padrão: {LIMIAR_PONTOS})')
+    parser.add_argument('--reamostras', type=int, default=REAMOSTRAS,
+                        help='reamostras do bootstrap dos intervalos de confiança '
+                             f'(padrão: {REAMOSTRAS})')
+    parser.add_argument('--prever', type=int, default=N_PREVISAO,
+                        help='n da previsão de tempo e iterações pelo ajuste log-log '
+                             f'(padrão: {N_PREVISAO})')
+    parser.add_argument('--estatisticas', '--stats-only', action='store_true',
+                        help='só o resumo estatístico: nenhuma figura nem CSV gravados '
+                             'e matplotlib não é importado')
+    parser.add_argument('--formato', choices=FORMATOS, default='texto',
+                        help='formato do resumo na saída padrão; json e csv implicam '
+                             '--estatisticas e mandam o progresso para stderr (padrão: texto)')
+    args = parser.parse_args()
+
+    if args.formato != 'texto':
+        args.estatisticas = True
+        if args.acompanhar:
+            parser.error('--acompanhar só imprime o resumo em texto')
+
+    args.only = [f.strip() for f in args.only.split(',') if f.strip()]
+    invalidas = [f for f in args.only if f not in FIGURAS]
+    if invalidas:
+        parser.error(f'figuras desconhecidas: {", ".join(invalidas)} '
+                     f'(opções: {", ".join(FIGURAS)})')
+    return args
+
+
 # ── Main ──────────────────────────────────────────────────────────────────────
 def main():
-    if len(sys.argv) > 1:
-        caminho_arquivo = os.path.normpath(sys.argv[1])
+    args = _argumentos()
+    saida = sys.stdout
+    # Em JSON/CSV a saída padrão fica só com o resumo; o progresso vai para stderr
+    with contextlib.redirect_stdout(sys.stderr if args.formato != 'texto' else saida):
+        _principal(args, saida)
+
+
+def _principal(args, saida):
+    if args.multi:
+        alvo = args.arquivo or next((p for p in ('Resultados_Tarefas',
+                                                 os.path.join('Resultados', 'Resultados_Tarefas'))
+                                     if os.path.isdir(p)), '.')
+        analisar_execucoes(os.path.normpath(alvo), figuras=not args.estatisticas,
+                           formato=args.formato, saida=saida)
+        return
+
+    if args.arquivo:
+        caminho_arquivo = os.path.normpath(args.arquivo)
     else:
         caminho_arquivo = encontrar_arquivo()
     
     print(f'\nLendo: {caminho_arquivo}')
 
-    registros = ler_dados(caminho_arquivo)
-    if not registros:
+    usar_cache = not args.sem_cache
+    global LIMIAR_PONTOS, REAMOSTRAS, N_PREVISAO
+    LIMIAR_PONTOS, REAMOSTRAS = args.limiar_pontos, args.reamostras
+    N_PREVISAO = args.prever
+
+    if args.acompanhar:
+        destino = os.path.splitext(caminho_arquivo)[0] + '_graficos'
+        nomes = [] if args.estatisticas else args.only
+        if nomes:
+            os.makedirs(destino, exist_ok=True)
+        acomp = acompanhar(caminho_arquivo, nomes, destino,
+                           intervalo=args.intervalo, ocioso=args.ocioso)
+        if len(acomp.todos):
+            imprimir_respostas(acomp.visao()[1])
+        return
+
+    registros = ler_dados(caminho_arquivo, usar_cache=usar_cache)
+    if not len(registros):
         sys.exit('Nenhum registro válido encontrado no arquivo.')
 
     print(f'   {len(registros)} registros carregados.')
@@ -608,17 +2280,23 @@ def main():
     grupos = agrupar(registros)
     print(f'   Heurísticas: {list(grupos.keys())}')
 
+    if args.estatisticas:
+        if args.formato == 'texto':
+            imprimir_respostas(grupos)
+        else:
+            emitir_estatisticas(grupos, args.formato, saida)
+        return
+
     # Pasta de saída ao lado do arquivo de resultado
     base = os.path.splitext(caminho_arquivo)[0]
     destino = base + '_graficos'
     os.makedirs(destino, exist_ok=True)
     print(f'\nGerando graficos em: {destino}/')
 
-    fig_visao_geral(registros, grupos, destino)
-    fig_tempo(registros, grupos, destino)
-    fig_makespan(registros, grupos, destino)
-    fig_iteracoes(registros, grupos, destino)
-    fig_painel(registros, grupos, destino)
+    renderizar(args.only, registros, grupos, destino, caminho_arquivo,
+               processos=args.jobs, usar_cache=usar_cache)
+    salvar_estatisticas(grupos, destino)
+    salvar_escalonamento(grupos, destino)
 
     imprimir_respostas(grupos)
     print(f'Concluido! {destino}/')
@@ -0,0 +1,364 @@
+"""
+benchmark.py
+============
+Suíte de desempenho reprodutível para as heurísticas (resolucao_tarefas.py) e
+para o pipeline do gerar_graficos.py.
+
+Heurísticas: uma instância de semente fixa por célula (m, r) da grade de
+Controle, a mesma para as três heurísticas. Cada caso roda `--aquecimento`
+vezes sem medir e `--repeticoes` vezes medindo só a busca; o relatório traz
+a distribuição do tempo, o custo por movimento, iterações por segundo e o pico
+de memória (tracemalloc, numa execução à parte para não distorcer o tempo).
+
+Pipeline: cada etapa do gerar_graficos.py (leitura, cache, agrupamento,
+estatísticas e cada figura) é cronometrada sobre uma cópia do arquivo, com
+grupos recém-criados a cada repetição para que os caches em memória não
+mascarem o custo. Sem --arquivo, um Resultado de semente fixa é gerado com
+controle.py.
+
+O resultado é um JSON com ambiente e parâmetros; --comparar mostra a razão
+entre duas execuções e sai com código 1 se alguma medida piorou além do limiar.
+
+Uso:
+    python benchmark.py                          # grava benchmarks/benchmark_<data>.json
+    python benchmark.py --repeticoes 10 --aquecimento 2
+    python benchmark.py --sem-pipeline           # só as heurísticas
+    python benchmark.py --arquivo Resultados/Resultados_Tarefas/Resultado_X.txt
+    python benchmark.py --comparar benchmarks/antes.json benchmarks/depois.json
+"""
+
+import os
+import sys
+import argparse
+import contextlib
+import io
+import json
+import platform
+import shutil
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from collections import namedtuple
+from datetime import datetime
+
+import numpy as np
+
+from resolucao_tarefas import ResolucaoTarefas, HEURISTICAS, BLM_RANDOMIZADA
+from controle import CONJUNTO_M, CONJUNTO_R, APELIDOS, REPLICACOES, executar
+
+VERSAO_BENCHMARK = 1
+SEMENTE          = 20260216
+REPETICOES       = 5
+AQUECIMENTO      = 1
+ALPHA_BLM        = 0.5
+LIMIAR_REGRESSAO = 0.10   # razão novo/antigo acima de 1 + limiar conta como regressão
+
+PASTA_RAIZ       = os.path.dirname(os.path.abspath(__file__))
+PASTA_BENCHMARKS = os.path.join(PASTA_RAIZ, 'benchmarks')
+
+Caso = namedtuple('Caso', 'heuristica m r n alpha semente')
+
+
+# ── Ambiente ────────────────────────────────────────────────────────────────
+def _commit():
+    try:
+        saida = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PASTA_RAIZ,
+                               capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return saida.stdout.strip() or None
+
+
+def ambiente():
+    """Versões e máquina, para saber se duas execuções são comparáveis."""
+    return {
+        'python':     platform.python_version(),
+        'numpy':      np.__version__,
+        'plataforma': platform.platform(),
+        'processador': platform.processor() or platform.machine(),
+        'nucleos':    os.cpu_count(),
+        'commit':     _commit(),
+    }
+
+
+def _resumo_tempos(tempos):
+    t = np.asarray(tempos, dtype=np.float64)
+    p25, mediana, p75 = np.percentile(t, (25, 50, 75))
+    return {'mediana': float(mediana), 'min': float(t.min()), 'p25': float(p25),
+            'p75': float(p75), 'media': float(t.mean()), 'amostras': len(t)}
+
+
+def _pico_memoria(funcao):
+    """Pico de memória alocada (KiB) durante uma chamada, via tracemalloc."""
+    tracemalloc.start()
+    try:
+        funcao()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return pico / 1024
+
+
+# ── Heurísticas ─────────────────────────────────────────────────────────────
+def casos(m_valores=CONJUNTO_M, r_valores=CONJUNTO_R, heuristicas=tuple(HEURISTICAS),
+          alpha=ALPHA_BLM, seed=SEMENTE):
+    """Casos da grade (m, r) × heurística; a semente depende só de (m, n)."""
+    for m in m_valores:
+        for r in r_valores:
+            n = int(m ** r)
+            seq = np.random.SeedSequence(seed, spawn_key=(m, n))
+            semente = int(seq.generate_state(1)[0])
+            for h in heuristicas:
+                yield Caso(h, m, r, n, alpha if h == BLM_RANDOMIZADA else 0.0, semente)
+
+
+def medir_heuristica(caso, repeticoes=REPETICOES, aquecimento=AQUECIMENTO):
+    """Tempo da busca, custo por movimento e memória de um caso."""
+    metodo = HEURISTICAS[caso.heuristica]
+
+    def rodar():
+        r = ResolucaoTarefas(caso.n, caso.m, alpha=caso.alpha, seed=caso.semente)
+        metodo(r)
+        return r
+
+    for _ in range(aquecimento):
+        rodar()
+    execucoes = [rodar() for _ in range(repeticoes)]
+    r = execucoes[0]
+    if any(e.iteracoes != r.iteracoes for e in execucoes):
+        print(f'  Aviso: {caso.heuristica} (m={caso.m}, n={caso.n}) não é determinística')
+
+    tempos = _resumo_tempos([e.tempo for e in execucoes])
+    ms = tempos['mediana']
+    return {
+        **caso._asdict(),
+        'repeticoes':        repeticoes,
+        'aquecimento':       aquecimento,
+        'tempo_ms':          tempos,
+        'iteracoes':         r.iteracoes,
+        'movimentos':        r.movimentos,
+        'ns_por_iteracao':   ms * 1e6 / r.iteracoes if r.iteracoes else None,
+        'ns_por_movimento':  ms * 1e6 / r.movimentos if r.movimentos else None,
+        'iteracoes_por_s':   r.iteracoes / (ms / 1000) if ms > 0 else None,
+        'memoria_pico_kib':  _pico_memoria(rodar),
+        'mk_inicial':        r.makespan_inicial,
+        'mk_final':          r.makespan_final,
+    }
+
+
+def medir_heuristicas(lista, repeticoes=REPETICOES, aquecimento=AQUECIMENTO):
+    registros = []
+    for caso in lista:
+        reg = medir_heuristica(caso, repeticoes, aquecimento)
+        registros.append(reg)
+        ns = reg['ns_por_movimento']
+        print(f'  {caso.heuristica:<27} m={caso.m:<3} n={caso.n:<6} '
+              f'{reg["tempo_ms"]["mediana"]:>10.3f} ms  {reg["iteracoes_por_s"] or 0:>12,.0f} it/s  '
+              f'{(ns or 0):>10,.0f} ns/mov  {reg["memoria_pico_kib"]:>8.0f} KiB')
+    return registros
+
+
+# ── Pipeline do gerar_graficos.py ───────────────────────────────────────────
+def _importar_gerar_graficos():
+    pasta = os.path.join(PASTA_RAIZ, 'Resultados')
+    if pasta not in sys.path:
+        sys.path.insert(0, pasta)
+    import gerar_graficos
+    return gerar_graficos
+
+
+def _gerar_arquivo(pasta, seed):
+    """Resultado de semente fixa gerado com controle.py (conteúdo sempre igual)."""
+    caminho = os.path.join(pasta, 'Resultado_benchmark.txt')
+    with contextlib.redirect_stdout(io.StringIO()):
+        executar(caminho, replicacoes=REPLICACOES, seed=seed, processos=1, ordenado=True)
+    return caminho
+
+
+def medir_pipeline(arquivo=None, repeticoes=REPETICOES, seed=SEMENTE):
+    """Tempo e memória de cada etapa do gerar_graficos.py sobre uma cópia do arquivo."""
+    gg = _importar_gerar_graficos()
+    with tempfile.TemporaryDirectory() as pasta:
+        if arquivo is None:
+            caminho = _gerar_arquivo(pasta, seed)
+        else:
+            # Cópia: o cache gravado pela etapa de leitura não vai para a pasta original
+            caminho = os.path.join(pasta, os.path.basename(arquivo))
+            shutil.copyfile(arquivo, caminho)
+        binario = os.path.splitext(arquivo or '')[0] + '.res'
+        destino = os.path.join(pasta, 'graficos')
+        os.makedirs(destino)
+
+        dados = gg.ler_dados(caminho, usar_cache=False)
+        gg.ler_dados(caminho, usar_cache=True)   # grava o cache para a etapa seguinte
+
+        def estatisticas(grupos):
+            gg.salvar_estatisticas(grupos, destino)
+            gg.salvar_escalonamento(grupos, destino)
+            gg.imprimir_respostas(grupos)
+
+        etapas = [
+            ('leitura_texto', lambda: None, lambda _: gg.ler_dados(caminho, usar_cache=False)),
+            ('leitura_cache', lambda: None, lambda _: gg.ler_dados(caminho, usar_cache=True)),
+            ('agrupar',       lambda: None, lambda _: gg.agrupar(dados)),
+            ('estatisticas',  lambda: gg.agrupar(dados), estatisticas),
+        ]
+        if arquivo is not None and os.path.exists(binario):
+            copia_res = os.path.join(pasta, 'binario.res')
+            shutil.copyfile(binario, copia_res)
+            etapas.append(('leitura_binario', lambda: None, lambda _: gg.ler_binario(copia_res)))
+        for nome, figura in gg.FIGURAS.items():
+            etapas.append((nome, lambda: gg.agrupar(dados),
+                           lambda grupos, figura=figura: figura(dados, grupos, destino)))
+
+        medidas = []
+        for nome, preparar, funcao in etapas:
+            tempos = []
+            with contextlib.redirect_stdout(io.StringIO()):
+                for _ in range(repeticoes):
+                    arg = preparar()
+                    ini = time.perf_counter()
+                    funcao(arg)
+                    tempos.append((time.perf_counter() - ini) * 1000)
+                arg = preparar()
+                memoria = _pico_memoria(lambda: funcao(arg))
+            medidas.append({'etapa': nome, 'tempo_ms': _resumo_tempos(tempos),
+                            'memoria_pico_kib': memoria})
+            print(f'  {nome:<16} {medidas[-1]["tempo_ms"]["mediana"]:>10.2f} ms  '
+                  f'{memoria:>10.0f} KiB')
+
+    return {'arquivo': os.path.basename(arquivo) if arquivo else None,
+            'registros': len(dados), 'etapas': medidas}
+
+
+# ── Comparação ──────────────────────────────────────────────────────────────
+def _chave_heuristica(reg):
+    return (reg['heuristica'], reg['m'], reg['r'], reg['alpha'])
+
+
+def comparar(caminho_antigo, caminho_novo, limiar=LIMIAR_REGRESSAO):
+    """Imprime novo/antigo da mediana de tempo de cada medida; retorna as regressões."""
+    with open(caminho_antigo, encoding='utf-8') as f:
+        antigo = json.load(f)
+    with open(caminho_novo, encoding='utf-8') as f:
+        novo = json.load(f)
+    print(f'{caminho_antigo} ({antigo["ambiente"].get("commit")}) → '
+          f'{caminho_novo} ({novo["ambiente"].get("commit")})')
+    if antigo['ambiente'].get('plataforma') != novo['ambiente'].get('plataforma'):
+        print('Aviso: execuções em plataformas diferentes')
+
+    regressoes = []
+
+    def linha(rotulo, a, b, nota=''):
+        razao = b['tempo_ms']['mediana'] / a['tempo_ms']['mediana'] if a['tempo_ms']['mediana'] else 1.0
+        marca = ''
+        if razao > 1 + limiar:
+            marca = '  REGRESSÃO'
+            regressoes.append(rotulo)
+        elif razao < 1 - limiar:
+            marca = '  melhora'
+        print(f'  {rotulo:<48} {a["tempo_ms"]["mediana"]:>10.3f} → '
+              f'{b["tempo_ms"]["mediana"]:>10.3f} ms  ×{razao:.2f}{marca}{nota}')
+
+    anteriores = {_chave_heuristica(r): r for r in antigo.get('heuristicas', [])}
+    if anteriores:
+        print('\nHeurísticas (mediana do tempo de busca):')
+    for reg in novo.get('heuristicas', []):
+        a = anteriores.get(_chave_heuristica(reg))
+        if a is None:
+            continue
+        nota = ''
+        if a['iteracoes'] != reg['iteracoes']:
+            # Outra trajetória: o tempo deixa de ser comparável movimento a movimento
+            nota = f'  (iterações {a["iteracoes"]} → {reg["iteracoes"]})'
+        linha(f'{reg["heuristica"]} m={reg["m"]} n={reg["n"]}', a, reg, nota)
+
+    etapas_antigas = {e['etapa']: e for e in (antigo.get('pipeline') or {}).get('etapas', [])}
+    if etapas_antigas and novo.get('pipeline'):
+        print('\nPipeline do gerar_graficos.py:')
+        for etapa in novo['pipeline']['etapas']:
+            a = etapas_antigas.get(etapa['etapa'])
+            if a is not None:
+                linha(etapa['etapa'], a, etapa)
+
+    print(f'\n{len(regressoes)} regressões acima de {limiar:.0%}')
+    return regressoes
+
+
+# ── Main ────────────────────────────────────────────────────────────────────
+def _lista(texto, tipo):
+    return [tipo(v.strip()) for v in texto.split(',') if v.strip()]
+
+
+def _argumentos():
+    parser = argparse.ArgumentParser(description='Benchmark das heurísticas e do gerar_graficos.py.')
+    parser.add_argument('--repeticoes', type=int, default=REPETICOES,
+                        help=f'execuções medidas por caso (padrão: {REPETICOES})')
+    parser.add_argument('--aquecimento', type=int, default=AQUECIMENTO,
+                        help=f'execuções descartadas antes de medir (padrão: {AQUECIMENTO})')
+    parser.add_argument('--seed', type=int, default=SEMENTE,
+                        help=f'semente das instâncias (padrão: {SEMENTE})')
+    parser.add_argument('--m', help='valores de m separados por vírgula (padrão: os de Controle)')
+    parser.add_argument('--r-valores', metavar='R',
+                        help='valores de r separados por vírgula (padrão: os de Controle)')
+    parser.add_argument('--heuristicas', help=f'{",".join(APELIDOS)} (padrão: todas)')
+    parser.add_argument('--alpha', type=float, default=ALPHA_BLM,
+                        help=f'alpha da BLM randomizada (padrão: {ALPHA_BLM})')
+    parser.add_argument('--arquivo', default=None,
+                        help='Resultado usado no pipeline (padrão: um gerado com semente fixa)')
+    parser.add_argument('--sem-heuristicas', action='store_true', help='pula as heurísticas')
+    parser.add_argument('--sem-pipeline', action='store_true', help='pula o gerar_graficos.py')
+    parser.add_argument('--saida', default=None,
+                        help='arquivo JSON (padrão: benchmarks/benchmark_<data>.json)')
+    parser.add_argument('--comparar', nargs=2, metavar=('ANTIGO', 'NOVO'),
+                        help='compara dois JSON em vez de medir')
+    parser.add_argument('--limiar', type=float, default=LIMIAR_REGRESSAO,
+                        help=f'piora relativa considerada regressão (padrão: {LIMIAR_REGRESSAO})')
+    return parser.parse_args()
+
+
+def main():
+    args = _argumentos()
+    if args.comparar:
+        return 1 if comparar(*args.comparar, limiar=args.limiar) else 0
+
+    try:
+        heuristicas = ([APELIDOS[h] for h in _lista(args.heuristicas, str)]
+                       if args.heuristicas else list(HEURISTICAS))
+    except KeyError as e:
+        sys.exit(f'heurística desconhecida: {e.args[0]} (opções: {", ".join(APELIDOS)})')
+    m_valores = _lista(args.m, int) if args.m else CONJUNTO_M
+    r_valores = _lista(args.r_valores, float) if args.r_valores else CONJUNTO_R
+
+    relatorio = {
+        'versao':     VERSAO_BENCHMARK,
+        'data':       datetime.now().isoformat(timespec='seconds'),
+        'ambiente':   ambiente(),
+        'parametros': {'repeticoes': args.repeticoes, 'aquecimento': args.aquecimento,
+                       'seed': args.seed, 'm': list(m_valores), 'r': list(r_valores),
+                       'heuristicas': heuristicas, 'alpha': args.alpha},
+        'heuristicas': [],
+        'pipeline':    None,
+    }
+    if not args.sem_heuristicas:
+        print('Heurísticas (mediana do tempo de busca):')
+        relatorio['heuristicas'] = medir_heuristicas(
+            casos(m_valores, r_valores, heuristicas, args.alpha, args.seed),
+            args.repeticoes, args.aquecimento)
+    if not args.sem_pipeline:
+        print('\nPipeline do gerar_graficos.py:')
+        relatorio['pipeline'] = medir_pipeline(args.arquivo, args.repeticoes, args.seed)
+
+    caminho = args.saida
+    if caminho is None:
+        os.makedirs(PASTA_BENCHMARKS, exist_ok=True)
+        caminho = os.path.join(PASTA_BENCHMARKS, f'benchmark_{datetime.now():%d_%m_%Y_%H_%M}.json')
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(relatorio, f, ensure_ascii=False, indent=1)
+    print(f'\nBenchmark gravado em {caminho}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
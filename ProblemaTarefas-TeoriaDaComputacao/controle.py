@@ -0,0 +1,716 @@
+"""
+controle.py
+===========
+Versão em Python de Controle.Executar: roda as replicações das três
+heurísticas e grava um Resultado_*.txt no mesmo formato do programa .NET, que
+o gerar_graficos.py lê sem mudanças.
+
+As replicações são independentes e rodam num pool de processos. Cada uma
+recebe o próprio fluxo aleatório derivado de `--seed` (SeedSequence.spawn),
+então o resultado não depende de qual processo executou a replicação nem da
+ordem em que terminou.
+
+Além do sorteio de Controle.cs, há o modo grade (--grade): um fatorial
+completo de m × r × alpha × heurística com um número fixo de replicações por
+célula, descrito num arquivo JSON e/ou na linha de comando. As células são
+agendadas da maior para a menor e as replicações que já estão no arquivo de
+saída são puladas, então uma varredura interrompida continua de onde parou.
+
+Com --pareado (números aleatórios comuns), cada instância é gerada uma vez a
+partir de uma semente gravada na linha (coluna opcional instancia=<semente>) e
+resolvida por todas as heurísticas — e por todos os alphas da BLM — antes da
+próxima. As comparações passam a ser diferenças pareadas na mesma instância.
+
+Com --binario, grava também Resultado_X.res: registros de largura fixa com
+esquema explícito no cabeçalho, que o gerar_graficos.py abre via memmap sem
+parse (ver EscritorBinario).
+
+Com --trajetoria, cada replicação guarda a curva de convergência (iteração,
+tempo, makespan; ver resolucao_tarefas.Trajetoria) e todas vão para
+Resultado_X.traj.npz, que o gerar_graficos.py usa na figura de convergência.
+
+Com --perfil, cada linha ganha as colunas opcionais perfil_<fase>_ms e
+perfil_<fase>_n (tempo próprio e chamadas de cada fase do laço; ver
+resolucao_tarefas.Perfil), que o gerar_graficos.py mostra em barras empilhadas.
+
+Toda linha leva a coluna opcional gap=<valor>: a distância relativa do makespan
+final ao limite inferior da instância (resolucao_tarefas.limite_inferior).
+Com --gap TOL, cada busca para assim que o gap chega a TOL.
+
+Com --partida, as buscas começam de uma solução construtiva em vez de todas as
+tarefas na máquina 0 (rodizio, guloso, lpt; ver resolucao_tarefas.PARTIDAS) e
+as linhas ganham a coluna partida=<código>. No modo grade, --partida aceita
+vários valores e vira mais uma dimensão; as partidas de uma célula resolvem
+as mesmas instâncias.
+
+Uso:
+    python controle.py --binario           # também grava o .res ao lado do .txt
+    python controle.py --trajetoria        # também grava as curvas de convergência (.traj.npz)
+    python controle.py --perfil            # colunas com o tempo de cada fase da busca
+    python controle.py --gap 0.01          # para a busca a 1% do limite inferior
+    python controle.py --partida lpt       # começa da solução LPT
+    python controle.py --grade --partida maquina0,rodizio,guloso,lpt --saida Resultado_partidas.txt
+    python controle.py --pareado --seed 7  # mesma instância para todas as heurísticas
+    python controle.py                     # 11 replicações por heurística, todos os núcleos
+    python controle.py --seed 42 -j 4      # reprodutível, 4 processos
+    python controle.py --ordenado          # grava na ordem de Controle.cs
+    python controle.py --grade varredura.json --saida Resultado_varredura.txt
+    python controle.py --grade --m 10,20 --r-valores 1.5,2 --heuristicas melhor,blm -r 5
+    python controle.py --grade --heuristicas melhor,trocas --saida Resultado_trocas.txt
+
+Arquivo de grade (todas as chaves são opcionais; o padrão é o de Controle.cs):
+    {"m": [10, 20, 50], "r": [1.5, 2.0], "alpha": [0.1, 0.5, 0.9],
+     "heuristicas": ["primeira", "melhor", "blm", "trocas"], "replicacoes": 5,
+     "partidas": ["maquina0", "lpt"]}
+"""
+
+import os
+import sys
+import argparse
+import heapq
+import json
+import itertools
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from resolucao_tarefas import (ResolucaoTarefas, Trajetoria, Perfil, HEURISTICAS, PRIMEIRA_ESCOLHA,
+                               MELHOR_ESCOLHA, BLM_RANDOMIZADA, MELHOR_TROCA, PARTIDAS)
+
+CONJUNTO_M     = (10, 20, 50)
+CONJUNTO_R     = (1.5, 2.0)
+CONJUNTO_ALPHA = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9)
+
+REPLICACOES = 11
+
+# As heurísticas de Controle.cs, usadas por padrão; as demais de HEURISTICAS
+# (ex.: trocas) entram pela grade
+HEURISTICAS_CONTROLE = (PRIMEIRA_ESCOLHA, MELHOR_ESCOLHA, BLM_RANDOMIZADA)
+
+# Tolerância de gap que encerra a busca (--gap); None busca até o fim
+TOLERANCIA_GAP = None
+
+# Nomes curtos aceitos na grade e na linha de comando
+APELIDOS = {
+    'primeira': PRIMEIRA_ESCOLHA,
+    'melhor':   MELHOR_ESCOLHA,
+    'blm':      BLM_RANDOMIZADA,
+    'trocas':   MELHOR_TROCA,
+}
+
+# Colunas opcionais gravadas com --perfil
+COLUNAS_PERFIL = tuple(Perfil().colunas())
+
+CABECALHO = 'Heurística, n, m, replicação, tempo, iterações, makespan inicial, makespan final, parametro'
+
+PASTA_RESULTADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                'Resultados', 'Resultados_Tarefas')
+
+
+# ── Formato do arquivo ───────────────────────────────────────────────────────
+def _decimal(v):
+    """Número com vírgula decimal, como o double.ToString() do .NET em pt-BR."""
+    return f'{v:.4f}'.rstrip('0').rstrip('.').replace('.', ',')
+
+
+def formatar_linha(reg, extras=None):
+    """Linha do Resultado_*.txt; `extras` viram colunas chave=valor no fim."""
+    heuristica = reg['heuristica']
+    alpha = _decimal(reg['alpha']) if heuristica == BLM_RANDOMIZADA else 'NA'
+    linha = (f"{heuristica}, {reg['n']}, {reg['m']}, {reg['rep']}, {_decimal(reg['tempo'])} ms, "
+             f"{reg['iteracoes']}, {reg['mk_inicial']}, {reg['mk_final']}, {alpha}")
+    for chave, valor in (extras or {}).items():
+        linha += f', {chave}={valor}'
+    return linha
+
+
+class EscritorBinario:
+    """Formato binário de resultados: cabeçalho com esquema + registros fixos.
+
+    Layout do arquivo .res:
+        8 bytes   b'RESTAREF'
+        4 bytes   tamanho do cabeçalho (uint32, little-endian)
+        cabeçalho JSON {"versao", "campos": [[nome, dtype], ...], "heuristicas"},
+                  completado com espaços até múltiplo de 8 bytes
+        registros de largura fixa, um por replicação, no dtype dos campos
+
+    `heuristica` é um código int8 indexando "heuristicas"; alpha NA é NaN.
+    Um registro parcial no fim (escrita interrompida) é ignorado pelo leitor.
+    """
+    MAGICO = b'RESTAREF'
+    VERSAO = 1
+    CAMPOS = [
+        ('heuristica', '<i1'), ('n', '<i8'), ('m', '<i8'), ('rep', '<i8'),
+        ('tempo', '<f8'), ('iteracoes', '<i8'), ('mk_inicial', '<i8'),
+        ('mk_final', '<i8'), ('alpha', '<f8'),
+    ]
+
+    def __init__(self, caminho, extras=()):
+        self.caminho = caminho
+        self.heuristicas = list(HEURISTICAS)
+        campos = self.CAMPOS + [(c, '<f8') for c in extras]
+        self.dtype = np.dtype(campos)
+
+        if os.path.exists(caminho) and os.path.getsize(caminho) > 0:
+            esquema = self.ler_cabecalho(caminho)
+            if [tuple(c) for c in esquema['campos']] != campos:
+                raise ValueError(f'{caminho}: esquema diferente do atual, '
+                                 f'não é possível acrescentar registros')
+            self.heuristicas = esquema['heuristicas']
+            self.arquivo = open(caminho, 'r+b')
+            # Descarta um registro parcial deixado por uma escrita interrompida
+            dados = os.path.getsize(caminho) - esquema['inicio']
+            self.arquivo.truncate(esquema['inicio'] + dados - dados % self.dtype.itemsize)
+            self.arquivo.seek(0, os.SEEK_END)
+        else:
+            cabecalho = json.dumps({'versao': self.VERSAO, 'campos': campos,
+                                    'heuristicas': self.heuristicas}).encode('utf-8')
+            cabecalho += b' ' * (-(len(self.MAGICO) + 4 + len(cabecalho)) % 8)
+            self.arquivo = open(caminho, 'wb')
+            self.arquivo.write(self.MAGICO + len(cabecalho).to_bytes(4, 'little') + cabecalho)
+
+    @classmethod
+    def ler_cabecalho(cls, caminho):
+        with open(caminho, 'rb') as f:
+            if f.read(len(cls.MAGICO)) != cls.MAGICO:
+                raise ValueError(f'{caminho}: não é um arquivo de resultados binário')
+            tamanho = int.from_bytes(f.read(4), 'little')
+            esquema = json.loads(f.read(tamanho))
+        esquema['inicio'] = len(cls.MAGICO) + 4 + tamanho
+        return esquema
+
+    @classmethod
+    def contar(cls, caminho):
+        """Registros completos gravados no .res."""
+        esquema = cls.ler_cabecalho(caminho)
+        itemsize = np.dtype([tuple(c) for c in esquema['campos']]).itemsize
+        return (os.path.getsize(caminho) - esquema['inicio']) // itemsize
+
+    def gravar(self, reg, extras=None):
+        valores = dict(reg, **(extras or {}))
+        valores['heuristica'] = self.heuristicas.index(reg['heuristica'])
+        if reg['heuristica'] != BLM_RANDOMIZADA:
+            valores['alpha'] = np.nan
+        registro = np.array([tuple(valores[c] for c in self.dtype.names)], dtype=self.dtype)
+        self.arquivo.write(registro.tobytes())
+        self.arquivo.flush()
+
+    def fechar(self):
+        self.arquivo.close()
+
+
+class GravadorTrajetorias:
+    """Curvas de convergência de todas as replicações num único .traj.npz.
+
+    Arrays do arquivo:
+        categorias                      nomes das heurísticas
+        heuristica, n, m, rep, alpha    uma entrada por replicação (alpha NA = NaN)
+        inicio                          deslocamentos: a replicação k ocupa
+                                        [inicio[k], inicio[k+1]) dos pontos
+        iteracao, tempo, makespan       pontos de todas as replicações, em sequência
+
+    Cada curva vai na hora para um diário ao lado (.traj.npz.parcial, só
+    acréscimos: um CABECALHO seguido dos PONTOs) e é enviada ao disco com a
+    linha do .txt. `fechar` junta o diário ao .traj.npz e o apaga; ao
+    acrescentar (modo grade), as curvas do .traj.npz e as de um diário
+    deixado por uma execução interrompida são mantidas.
+    """
+    CABECALHO = np.dtype([('heuristica', '<i1'), ('n', '<i8'), ('m', '<i8'), ('rep', '<i8'),
+                          ('alpha', '<f8'), ('pontos', '<i8')])
+    PONTO = np.dtype([('iteracao', '<i8'), ('tempo', '<f8'), ('makespan', '<i8')])
+
+    def __init__(self, caminho, acrescentar=False):
+        self.caminho = caminho
+        self.diario = caminho + '.parcial'
+        self.categorias = list(HEURISTICAS)
+        self.replicacoes = []
+        self.pontos = []
+        if acrescentar and os.path.exists(caminho):
+            with np.load(caminho) as antigo:
+                categorias = [str(c) for c in antigo['categorias']]
+                inicio = antigo['inicio']
+                for k in range(len(inicio) - 1):
+                    fatia = slice(inicio[k], inicio[k + 1])
+                    self.replicacoes.append((categorias[antigo['heuristica'][k]], antigo['n'][k],
+                                             antigo['m'][k], antigo['rep'][k], antigo['alpha'][k]))
+                    self.pontos.append(tuple(antigo[c][fatia]
+                                             for c in ('iteracao', 'tempo', 'makespan')))
+        completo = self._ler_diario() if acrescentar else 0
+        self.arquivo = open(self.diario, 'r+b' if completo else 'wb')
+        # Descarta um registro parcial deixado por uma escrita interrompida
+        self.arquivo.truncate(completo)
+        self.arquivo.seek(completo)
+
+    def _ler_diario(self):
+        """Carrega as curvas do diário; retorna o tamanho da parte completa."""
+        if not os.path.exists(self.diario):
+            return 0
+        with open(self.diario, 'rb') as f:
+            bloco = f.read()
+        pos = 0
+        while pos + self.CABECALHO.itemsize <= len(bloco):
+            cab = np.frombuffer(bloco, self.CABECALHO, count=1, offset=pos)[0]
+            fim = pos + self.CABECALHO.itemsize + int(cab['pontos']) * self.PONTO.itemsize
+            if fim > len(bloco):
+                break
+            pontos = np.frombuffer(bloco, self.PONTO, count=int(cab['pontos']),
+                                   offset=pos + self.CABECALHO.itemsize)
+            self.replicacoes.append((self.categorias[cab['heuristica']], cab['n'], cab['m'],
+                                     cab['rep'], cab['alpha']))
+            self.pontos.append(tuple(pontos[c].copy() for c in self.PONTO.names))
+            pos = fim
+        return pos
+
+    def gravar(self, reg, pontos):
+        alpha = reg['alpha'] if reg['heuristica'] == BLM_RANDOMIZADA else np.nan
+        self.replicacoes.append((reg['heuristica'], reg['n'], reg['m'], reg['rep'], alpha))
+        self.pontos.append(pontos)
+
+        cab = np.array([(self.categorias.index(reg['heuristica']), reg['n'], reg['m'],
+                         reg['rep'], alpha, len(pontos[0]))], dtype=self.CABECALHO)
+        tabela = np.empty(len(pontos[0]), dtype=self.PONTO)
+        for c, valores in zip(self.PONTO.names, pontos):
+            tabela[c] = valores
+        self.arquivo.write(cab.tobytes() + tabela.tobytes())
+        self.arquivo.flush()
+
+    def fechar(self):
+        self.arquivo.close()
+        if self.replicacoes:
+            h, n, m, rep, alpha = zip(*self.replicacoes)
+            tamanhos = [len(p[0]) for p in self.pontos]
+            base = os.path.splitext(self.caminho)[0]   # np.savez exige a extensão .npz
+            np.savez(base + '.tmp.npz',
+                     categorias=np.array(self.categorias),
+                     heuristica=np.array([self.categorias.index(x) for x in h], dtype=np.int8),
+                     n=np.array(n, dtype=np.int64), m=np.array(m, dtype=np.int64),
+                     rep=np.array(rep, dtype=np.int64), alpha=np.array(alpha, dtype=np.float64),
+                     inicio=np.concatenate([[0], np.cumsum(tamanhos)]).astype(np.int64),
+                     iteracao=np.concatenate([p[0] for p in self.pontos]).astype(np.int64),
+                     tempo=np.concatenate([p[1] for p in self.pontos]).astype(np.float64),
+                     makespan=np.concatenate([p[2] for p in self.pontos]).astype(np.int64))
+            os.replace(base + '.tmp.npz', self.caminho)
+        os.remove(self.diario)
+
+
+# ── Replicações ───────────────────────────────────────────────────────────────
+def executar_celula(heuristica, n, m, alpha, rep, rng, trajetoria=False, perfil=False,
+                    tolerancia_gap=None, partida=PARTIDAS[0]):
+    """Roda uma replicação com parâmetros fixos e devolve o registro (dict).
+
+    Com `trajetoria`, o registro leva também 'trajetoria': os arrays
+    (iterações, tempos, makespans) de `Trajetoria.pontos()`. Com `perfil`,
+    leva 'perfil': as colunas de `Perfil.colunas()`.
+    """
+    rastro = Trajetoria() if trajetoria else None
+    medidor = Perfil() if perfil else None
+    resolucao = ResolucaoTarefas(n, m, alpha, rng=rng, trajetoria=rastro, perfil=medidor,
+                                 tolerancia_gap=tolerancia_gap, partida=partida)
+    res = HEURISTICAS[heuristica](resolucao)
+    reg = dict(heuristica=heuristica, n=n, m=m, rep=rep, **res)
+    if rastro is not None:
+        reg['trajetoria'] = tuple(a.copy() for a in rastro.pontos())
+    if medidor is not None:
+        reg['perfil'] = medidor.colunas()
+    return reg
+
+
+def executar_replicacao(heuristica, rep, semente, parametros=None, trajetoria=False,
+                        perfil=False, tolerancia_gap=None, partida=PARTIDAS[0]):
+    """Roda uma replicação; sem `parametros`, sorteia m, r (e alpha) como Controle.cs.
+
+    `parametros` é (n, m, alpha) ou, na grade com várias partidas,
+    (n, m, alpha, partida).
+    """
+    rng = np.random.default_rng(semente)
+    if parametros is not None:
+        n, m, alpha = parametros[:3]
+        partida = parametros[3] if len(parametros) > 3 else partida
+        return executar_celula(heuristica, n, m, alpha, rep, rng, trajetoria, perfil,
+                               tolerancia_gap, partida)
+
+    m = int(rng.choice(CONJUNTO_M))
+    r = float(rng.choice(CONJUNTO_R))
+    alpha = float(rng.choice(CONJUNTO_ALPHA)) if heuristica == BLM_RANDOMIZADA else 0.0
+    n = int(m ** r)
+    return executar_celula(heuristica, n, m, alpha, rep, rng, trajetoria, perfil, tolerancia_gap,
+                           partida)
+
+
+def _tarefas(replicacoes, seed):
+    """(índice, heurística, replicação, semente, None, False) na ordem de Controle.cs."""
+    nomes = list(HEURISTICAS_CONTROLE)
+    sementes = np.random.SeedSequence(seed).spawn(len(nomes) * replicacoes)
+    return [(i * replicacoes + rep, h, rep, sementes[i * replicacoes + rep], None, False)
+            for i, h in enumerate(nomes) for rep in range(replicacoes)]
+
+
+def _semente_instancia(seq):
+    """Semente inteira de 32 bits (cabe exata numa coluna float64 do leitor)."""
+    return int(seq.generate_state(1)[0])
+
+
+def _execucoes_pareadas(heuristicas, alphas):
+    """(heurística, alpha) que resolvem cada instância no modo pareado."""
+    for h in heuristicas:
+        for alpha in (alphas if h == BLM_RANDOMIZADA else [0.0]):
+            yield h, alpha
+
+
+def _tarefas_pareadas(replicacoes, seed):
+    """Uma instância sorteada por replicação, resolvida por todas as heurísticas."""
+    tarefas = []
+    for rep, seq in enumerate(np.random.SeedSequence(seed).spawn(replicacoes)):
+        rng = np.random.default_rng(seq)
+        m = int(rng.choice(CONJUNTO_M))
+        n = int(m ** float(rng.choice(CONJUNTO_R)))
+        instancia = _semente_instancia(seq)
+        for h, alpha in _execucoes_pareadas(HEURISTICAS_CONTROLE, CONJUNTO_ALPHA):
+            tarefas.append((len(tarefas), h, rep, instancia, (n, m, alpha), True))
+    return tarefas
+
+
+def _executar_tarefa(tarefa, trajetoria=False, perfil=False, tolerancia_gap=None, partida=None):
+    """Roda a tarefa e separa as colunas opcionais; com `partida` (ou uma
+    partida nos parâmetros da célula), grava a coluna partida=<código>."""
+    indice, heuristica, rep, semente, parametros, pareado = tarefa
+    if parametros is not None and len(parametros) > 3:
+        partida = parametros[3]
+    reg = executar_replicacao(heuristica, rep, semente, parametros, trajetoria, perfil,
+                              tolerancia_gap, partida or PARTIDAS[0])
+    extras = {'instancia': semente} if pareado else {}
+    extras['gap'] = round(reg.pop('gap'), 6)
+    if partida is not None:
+        extras['partida'] = PARTIDAS.index(partida)
+    for coluna, valor in reg.pop('perfil', {}).items():
+        extras[coluna] = round(valor, 4)   # ms com 4 casas, como o tempo
+    return indice, heuristica, reg, extras
+
+
+# ── Grade fatorial ────────────────────────────────────────────────────────────
+class Grade:
+    """Especificação de uma varredura fatorial completa.
+
+    Cada célula é (heurística, m, r, alpha, partida); alpha só varia na BLM
+    randomizada (nas outras heurísticas é uma célula só, com alpha NA).
+    """
+
+    def __init__(self, m=CONJUNTO_M, r=CONJUNTO_R, alpha=CONJUNTO_ALPHA,
+                 heuristicas=HEURISTICAS_CONTROLE, replicacoes=REPLICACOES,
+                 partidas=PARTIDAS[:1]):
+        self.m = [int(v) for v in m]
+        self.r = [float(v) for v in r]
+        self.alpha = [float(v) for v in alpha]
+        self.heuristicas = [APELIDOS.get(h, h) for h in heuristicas]
+        self.replicacoes = int(replicacoes)
+        self.partidas = list(partidas)
+        desconhecidas = [h for h in self.heuristicas if h not in HEURISTICAS]
+        if desconhecidas:
+            raise ValueError(f'heurísticas desconhecidas: {desconhecidas} '
+                             f'(opções: {list(APELIDOS)} ou {list(HEURISTICAS)})')
+        desconhecidas = [p for p in self.partidas if p not in PARTIDAS]
+        if desconhecidas:
+            raise ValueError(f'partidas desconhecidas: {desconhecidas} (opções: {list(PARTIDAS)})')
+
+    def celulas(self):
+        """(heurística, n, m, r, alpha) em ordem canônica.
+
+        As partidas não entram aqui: todas as partidas de uma célula usam as
+        mesmas sementes, ou seja, resolvem as mesmas instâncias.
+        """
+        for h, m, r in itertools.product(self.heuristicas, self.m, self.r):
+            alphas = self.alpha if h == BLM_RANDOMIZADA else [0.0]
+            for alpha in alphas:
+                yield h, int(m ** r), m, r, alpha
+
+
+def _chave_semente(heuristica, m, r, alpha, rep):
+    """spawn_key de uma replicação da grade: só os valores da própria célula.
+
+    Incluir ou tirar valores da grade entre execuções não muda as instâncias
+    das outras células. r e alpha entram como inteiros (centésimos e
+    milésimos); a heurística, pela posição em HEURISTICAS.
+    """
+    return (list(HEURISTICAS).index(heuristica), m, round(r * 100), round(alpha * 1000), rep)
+
+
+def _chave(heuristica, n, m, alpha, partida=PARTIDAS[0]):
+    return (heuristica, n, m, round(alpha, 4) if heuristica == BLM_RANDOMIZADA else None,
+            partida)
+
+
+def contar_existentes(caminho):
+    """Quantas replicações de cada célula já estão gravadas no arquivo."""
+    contagem = {}
+    if not os.path.exists(caminho):
+        return contagem
+    with open(caminho, encoding='utf-8-sig') as f:
+        for linha in f:
+            partes = [p.strip() for p in linha.split(',')]
+            partida = PARTIDAS[0]
+            while partes and '=' in partes[-1]:  # colunas opcionais chave=valor
+                chave, _, valor = partes.pop().partition('=')
+                if chave.strip() == 'partida':
+                    partida = PARTIDAS[int(float(valor))]
+            # tempo e alpha podem estar partidos pela vírgula decimal: localiza
+            # o campo "... ms" e lê o resto a partir dele
+            fim_tempo = next((i for i, p in enumerate(partes) if p.endswith(' ms')), None)
+            if fim_tempo is None or len(partes) < fim_tempo + 5:
+                continue
+            try:
+                h, n, m = partes[0], int(partes[1]), int(partes[2])
+                resto = '.'.join(partes[fim_tempo + 4:])
+                alpha = 0.0 if resto.upper() == 'NA' else float(resto)
+            except ValueError:
+                continue
+            k = _chave(h, n, m, alpha, partida)
+            contagem[k] = contagem.get(k, 0) + 1
+    return contagem
+
+
+def _tarefas_grade(grade, seed, existentes, pareado=False):
+    """Replicações que faltam, da célula mais cara para a mais barata.
+
+    A semente de cada replicação depende só dos valores da célula e da
+    replicação (_chave_semente), então retomar uma varredura com a mesma
+    semente produz as mesmas instâncias que uma execução direta, mesmo que a
+    grade tenha ganhado ou perdido valores. No modo pareado ela depende só de (m, n, replicação):
+    todas as heurísticas e alphas da mesma célula (m, r) veem a mesma instância.
+    As partidas nunca mudam a semente. Com mais de uma partida (ou outra que
+    não a padrão), a partida vai como quarto parâmetro e vira coluna.
+    """
+    raiz = np.random.SeedSequence(seed)
+    if seed is None:
+        print(f'semente: {raiz.entropy} (use --seed para retomar com as mesmas instâncias)')
+    com_partida = grade.partidas != list(PARTIDAS[:1])
+    pendentes = []
+    for h, n, m, r, alpha in grade.celulas():
+        for partida in grade.partidas:
+            feitas = existentes.get(_chave(h, n, m, alpha, partida), 0)
+            parametros = (n, m, alpha, partida) if com_partida else (n, m, alpha)
+            for rep in range(feitas, grade.replicacoes):
+                if pareado:
+                    seq = np.random.SeedSequence(raiz.entropy, spawn_key=(m, n, rep))
+                    semente = _semente_instancia(seq)
+                else:
+                    semente = np.random.SeedSequence(raiz.entropy,
+                                                     spawn_key=_chave_semente(h, m, r, alpha, rep))
+                pendentes.append((h, rep, semente, parametros, pareado))
+
+    # Maior n primeiro: as replicações longas começam cedo e as curtas
+    # preenchem os processos no final
+    pendentes.sort(key=lambda t: (-t[3][0], t[3][1], t[1]))
+    return [(i, *t) for i, t in enumerate(pendentes)]
+
+
+def executar(caminho, replicacoes=REPLICACOES, seed=None, processos=None, ordenado=False,
+             grade=None, pareado=False, binario=False, trajetoria=False, perfil=False,
+             tolerancia_gap=TOLERANCIA_GAP, partida=PARTIDAS[0]):
+    """Roda o experimento e grava as linhas em `caminho` conforme terminam.
+
+    Com `ordenado`, segura as linhas que chegam fora de ordem e grava na ordem
+    e nos blocos de Controle.cs; sem ele, grava cada linha assim que termina.
+    Cada linha é enviada ao disco imediatamente (útil com --acompanhar).
+
+    Com `grade`, roda a varredura fatorial, acrescentando ao arquivo apenas as
+    replicações que ainda não estão nele. Com `pareado`, cada instância é
+    resolvida por todas as heurísticas (e alphas) e a semente vai na linha.
+    Com `binario`, os mesmos registros vão também para o .res ao lado. Com
+    `trajetoria`, as curvas de convergência vão para o .traj.npz ao lado. Com
+    `perfil`, cada linha leva os tempos por fase em colunas opcionais. Com
+    `tolerancia_gap`, cada busca para quando o gap chega à tolerância. `partida`
+    é a solução inicial fora da grade (na grade, `grade.partidas`).
+    """
+    existentes = {}
+    if grade is not None:
+        existentes = contar_existentes(caminho)
+        tarefas = _tarefas_grade(grade, seed, existentes, pareado)
+        modo = 'a'
+        print(f'{len(tarefas)} replicações pendentes')
+    elif pareado:
+        tarefas, modo = _tarefas_pareadas(replicacoes, seed), 'w'
+    else:
+        tarefas, modo = _tarefas(replicacoes, seed), 'w'
+    processos = processos or os.cpu_count() or 1
+    if grade is not None:
+        com_partida, partida = grade.partidas != list(PARTIDAS[:1]), None
+    else:
+        com_partida = partida != PARTIDAS[0]
+        partida = partida if com_partida else None
+
+    escritor = None
+    caminho_res = os.path.splitext(caminho)[0] + '.res'
+    if binario:
+        if modo == 'w' and os.path.exists(caminho_res):
+            os.remove(caminho_res)
+        no_texto = sum(existentes.values())
+        no_res = EscritorBinario.contar(caminho_res) if os.path.exists(caminho_res) else 0
+        if no_res != no_texto:
+            # O .res ficaria sem parte das linhas e o leitor o preferiria ao .txt
+            print(f'Aviso: {caminho} tem {no_texto} linhas e {caminho_res} tem {no_res} '
+                  f'registros; gravando apenas o texto')
+        else:
+            extras = ((('instancia',) if pareado else ()) + ('gap',)
+                      + (('partida',) if com_partida else ()) + (COLUNAS_PERFIL if perfil else ()))
+            escritor = EscritorBinario(caminho_res, extras=extras)
+    elif modo == 'a' and os.path.exists(caminho_res):
+        print(f'Aviso: {caminho_res} não vai receber as linhas novas (sem --binario); '
+              f'o gerar_graficos.py passa a ler o .txt')
+
+    gravador = None
+    if trajetoria:
+        gravador = GravadorTrajetorias(os.path.splitext(caminho)[0] + '.traj.npz',
+                                       acrescentar=modo == 'a')
+
+    # Fecha os gravadores mesmo com erro ou Ctrl+C: cada linha já gravada no
+    # .txt mantém o registro do .res e a curva do .traj.npz
+    try:
+        novo = modo == 'w' or not os.path.exists(caminho) or os.path.getsize(caminho) == 0
+        with open(caminho, modo, encoding='utf-8-sig' if novo else 'utf-8', newline='\n') as f:
+            if novo:
+                f.write(CABECALHO + '\n\n')
+
+            proximo, espera, ultimo_bloco = 0, [], None
+
+            def gravar(heuristica, reg, extras):
+                nonlocal ultimo_bloco
+                if ordenado and not pareado and ultimo_bloco not in (None, heuristica):
+                    f.write('\n\n')
+                ultimo_bloco = heuristica
+                pontos = reg.pop('trajetoria', None)
+                f.write(formatar_linha(reg, extras) + '\n')
+                f.flush()
+                if escritor is not None:
+                    escritor.gravar(reg, extras)
+                if gravador is not None:
+                    gravador.gravar(reg, pontos)
+
+            def receber(indice, heuristica, reg, extras):
+                nonlocal proximo
+                if not ordenado:
+                    gravar(heuristica, reg, extras)
+                    return
+                heapq.heappush(espera, (indice, heuristica, reg, extras))
+                while espera and espera[0][0] == proximo:
+                    _, h, r, e = heapq.heappop(espera)
+                    gravar(h, r, e)
+                    proximo += 1
+
+            if processos <= 1:
+                for tarefa in tarefas:
+                    receber(*_executar_tarefa(tarefa, trajetoria, perfil, tolerancia_gap,
+                                              partida))
+            else:
+                with ProcessPoolExecutor(max_workers=processos) as pool:
+                    futuros = [pool.submit(_executar_tarefa, t, trajetoria, perfil, tolerancia_gap,
+                                           partida) for t in tarefas]
+                    for futuro in as_completed(futuros):
+                        receber(*futuro.result())
+    finally:
+        if escritor is not None:
+            escritor.fechar()
+        if gravador is not None:
+            gravador.fechar()
+    return caminho
+
+
+def _argumentos():
+    parser = argparse.ArgumentParser(description='Executa o experimento das heurísticas.')
+    parser.add_argument('-r', '--replicacoes', type=int, default=None,
+                        help=f'replicações por heurística ou, na grade, por célula; '
+                             f'tem precedência sobre o JSON (padrão: {REPLICACOES})')
+    parser.add_argument('-j', '--processos', type=int, default=None,
+                        help='processos em paralelo (padrão: todos os núcleos)')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='semente raiz; torna o experimento reprodutível')
+    parser.add_argument('--ordenado', action='store_true',
+                        help='grava na ordem de Controle.cs em vez da ordem de término')
+    parser.add_argument('--saida', default=None,
+                        help='arquivo de saída (padrão: Resultados/Resultados_Tarefas/Resultado_<data>.txt)')
+    parser.add_argument('--binario', action='store_true',
+                        help='grava também o formato binário .res ao lado do .txt')
+    parser.add_argument('--trajetoria', action='store_true',
+                        help='grava as curvas de convergência de cada replicação (.traj.npz)')
+    parser.add_argument('--perfil', action='store_true',
+                        help='grava o tempo e as chamadas de cada fase da busca em colunas extras')
+    parser.add_argument('--gap', type=float, default=TOLERANCIA_GAP, metavar='TOL',
+                        help='para cada busca quando o gap ao limite inferior chega a TOL '
+                             '(ex.: 0.01; 0 = só no ótimo comprovado)')
+    parser.add_argument('--partida', default=None,
+                        help=f'solução inicial: {",".join(PARTIDAS)} '
+                             f'(padrão: {PARTIDAS[0]}; vários separados por vírgula na grade)')
+    parser.add_argument('--pareado', action='store_true',
+                        help='números aleatórios comuns: cada instância passa por todas as heurísticas')
+    parser.add_argument('--grade', nargs='?', const='', default=None, metavar='JSON',
+                        help='modo grade fatorial, opcionalmente lido de um arquivo JSON')
+    parser.add_argument('--m', help='grade: valores de m separados por vírgula')
+    parser.add_argument('--r-valores', metavar='R',
+                        help='grade: valores de r (n = m^r) separados por vírgula; '
+                             'não confundir com -r, as replicações')
+    parser.add_argument('--alpha', help='grade: valores de alpha separados por vírgula')
+    parser.add_argument('--heuristicas', help=f'grade: {",".join(APELIDOS)}')
+    args = parser.parse_args()
+
+    if args.grade is not None:
+        try:
+            args.grade = _grade(args)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+    if args.replicacoes is None:
+        args.replicacoes = REPLICACOES
+    return args
+
+
+# Chaves aceitas no arquivo JSON da grade (os parâmetros de Grade)
+CHAVES_GRADE = ('m', 'r', 'alpha', 'heuristicas', 'replicacoes', 'partidas')
+
+
+def _grade(args):
+    """Monta a grade: arquivo JSON (se houver) sobrescrito pelas opções passadas na linha."""
+    spec = {}
+    if args.grade:
+        with open(args.grade, encoding='utf-8') as f:
+            spec = json.load(f)
+        if not isinstance(spec, dict):
+            raise ValueError(f'{args.grade}: a grade deve ser um objeto JSON')
+        desconhecidas = sorted(set(spec) - set(CHAVES_GRADE))
+        if desconhecidas:
+            raise ValueError(f'{args.grade}: chaves desconhecidas: {", ".join(desconhecidas)} '
+                             f'(opções: {", ".join(CHAVES_GRADE)})')
+    for campo, opcao in (('m', 'm'), ('r', 'r_valores'), ('alpha', 'alpha'),
+                         ('heuristicas', 'heuristicas')):
+        valor = getattr(args, opcao)
+        if valor:
+            spec[campo] = [v.strip() for v in valor.split(',') if v.strip()]
+    if args.partida:
+        spec['partidas'] = [v.strip() for v in args.partida.split(',') if v.strip()]
+    if args.replicacoes is not None:
+        spec['replicacoes'] = args.replicacoes
+    return Grade(**spec)
+
+
+def main():
+    args = _argumentos()
+    grade = args.grade
+    partida = args.partida or PARTIDAS[0]
+    if grade is None and partida not in PARTIDAS:
+        sys.exit(f'partida desconhecida: {partida} (opções: {", ".join(PARTIDAS)}; '
+                 f'várias partidas só no modo grade)')
+    caminho = args.saida
+    if caminho is None:
+        if grade is not None:
+            sys.exit('o modo grade precisa de --saida (o arquivo que será retomado)')
+        os.makedirs(PASTA_RESULTADOS, exist_ok=True)
+        nome = f'Resultado_{datetime.now():%d_%m_%Y_%H_%M}.txt'
+        caminho = os.path.join(PASTA_RESULTADOS, nome)
+
+    executar(caminho, replicacoes=args.replicacoes, seed=args.seed,
+             processos=args.processos, ordenado=args.ordenado, grade=grade,
+             pareado=args.pareado, binario=args.binario, trajetoria=args.trajetoria,
+             perfil=args.perfil, tolerancia_gap=args.gap, partida=partida)
+    print(f'Resultados gerados! {caminho}')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,244 @@
+"""
+multipartida.py
+===============
+BLM randomizada com várias partidas em paralelo sobre a mesma instância, com
+orçamento de tempo de parede.
+
+Cada trajetória é uma ExecutaBuscaMonotonaRandomizada com o próprio alpha
+(percorrendo `--alphas`) e a própria semente; a instância é sempre a mesma
+(semente `--instancia`). Os processos compartilham por memória compartilhada
+a incumbente: o melhor makespan visto até agora, quando foi encontrado e
+quantas iterações a trajetória dela levou para chegar lá. A cada
+INTERVALO_PARADA iterações, uma trajetória publica o próprio makespan e é
+podada se estiver acima da incumbente por mais que `--folga` depois de
+iterar tanto quanto a trajetória incumbente. Iterações, e não tempo, porque
+com mais trajetórias que núcleos o tempo de parede de cada uma depende da
+disputa pela CPU. Quando uma trajetória termina (ou é podada),
+outra começa no lugar, até o orçamento acabar.
+
+O relatório traz a melhor solução (makespan, gap ao limite inferior, alpha e
+semente da trajetória, máquina de cada tarefa no JSON), o tempo até a
+incumbente final e o tempo até o alvo: o primeiro instante em que alguma
+trajetória chegou a limite inferior × (1 + `--alvo-gap`).
+
+Uso:
+    python multipartida.py --n 2500 --m 50 --orcamento 10      # todos os núcleos
+    python multipartida.py --n 2500 --m 50 -j 4 --seed 7 --saida multi.json
+    python multipartida.py --n 400 --m 20 --alphas 0.1,0.3 --folga 0.05
+"""
+
+import os
+import sys
+import argparse
+import json
+import time
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+import numpy as np
+
+from resolucao_tarefas import ResolucaoTarefas
+from controle import CONJUNTO_ALPHA
+
+# Tempo de parede total (s) e folga relativa sobre a incumbente antes da poda
+ORCAMENTO  = 5.0
+FOLGA_PODA = 0.02
+# Gap ao limite inferior que define o alvo do tempo-até-alvo
+ALVO_GAP   = 0.01
+
+# Posições do array compartilhado
+MELHOR, T_MELHOR, I_TRAJETORIA, T_ALVO = range(4)
+
+
+# ── Estado compartilhado ─────────────────────────────────────────────────────
+class Incumbente:
+    """Melhor makespan e tempos, num RawArray de doubles protegido por um Lock.
+
+    [MELHOR]        makespan da incumbente (exato em double)
+    [T_MELHOR]      segundos desde o início da multipartida até achá-la
+    [I_TRAJETORIA]  iterações que a trajetória dela levou até achá-la
+    [T_ALVO]        segundos até o primeiro makespan ≤ alvo (-1 se nunca)
+
+    Leituras sem o lock podem ver um valor de uma publicação anterior, o que
+    só atrasa uma poda; atualizações são feitas sob o lock.
+    """
+
+    def __init__(self, makespan_inicial, inicio, alvo):
+        self.valores = mp.RawArray('d', [makespan_inicial, 0.0, 0.0, -1.0])
+        self.lock = mp.Lock()
+        self.inicio = inicio
+        self.alvo = alvo
+
+    def publicar(self, makespan, agora, iteracoes):
+        v = self.valores
+        if makespan >= v[MELHOR] and (v[T_ALVO] >= 0 or makespan > self.alvo):
+            return
+        with self.lock:
+            if makespan < v[MELHOR]:
+                v[MELHOR] = makespan
+                v[T_MELHOR] = agora - self.inicio
+                v[I_TRAJETORIA] = iteracoes
+            if makespan <= self.alvo and v[T_ALVO] < 0:
+                v[T_ALVO] = agora - self.inicio
+
+    def atrasada(self, makespan, iteracoes, folga):
+        """A trajetória já iterou o que a incumbente precisou e segue pior que ela."""
+        v = self.valores
+        return makespan > v[MELHOR] * (1 + folga) and iteracoes >= v[I_TRAJETORIA]
+
+
+# Estado de cada processo worker, preenchido uma única vez pelo inicializador
+_worker = {}
+
+
+def _inicializar_worker(incumbente, prazo, folga):
+    _worker.update(incumbente=incumbente, prazo=prazo, folga=folga)
+
+
+# ── Trajetórias ──────────────────────────────────────────────────────────────
+def executar_trajetoria(indice, n, m, alpha, instancia, semente):
+    """Uma BLM randomizada na instância `instancia`, com sorteios de `semente`.
+
+    Roda até o critério normal da BLM, o prazo global ou a poda, e devolve
+    um dict com o resultado, a causa da parada e a atribuição final.
+    """
+    incumbente, prazo, folga = _worker['incumbente'], _worker['prazo'], _worker['folga']
+    motivo = 'convergiu'
+
+    def parada(resolucao):
+        nonlocal motivo
+        agora = time.monotonic()
+        mk = resolucao.makespan_atual()
+        incumbente.publicar(mk, agora, resolucao.iteracoes)
+        if agora >= prazo:
+            motivo = 'prazo'
+        elif incumbente.atrasada(mk, resolucao.iteracoes, folga):
+            motivo = 'podada'
+        else:
+            return False
+        return True
+
+    resolucao = ResolucaoTarefas(n, m, alpha, seed=instancia, parada=parada)
+    resolucao.rng = np.random.default_rng(semente)   # mesma instância, outros sorteios
+    res = resolucao.executa_busca_monotona_randomizada()
+    incumbente.publicar(res['mk_final'], time.monotonic(), res['iteracoes'])
+    return dict(indice=indice, motivo=motivo,
+                atribuicao=resolucao.atribuicao(), **res)
+
+
+def _semente(seed, indice):
+    return np.random.SeedSequence(seed, spawn_key=(indice,))
+
+
+def multipartida(n, m, orcamento=ORCAMENTO, processos=None, seed=None, instancia=None,
+                 alphas=CONJUNTO_ALPHA, folga=FOLGA_PODA, alvo_gap=ALVO_GAP):
+    """Roda trajetórias em paralelo até o orçamento (s) e devolve o relatório (dict)."""
+    raiz = np.random.SeedSequence(seed)
+    if instancia is None:
+        instancia = int(raiz.generate_state(1)[0])
+    base = ResolucaoTarefas(n, m, seed=instancia)
+    limite = base.limite_inferior
+    alvo = int(limite * (1 + alvo_gap))
+    processos = processos or os.cpu_count() or 1
+
+    inicio = time.monotonic()
+    prazo = inicio + orcamento
+    incumbente = Incumbente(base.makespan_inicial, inicio, alvo)
+    trajetorias, melhor = [], None
+    with ProcessPoolExecutor(max_workers=processos, initializer=_inicializar_worker,
+                             initargs=(incumbente, prazo, folga)) as pool:
+        pendentes, k = set(), 0
+        while True:
+            while len(pendentes) < processos and time.monotonic() < prazo:
+                alpha = alphas[k % len(alphas)]
+                pendentes.add(pool.submit(executar_trajetoria, k, n, m, alpha,
+                                          instancia, _semente(raiz.entropy, k)))
+                k += 1
+            if not pendentes:
+                break
+            feitos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in feitos:
+                t = futuro.result()
+                atribuicao = t.pop('atribuicao')
+                trajetorias.append(t)
+                if melhor is None or t['mk_final'] < melhor['mk_final']:
+                    melhor = dict(t, atribuicao=atribuicao.tolist())
+    decorrido = time.monotonic() - inicio
+
+    v = incumbente.valores
+    return {
+        'n': n, 'm': m, 'instancia': instancia, 'processos': processos,
+        'orcamento_s': orcamento, 'decorrido_s': decorrido, 'folga': folga,
+        'mk_inicial': base.makespan_inicial, 'limite_inferior': limite,
+        'alvo': alvo, 'alvo_gap': alvo_gap,
+        'melhor': melhor,
+        'tempo_ate_melhor_s': v[T_MELHOR],
+        'tempo_ate_alvo_s': v[T_ALVO] if v[T_ALVO] >= 0 else None,
+        'trajetorias': trajetorias,
+    }
+
+
+# ── Relatório ────────────────────────────────────────────────────────────────
+def imprimir_relatorio(rel):
+    melhor, trajs = rel['melhor'], rel['trajetorias']
+    print(f"\nInstância {rel['instancia']}: n={rel['n']}, m={rel['m']}, "
+          f"makespan inicial {rel['mk_inicial']}, limite inferior {rel['limite_inferior']}")
+    print(f"{len(trajs)} trajetórias em {rel['decorrido_s']:.2f} s "
+          f"({rel['processos']} processos, orçamento {rel['orcamento_s']:g} s)")
+    motivos = {}
+    for t in trajs:
+        motivos[t['motivo']] = motivos.get(t['motivo'], 0) + 1
+    print('  ' + ', '.join(f'{q} {mot}' for mot, q in sorted(motivos.items())))
+    if melhor is None:
+        return
+    print(f"\n▸ Melhor makespan:  {melhor['mk_final']}  (gap {melhor['gap'] * 100:.2f}%, "
+          f"alpha {melhor['alpha']:g}, trajetória {melhor['indice']})")
+    print(f"    tempo até a incumbente:   {rel['tempo_ate_melhor_s']:.3f} s")
+    alvo = rel['tempo_ate_alvo_s']
+    print(f"    tempo até o alvo ≤ {rel['alvo']}: "
+          + (f'{alvo:.3f} s' if alvo is not None else 'não atingido'))
+
+    print('\n▸ Por alpha:  trajetórias, melhor makespan, mediana')
+    for alpha in sorted({t['alpha'] for t in trajs}):
+        mks = [t['mk_final'] for t in trajs if t['alpha'] == alpha]
+        print(f'    {alpha:<6g} {len(mks):>5} {min(mks):>10} {np.median(mks):>10.0f}')
+
+
+def _argumentos():
+    parser = argparse.ArgumentParser(description='BLM randomizada multipartida com orçamento de tempo.')
+    parser.add_argument('--n', type=int, required=True, help='número de tarefas')
+    parser.add_argument('--m', type=int, required=True, help='número de máquinas')
+    parser.add_argument('--orcamento', type=float, default=ORCAMENTO,
+                        help=f'tempo de parede total em segundos (padrão: {ORCAMENTO:g})')
+    parser.add_argument('-j', '--processos', type=int, default=None,
+                        help='processos em paralelo (padrão: todos os núcleos)')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='semente raiz das trajetórias (e da instância, sem --instancia)')
+    parser.add_argument('--instancia', type=int, default=None, help='semente da instância')
+    parser.add_argument('--alphas', default=None,
+                        help='alphas separados por vírgula (padrão: os de Controle.cs)')
+    parser.add_argument('--folga', type=float, default=FOLGA_PODA,
+                        help=f'folga sobre a incumbente antes da poda (padrão: {FOLGA_PODA:g})')
+    parser.add_argument('--alvo-gap', type=float, default=ALVO_GAP,
+                        help=f'gap que define o alvo do tempo-até-alvo (padrão: {ALVO_GAP:g})')
+    parser.add_argument('--saida', default=None, help='grava o relatório completo em JSON')
+    return parser.parse_args()
+
+
+def main():
+    args = _argumentos()
+    alphas = CONJUNTO_ALPHA
+    if args.alphas:
+        alphas = tuple(float(a) for a in args.alphas.split(',') if a.strip())
+    rel = multipartida(args.n, args.m, orcamento=args.orcamento, processos=args.processos,
+                       seed=args.seed, instancia=args.instancia, alphas=alphas,
+                       folga=args.folga, alvo_gap=args.alvo_gap)
+    imprimir_relatorio(rel)
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as f:
+            json.dump(rel, f, ensure_ascii=False, indent=1)
+        print(f'\nRelatório gravado em {args.saida}')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+resolucao_lote.py
+=================
+Executa K instâncias independentes de uma heurística ao mesmo tempo, como um
+único programa NumPy. Cada passo avança todas as instâncias ativas de uma vez;
+as que convergem são retiradas do lote.
+
+O estado fica em arrays 2-D com preenchimento: makespans (K × m_max) e topos
+das pilhas (K × m_max), mais um vetor único de tarefas encadeadas. Máquinas de
+preenchimento nunca são escolhidas (mascaradas nas reduções).
+
+Primeira e melhor escolha são determinísticas dada a instância, então com
+`seeds` produzem exatamente os movimentos de ResolucaoTarefas. Na BLM
+randomizada os sorteios vêm de um gerador único do lote: o resultado tem a
+mesma distribuição, mas não repete a trajetória de uma execução isolada.
+
+Uso:
+    from resolucao_lote import resolver_lote
+    resolver_lote([(100, 10, 0.0), (400, 20, 0.0)], 'Monótona melhor escolha')
+"""
+
+import time
+import numpy as np
+
+from resolucao_tarefas import (MAX_SEM_MELHORA, PRIMEIRA_ESCOLHA, MELHOR_ESCOLHA,
+                               BLM_RANDOMIZADA, limite_inferior)
+
+_GRANDE = np.iinfo(np.int64).max // 4
+
+
+def resolver_lote(instancias, heuristica, seeds=None, rng=None, tolerancia_gap=None):
+    """Resolve as instâncias (n, m, alpha) com a heurística dada, em lote.
+
+    Retorna uma lista de dicionários na ordem de entrada, com os campos de
+    `ResolucaoTarefas.resultado()` mais n e m. `tempo` é o tempo de parede
+    desde o início do lote até a instância ser retirada. `tolerancia_gap`
+    retira do lote a instância cujo gap chega à tolerância (antes da primeira
+    iteração, se já começa nela), como em ResolucaoTarefas.
+    """
+    if heuristica not in (PRIMEIRA_ESCOLHA, MELHOR_ESCOLHA, BLM_RANDOMIZADA):
+        raise ValueError(f'heurística desconhecida: {heuristica!r}')
+    instancias = [(int(n), int(m), float(a)) for n, m, a in instancias]
+    rng = rng if rng is not None else np.random.default_rng()
+    K = len(instancias)
+    if K == 0:
+        return []
+
+    ns     = np.array([n for n, _, _ in instancias], dtype=np.int64)
+    ms_qtd = np.array([m for _, m, _ in instancias], dtype=np.int64)
+    alphas = np.array([a for _, _, a in instancias])
+    m_max  = int(ms_qtd.max())
+
+    # Tarefas de todas as instâncias num vetor só; cada pilha é uma lista
+    # encadeada (topo por máquina, próximo por tarefa), como em Maquinas.
+    if seeds is None:
+        duracoes = [rng.integers(1, 100, size=n) for n in ns]
+    else:
+        duracoes = [np.random.default_rng(s).integers(1, 100, size=n)
+                    for n, s in zip(ns, seeds)]
+    duracao = np.concatenate(duracoes).astype(np.int64) if ns.sum() else np.zeros(0, np.int64)
+    inicio_tarefas = np.concatenate(([0], np.cumsum(ns)[:-1]))
+
+    # Todas as tarefas começam empilhadas na máquina 0, na ordem de geração
+    proximo = np.arange(len(duracao), dtype=np.int64) - 1
+    proximo[inicio_tarefas] = -1
+    topo = np.full((K, m_max), -1, dtype=np.int64)
+    topo[:, 0] = np.where(ns > 0, inicio_tarefas + ns - 1, -1)
+
+    carga = np.zeros((K, m_max), dtype=np.int64)
+    carga[:, 0] = [d.sum() for d in duracoes]
+    mk_inicial = carga[:, 0].copy()
+    limites = np.array([limite_inferior(d, m) for d, m in zip(duracoes, ms_qtd)], dtype=np.int64)
+    alvo = (limites * (1 + tolerancia_gap)).astype(np.int64) if tolerancia_gap is not None else None
+
+    # Penalidade que tira as máquinas de preenchimento das reduções de mínimo
+    enchimento = np.where(np.arange(m_max)[None, :] < ms_qtd[:, None], 0, _GRANDE)
+
+    iteracoes   = np.zeros(K, dtype=np.int64)
+    sem_melhora = np.zeros(K, dtype=np.int64)
+    mk_final    = np.zeros(K, dtype=np.int64)
+    tempo       = np.zeros(K)
+
+    ativos = np.flatnonzero((ns > 0) & (ms_qtd > 1))
+    # Com uma máquina não há movimento: as monótonas param na primeira
+    # iteração e a BLM esgota MAX_SEM_MELHORA tentativas, como em ResolucaoTarefas
+    iteracoes[(ns > 0) & (ms_qtd <= 1)] = MAX_SEM_MELHORA if heuristica == BLM_RANDOMIZADA else 1
+    if alvo is not None:
+        # Já no alvo desde o início (m = 1, em que o limite é Σt): nenhuma iteração
+        no_alvo = (ns > 0) & (mk_inicial <= alvo)
+        iteracoes[no_alvo] = 0
+        ativos = ativos[~no_alvo[ativos]]
+    mk_final[:] = mk_inicial
+    t0 = time.perf_counter()
+
+    while len(ativos):
+        linhas = np.arange(len(ativos))
+        c      = carga[ativos]
+        span   = np.argmax(c, axis=1)           # primeira máquina de maior makespan
+        mk     = c[linhas, span]
+        t_topo = duracao[topo[ativos, span]]
+        livre  = c + enchimento[ativos]
+
+        if heuristica == PRIMEIRA_ESCOLHA:
+            elegivel = livre < (mk - t_topo)[:, None]
+            move = elegivel.any(axis=1)
+            destino = np.argmax(elegivel, axis=1)
+        else:
+            livre[linhas, span] = _GRANDE
+            destino = np.argmin(livre, axis=1)  # melhor vizinho
+            if heuristica == BLM_RANDOMIZADA:
+                sorteio = rng.random(len(ativos)) < alphas[ativos]
+                m_at = ms_qtd[ativos]
+                aleatorio = (rng.random(len(ativos)) * (m_at - 1)).astype(np.int64)
+                aleatorio += aleatorio >= span
+                destino = np.where(sorteio, aleatorio, destino)
+            move = c[linhas, destino] + t_topo < mk
+
+        iteracoes[ativos] += 1
+
+        # Movimento vetorizado: desempilha do makespan e empilha no destino
+        r, o, d = ativos[move], span[move], destino[move]
+        k = topo[r, o]
+        topo[r, o] = proximo[k]
+        proximo[k] = topo[r, d]
+        topo[r, d] = k
+        carga[r, o] -= duracao[k]
+        carga[r, d] += duracao[k]
+
+        if heuristica == BLM_RANDOMIZADA:
+            sem_melhora[ativos] = np.where(move, 0, sem_melhora[ativos] + 1)
+            fim = sem_melhora[ativos] >= MAX_SEM_MELHORA
+        else:
+            fim = ~move
+        if alvo is not None:
+            fim |= move & (carga[ativos].max(axis=1) <= alvo[ativos])
+
+        if fim.any():
+            saem = ativos[fim]
+            mk_final[saem] = carga[saem].max(axis=1)
+            tempo[saem] = (time.perf_counter() - t0) * 1000
+            ativos = ativos[~fim]
+
+    return [{
+        'n': int(ns[i]), 'm': int(ms_qtd[i]),
+        'tempo': float(tempo[i]),
+        'iteracoes': int(iteracoes[i]),
+        'mk_inicial': int(mk_inicial[i]),
+        'mk_final': int(mk_final[i]),
+        'alpha': float(alphas[i]),
+        'gap': float((mk_final[i] - limites[i]) / limites[i]) if limites[i] > 0 else 0.0,
+    } for i in range(K)]
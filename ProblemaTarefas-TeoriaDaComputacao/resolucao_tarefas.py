@@ -0,0 +1,723 @@
+"""
+resolucao_tarefas.py
+====================
+Versão em Python/NumPy das heurísticas de ResolucaoTarefas.cs, para gerar ou
+conferir resultados sem passar pelo programa .NET.
+
+O estado é todo em arrays: um vetor de makespans e as pilhas de tarefas das
+máquinas guardadas como listas encadeadas em arrays (topo por máquina e
+próximo por tarefa), com a mesma semântica de Stack<int> de Maquina.cs.
+Por padrão, máximo, mínimo e primeiro elegível vêm de uma árvore de torneio
+(IndiceMakespan), o que custa O(log m) por movimento em vez de varrer as m
+máquinas.
+
+Com `trajetoria=Trajetoria()`, as buscas registram (iteração, tempo, makespan)
+em arrays pré-alocados, amostrados em escala logarítmica de iterações: a
+memória é fixa mesmo em execuções com milhões de iterações.
+
+Além das três buscas de ResolucaoTarefas.cs, que só movem a tarefa do topo
+da pilha, há a melhor escolha com trocas: as tarefas de cada máquina ficam num
+índice ordenado por duração (MaquinasOrdenadas) e cada passo aplica o melhor
+movimento ou troca entre a máquina do makespan e a de menor carga, achado por
+busca binária.
+
+A solução inicial é escolhida por `partida` (ver PARTIDAS): todas as tarefas
+na máquina 0, como em GerarTarefas do C# (padrão), rodízio, guloso na menor
+carga ou LPT. `mk_inicial` é o makespan dessa solução construtiva.
+
+Cada instância calcula o limite inferior do makespan ótimo (ver
+`limite_inferior`) e o resultado traz o gap final em relação a ele. Com
+`tolerancia_gap`, as buscas param assim que o gap chega à tolerância (0 para
+no ótimo comprovado), sem esperar o fim da vizinhança ou as MAX_SEM_MELHORA
+iterações da BLM.
+
+Com `perfil=Perfil()`, as fases do laço (escolha do vizinho, busca de troca,
+teste de elegibilidade, movimento e RedefineMaquinaMakespan) são contadas e
+cronometradas. Sem perfil os métodos são os originais, sem nenhum custo extra.
+
+Uso:
+    from resolucao_tarefas import ResolucaoTarefas
+    r = ResolucaoTarefas(2500, 50, seed=1)
+    print(r.executa_melhor_escolha())
+
+    r = ResolucaoTarefas(2500, 50, alpha=0.5, seed=1, tolerancia_gap=0.0)
+    print(r.executa_busca_monotona_randomizada()['gap'])   # para no limite inferior
+
+    ResolucaoTarefas(2500, 50, seed=1).executa_melhor_escolha_trocas()  # movimentos e trocas
+    ResolucaoTarefas(2500, 50, seed=1, partida='lpt').executa_melhor_escolha()
+
+    t = Trajetoria(capacidade=512)
+    ResolucaoTarefas(2500, 50, seed=1, trajetoria=t).executa_primeira_escolha()
+    iteracoes, tempos, makespans = t.pontos()
+
+    p = Perfil()
+    ResolucaoTarefas(2500, 50, seed=1, perfil=p).executa_melhor_escolha()
+    print(p.colunas())   # perfil_<fase>_ms e perfil_<fase>_n
+"""
+
+import time
+import heapq
+from bisect import bisect_left, insort
+import numpy as np
+
+# Critério de parada da BLM randomizada: iterações seguidas sem movimento
+MAX_SEM_MELHORA = 1000
+# A cada quantas iterações a BLM consulta o critério externo `parada`
+INTERVALO_PARADA = 64
+
+# Soluções iniciais; a posição na tupla é o código gravado na coluna partida=
+PARTIDAS = ('maquina0', 'rodizio', 'guloso', 'lpt')
+
+
+def limite_inferior(duracao, m):
+    """Limite inferior do makespan ótimo com m máquinas idênticas.
+
+    max(⌈Σt/m⌉, max t, t₍m₎ + t₍m+1₎): a carga média arredondada para cima,
+    a maior tarefa e, com n > m, a soma da m-ésima com a (m+1)-ésima maior
+    tarefa (entre as m+1 maiores, duas dividem uma máquina).
+    """
+    duracao = np.asarray(duracao)
+    n = len(duracao)
+    if n == 0:
+        return 0
+    limite = max(-(-int(duracao.sum()) // m), int(duracao.max()))
+    if n > m:
+        maiores = np.partition(duracao, n - m - 1)[n - m - 1:]   # as m+1 maiores
+        menores = np.partition(maiores, 1)[:2]
+        limite = max(limite, int(menores.sum()))
+    return limite
+
+
+class Maquinas:
+    """Conjunto de m máquinas com pilhas de tarefas em arrays.
+
+    `makespan[j]` é a soma das tarefas da máquina j. A pilha de j começa em
+    `topo[j]` e segue por `proximo[k]` até -1; `duracao[k]` é o tempo da
+    tarefa k. Empilhar e desempilhar são O(1), como em Maquina.cs.
+    """
+
+    def __init__(self, m, duracao):
+        self.duracao  = np.asarray(duracao, dtype=np.int64)
+        self.makespan = np.zeros(m, dtype=np.int64)
+        self.topo     = np.full(m, -1, dtype=np.int64)
+        self.proximo  = np.full(len(self.duracao), -1, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.makespan)
+
+    def adicionar_tarefa(self, j, k):
+        self.proximo[k] = self.topo[j]
+        self.topo[j]    = k
+        self.makespan[j] += self.duracao[k]
+
+    def retira_tarefa(self, j):
+        k = self.topo[j]
+        self.topo[j] = self.proximo[k]
+        self.makespan[j] -= self.duracao[k]
+        return k
+
+    def tarefa_topo(self, j):
+        """Duração da tarefa no topo da pilha de j (equivale a Tarefas.Peek())."""
+        return self.duracao[self.topo[j]]
+
+    def tarefas(self, j):
+        """Durações da pilha de j, do topo para a base."""
+        saida, k = [], self.topo[j]
+        while k != -1:
+            saida.append(int(self.duracao[k]))
+            k = self.proximo[k]
+        return saida
+
+
+def construir_partida(maquinas, partida):
+    """Distribui as tarefas de `maquinas` (vazias) segundo a estratégia `partida`.
+
+    maquina0  todas na máquina 0, na ordem de geração (GerarTarefas do C#)
+    rodizio   tarefa k na máquina k mod m
+    guloso    cada tarefa, na ordem de geração, na máquina de menor carga
+    lpt       as tarefas da maior para a menor, na máquina de menor carga
+
+    Guloso e LPT usam um heap de (carga, máquina): O(n log m), com empate
+    para a máquina de menor índice.
+    """
+    n, m = len(maquinas.duracao), len(maquinas)
+    if partida == 'maquina0':
+        destinos = [(0, k) for k in range(n)]
+    elif partida == 'rodizio':
+        destinos = [(k % m, k) for k in range(n)]
+    elif partida in ('guloso', 'lpt'):
+        ordem = range(n)
+        if partida == 'lpt':
+            ordem = np.argsort(-maquinas.duracao, kind='stable')
+        cargas = [(0, j) for j in range(m)]
+        destinos = []
+        for k in ordem:
+            carga, j = heapq.heappop(cargas)
+            destinos.append((j, int(k)))
+            heapq.heappush(cargas, (carga + int(maquinas.duracao[k]), j))
+    else:
+        raise ValueError(f'partida desconhecida: {partida!r} (opções: {", ".join(PARTIDAS)})')
+    for j, k in destinos:
+        maquinas.adicionar_tarefa(j, k)
+
+
+class MaquinasOrdenadas:
+    """Máquinas com as tarefas num índice ordenado por duração, sem pilha.
+
+    `ordem[j]` é a lista ordenada das chaves duracao·N + tarefa (N tarefas)
+    da máquina j: a tarefa de duração mais próxima de um valor sai por busca
+    binária, e qualquer tarefa pode sair, não só a do topo. Compartilha
+    `duracao` e `makespan` com as `Maquinas` de origem.
+    """
+
+    def __init__(self, maquinas):
+        self.duracao  = maquinas.duracao
+        self.makespan = maquinas.makespan
+        self.base     = max(len(self.duracao), 1)
+        self.ordem    = []
+        for j in range(len(maquinas)):
+            chaves, k = [], maquinas.topo[j]
+            while k != -1:
+                chaves.append(int(self.duracao[k]) * self.base + int(k))
+                k = maquinas.proximo[k]
+            self.ordem.append(sorted(chaves))
+
+    def __len__(self):
+        return len(self.makespan)
+
+    def duracao_chave(self, chave):
+        return chave // self.base
+
+    def mais_proxima(self, j, deslocamento, diferenca):
+        """Chave de j com duração d tal que d − deslocamento ∈ [1, diferenca − 1]
+        e 2·(d − deslocamento) o mais perto possível de `diferenca` (ou None)."""
+        lista, base = self.ordem[j], self.base
+        p = bisect_left(lista, (deslocamento + (diferenca + 1) // 2) * base)
+        melhor, erro = None, diferenca
+        for i in (p - 1, p):
+            if 0 <= i < len(lista):
+                delta = lista[i] // base - deslocamento
+                if 0 < delta < diferenca and abs(2 * delta - diferenca) < erro:
+                    melhor, erro = lista[i], abs(2 * delta - diferenca)
+        return melhor
+
+    def duracoes_distintas(self, j):
+        """Uma chave por duração distinta de j (no máximo 99 com durações 1..99)."""
+        lista, base = self.ordem[j], self.base
+        i = 0
+        while i < len(lista):
+            yield lista[i]
+            i = bisect_left(lista, (lista[i] // base + 1) * base, i)
+
+    def mover(self, chave, origem, destino):
+        self.ordem[origem].pop(bisect_left(self.ordem[origem], chave))
+        insort(self.ordem[destino], chave)
+        d = chave // self.base
+        self.makespan[origem] -= d
+        self.makespan[destino] += d
+
+    def tarefas(self, j):
+        """Durações da máquina j, em ordem crescente."""
+        return [c // self.base for c in self.ordem[j]]
+
+
+class IndiceMakespan:
+    """Árvore de torneio sobre os makespans, com máximo e mínimo indexados.
+
+    Cada nó interno guarda a máquina vencedora da sua subárvore (-1 se vazia).
+    Empates vão para a subárvore da esquerda, ou seja, para o menor índice,
+    que é exatamente o desempate dos foreach de ResolucaoTarefas.cs.
+    Atualizar uma máquina e todas as consultas custam O(log m).
+    """
+
+    def __init__(self, valores):
+        self.m = len(valores)
+        self.tam = 1
+        while self.tam < self.m:
+            self.tam *= 2
+        self.val = [int(v) for v in valores]
+        self.mn = [-1] * (2 * self.tam)
+        self.mx = [-1] * (2 * self.tam)
+        for j in range(self.m):
+            self.mn[self.tam + j] = self.mx[self.tam + j] = j
+        for i in range(self.tam - 1, 0, -1):
+            self.mn[i] = self._menor(self.mn[2 * i], self.mn[2 * i + 1])
+            self.mx[i] = self._maior(self.mx[2 * i], self.mx[2 * i + 1])
+
+    def _menor(self, a, b):
+        if a < 0:
+            return b
+        if b < 0:
+            return a
+        return a if self.val[a] <= self.val[b] else b
+
+    def _maior(self, a, b):
+        if a < 0:
+            return b
+        if b < 0:
+            return a
+        return a if self.val[a] >= self.val[b] else b
+
+    def atualizar(self, j, valor):
+        self.val[j] = int(valor)
+        i = (self.tam + j) >> 1
+        mn, mx = self.mn, self.mx
+        while i:
+            mn[i] = self._menor(mn[2 * i], mn[2 * i + 1])
+            mx[i] = self._maior(mx[2 * i], mx[2 * i + 1])
+            i >>= 1
+
+    def maximo(self):
+        """Primeira máquina de maior makespan."""
+        return self.mx[1]
+
+    def _minimo_intervalo(self, ini, fim):
+        esq, dir_ = -1, -1
+        ini += self.tam
+        fim += self.tam
+        while ini < fim:
+            if ini & 1:
+                esq = self._menor(esq, self.mn[ini])
+                ini += 1
+            if fim & 1:
+                fim -= 1
+                dir_ = self._menor(self.mn[fim], dir_)
+            ini >>= 1
+            fim >>= 1
+        return self._menor(esq, dir_)
+
+    def minimo_exceto(self, j):
+        """Primeira máquina de menor makespan, ignorando a máquina j."""
+        return self._menor(self._minimo_intervalo(0, j),
+                           self._minimo_intervalo(j + 1, self.m))
+
+    def primeiro_menor_que(self, limite):
+        """Menor índice com makespan < limite, descendo pela árvore de mínimos."""
+        mn, val = self.mn, self.val
+        if mn[1] < 0 or val[mn[1]] >= limite:
+            return None
+        no = 1
+        while no < self.tam:
+            no *= 2
+            if mn[no] < 0 or val[mn[no]] >= limite:
+                no += 1
+        return no - self.tam
+
+
+class Trajetoria:
+    """Amostras (iteração, tempo em ms, makespan) em memória fixa.
+
+    Registra a iteração i e agenda a próxima amostra para i·fator, então o
+    número de pontos cresce com log(iterações). Se a capacidade se esgota, um
+    ponto a cada dois é descartado e o fator passa a ser fator²: o espaçamento
+    continua logarítmico e nada é realocado. A primeira e a última amostra
+    (makespan inicial e final) são sempre mantidas.
+    """
+
+    def __init__(self, capacidade=1024, fator=1.02):
+        if capacidade < 4:
+            raise ValueError('capacidade mínima da trajetória: 4 pontos')
+        self.iteracao = np.zeros(capacidade, dtype=np.int64)
+        self.tempo    = np.zeros(capacidade, dtype=np.float64)
+        self.makespan = np.zeros(capacidade, dtype=np.int64)
+        self.fator    = fator
+        self.tamanho  = 0
+        self.proxima  = 0   # menor iteração que ainda gera amostra
+
+    def __len__(self):
+        return self.tamanho
+
+    def registrar(self, iteracao, tempo, makespan):
+        if self.tamanho and self.iteracao[self.tamanho - 1] == iteracao:
+            self.tamanho -= 1   # mesma iteração: só atualiza a última amostra
+        elif self.tamanho == len(self.iteracao):
+            self._compactar()
+        k = self.tamanho
+        self.iteracao[k], self.tempo[k], self.makespan[k] = iteracao, tempo, makespan
+        self.tamanho += 1
+        self.proxima = max(iteracao + 1, int(iteracao * self.fator))
+
+    def _compactar(self):
+        manter = np.arange(0, self.tamanho, 2)
+        for arr in (self.iteracao, self.tempo, self.makespan):
+            arr[:len(manter)] = arr[manter]
+        self.tamanho = len(manter)
+        self.fator *= self.fator
+
+    def pontos(self):
+        """(iterações, tempos em ms, makespans) registrados, em ordem."""
+        k = self.tamanho
+        return self.iteracao[:k], self.tempo[:k], self.makespan[:k]
+
+
+class Perfil:
+    """Chamadas e tempo próprio (ns) de cada fase do laço de busca.
+
+    `medir` embrulha um método: o tempo de uma fase chamada dentro de outra
+    (a atualização do IndiceMakespan e RedefineMaquinaMakespan dentro do
+    movimento) é descontado da externa, então as fases somam no máximo o
+    tempo total. O que sobra (laço, sorteio, trajetória e a própria medição)
+    fica fora das fases.
+    """
+    FASES = ('vizinho', 'troca', 'elegivel', 'mover', 'indice', 'redefine')
+
+    def __init__(self):
+        self.chamadas = dict.fromkeys(self.FASES, 0)
+        self.ns       = dict.fromkeys(self.FASES, 0)
+        self._interno = 0   # tempo das fases aninhadas na chamada em curso
+
+    def medir(self, fase, funcao):
+        chamadas, ns, relogio = self.chamadas, self.ns, time.perf_counter_ns
+
+        def medida(*args):
+            externo, self._interno = self._interno, 0
+            t0 = relogio()
+            saida = funcao(*args)
+            dt = relogio() - t0
+            ns[fase] += dt - self._interno
+            chamadas[fase] += 1
+            self._interno = externo + dt
+            return saida
+        return medida
+
+    def colunas(self):
+        """Colunas opcionais do arquivo de resultados (perfil_<fase>_ms / _n)."""
+        saida = {}
+        for fase in self.FASES:
+            saida[f'perfil_{fase}_ms'] = self.ns[fase] / 1e6
+            saida[f'perfil_{fase}_n']  = self.chamadas[fase]
+        return saida
+
+
+class ResolucaoTarefas:
+    """Uma instância do problema, as três buscas locais de ResolucaoTarefas.cs
+    e a melhor escolha com trocas.
+
+    `seed` (ou um `np.random.Generator` em `rng`) torna a instância e as
+    escolhas aleatórias reprodutíveis; sem ele, cada instância é nova, como
+    no `new Random()` do C#. Com `indexado=False` as buscas varrem o vetor
+    de makespans com NumPy; os movimentos são os mesmos nos dois modos.
+    `trajetoria` (uma `Trajetoria`) recebe a curva de convergência da busca e
+    `perfil` (um `Perfil`), os tempos por fase. Com `tolerancia_gap`, a busca
+    para quando (makespan − limite inferior) / limite inferior ≤ tolerância,
+    sem nenhuma iteração se a solução inicial já estiver lá.
+    `parada(resolucao)` é consultada pela BLM a cada INTERVALO_PARADA
+    iterações; se devolver True, a busca termina ali (orçamento de tempo,
+    poda da multipartida). `partida` escolhe a solução inicial (PARTIDAS).
+    """
+
+    def __init__(self, tarefas, maquinas, alpha=0.0, seed=None, rng=None, indexado=True,
+                 trajetoria=None, perfil=None, tolerancia_gap=None, parada=None,
+                 partida='maquina0'):
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+        self.indexado = indexado
+        self.tempo = 0.0
+        self.iteracoes = 0
+        self.movimentos = 0   # iterações que moveram uma tarefa
+        self.makespan_inicial = 0
+        self.makespan_final = 0
+        self.limite_inferior = 0
+        self.parametro_alpha = alpha
+        self.tolerancia_gap = tolerancia_gap
+        self.parada = parada
+        self.partida = partida
+        self.trajetoria = trajetoria
+        self.perfil = perfil
+
+        self._maquinas = None
+        self._indice = None
+        self._span = 0   # índice da máquina com maior makespan
+        self._alvo = None   # makespan que encerra a busca (ver tolerancia_gap)
+        self.partida_no_alvo = False
+        self.gerar_tarefas(tarefas, maquinas)
+        if perfil is not None:
+            self._instrumentar(perfil)
+
+    def gerar_tarefas(self, n, m):
+        """Gera n tarefas de tempo aleatório (1..99) e monta a solução inicial."""
+        duracao = self.rng.integers(1, 100, size=n)
+        self._maquinas = Maquinas(m, duracao)
+        construir_partida(self._maquinas, self.partida)
+        # argmax devolve a primeira máquina de maior makespan, como o foreach do C#
+        self._span = int(np.argmax(self._maquinas.makespan))
+        self.makespan_inicial = int(self._maquinas.makespan[self._span])
+        self.limite_inferior = limite_inferior(duracao, m)
+        if self.tolerancia_gap is not None:
+            self._alvo = int(self.limite_inferior * (1 + self.tolerancia_gap))
+        # Partida já dentro da tolerância (LPT, guloso, m = 1): as buscas
+        # terminam sem nenhuma iteração
+        self.partida_no_alvo = self._alvo is not None and self.makespan_inicial <= self._alvo
+        if self.indexado:
+            self._indice = IndiceMakespan(self._maquinas.makespan)
+
+    # ── Heurísticas ─────────────────────────────────────────────────────────
+    def executa_primeira_escolha(self):
+        inicio = time.perf_counter()
+        rastro = self._iniciar_trajetoria()
+        alvo = self._alvo
+        if self.partida_no_alvo:
+            return self._finalizar(inicio)
+        while True:
+            escolha = self._primeiro_vizinho()  # primeiro vizinho elegível encontrado
+            self.iteracoes += 1
+            if escolha is None:  # finaliza se não houver vizinho elegível
+                break
+            self._mover(escolha)
+            if alvo is not None and self._maquinas.makespan[self._span] <= alvo:
+                break
+            if rastro is not None and self.iteracoes >= rastro.proxima:
+                self._amostrar(inicio)
+        return self._finalizar(inicio)
+
+    def executa_melhor_escolha(self):
+        inicio = time.perf_counter()
+        rastro = self._iniciar_trajetoria()
+        alvo = self._alvo
+        if self.partida_no_alvo:
+            return self._finalizar(inicio)
+        while True:
+            escolha = self._melhor_vizinho()  # vizinho com menor makespan
+            self.iteracoes += 1
+            if escolha is None or not self._elegivel(escolha):
+                break
+            self._mover(escolha)
+            if alvo is not None and self._maquinas.makespan[self._span] <= alvo:
+                break
+            if rastro is not None and self.iteracoes >= rastro.proxima:
+                self._amostrar(inicio)
+        return self._finalizar(inicio)
+
+    def executa_busca_monotona_randomizada(self):
+        inicio = time.perf_counter()
+        rng = self.rng
+        rastro = self._iniciar_trajetoria()
+        alvo = self._alvo
+        parada = self.parada
+        if self.partida_no_alvo:
+            return self._finalizar(inicio)
+        sem_melhora = 0
+        while True:
+            if rng.random() < self.parametro_alpha:
+                vizinho = self._vizinho_aleatorio()  # vizinho aleatório
+            else:
+                vizinho = self._melhor_vizinho()     # melhor melhora
+            self.iteracoes += 1
+
+            if vizinho is not None and self._elegivel(vizinho):
+                self._mover(vizinho)
+                sem_melhora = 0
+                if alvo is not None and self._maquinas.makespan[self._span] <= alvo:
+                    break
+            else:
+                sem_melhora += 1
+                if sem_melhora >= MAX_SEM_MELHORA:
+                    break
+            if rastro is not None and self.iteracoes >= rastro.proxima:
+                self._amostrar(inicio)
+            if parada is not None and not self.iteracoes % INTERVALO_PARADA and parada(self):
+                break
+        return self._finalizar(inicio)
+
+    def executa_melhor_escolha_trocas(self):
+        """Melhor movimento ou troca entre a máquina do makespan e a de menor carga.
+
+        Mover uma tarefa d da máquina do makespan s para a de menor carga j, ou
+        trocá-la por uma tarefa b de j, transfere δ = d (ou d − b); o par fica
+        melhor que ms[s] se 0 < δ < ms[s] − ms[j], e melhor ainda com δ perto
+        da metade da diferença. Para quando nenhum δ válido existe.
+        """
+        inicio = time.perf_counter()
+        self._maquinas = MaquinasOrdenadas(self._maquinas)
+        rastro = self._iniciar_trajetoria()
+        alvo = self._alvo
+        if self.partida_no_alvo:
+            return self._finalizar(inicio)
+        while True:
+            escolha = self._melhor_troca()  # (destino, chave que sai, chave que volta)
+            self.iteracoes += 1
+            if escolha is None:
+                break
+            self._trocar(*escolha)
+            if alvo is not None and self._maquinas.makespan[self._span] <= alvo:
+                break
+            if rastro is not None and self.iteracoes >= rastro.proxima:
+                self._amostrar(inicio)
+        return self._finalizar(inicio)
+
+    # ── Vizinhança ──────────────────────────────────────────────────────────
+    def _elegivel(self, j):
+        """A máquina j recebe a tarefa do topo do makespan sem aumentar o makespan."""
+        ms = self._maquinas.makespan
+        return ms[j] + self._maquinas.tarefa_topo(self._span) < ms[self._span]
+
+    def _mover(self, destino):
+        maq, origem = self._maquinas, self._span
+        maq.adicionar_tarefa(destino, maq.retira_tarefa(origem))
+        self.movimentos += 1
+        if self._indice is not None:
+            self._atualizar_indice(origem, destino)
+        self._redefine_maquina_makespan()
+
+    def _atualizar_indice(self, origem, destino):
+        ms = self._maquinas.makespan
+        self._indice.atualizar(origem, ms[origem])
+        self._indice.atualizar(destino, ms[destino])
+
+    def _redefine_maquina_makespan(self):
+        if self._indice is not None:
+            self._span = self._indice.maximo()
+            return
+        # argmax devolve a primeira máquina de maior makespan, como o foreach do C#
+        self._span = int(np.argmax(self._maquinas.makespan))
+
+    def _primeiro_vizinho(self):
+        ms = self._maquinas.makespan
+        limite = ms[self._span] - self._maquinas.tarefa_topo(self._span)
+        if self._indice is not None:
+            return self._indice.primeiro_menor_que(limite)
+        elegiveis = np.flatnonzero(ms < limite)
+        return int(elegiveis[0]) if len(elegiveis) else None
+
+    def _melhor_vizinho(self):
+        ms = self._maquinas.makespan
+        if len(ms) < 2:
+            return None
+        if self._indice is not None:
+            return self._indice.minimo_exceto(self._span)
+        # Exclui a máquina do makespan mascarando-a com o maior valor possível
+        span = self._span
+        valor = ms[span]
+        ms[span] = np.iinfo(ms.dtype).max
+        melhor = int(np.argmin(ms))
+        ms[span] = valor
+        return melhor
+
+    def _melhor_troca(self):
+        maq, span = self._maquinas, self._span
+        j = self._melhor_vizinho()
+        if j is None:
+            return None
+        diferenca = int(maq.makespan[span] - maq.makespan[j])
+        melhor = None
+        erro = diferenca   # |2δ − diferença| da melhor opção até aqui
+        chave = maq.mais_proxima(span, 0, diferenca)
+        if chave is not None:
+            melhor, erro = (j, chave, None), abs(2 * maq.duracao_chave(chave) - diferenca)
+        if erro <= 1 or 2 * maq.duracao_chave(maq.ordem[span][-1]) <= diferenca:
+            # δ já é a metade da diferença, ou é a maior tarefa de s e ainda
+            # fica aquém dela: nenhuma troca (δ = d − b < d) faz melhor
+            return melhor
+        for volta in maq.duracoes_distintas(j):
+            b = maq.duracao_chave(volta)
+            chave = maq.mais_proxima(span, b, diferenca)
+            if chave is not None:
+                e = abs(2 * (maq.duracao_chave(chave) - b) - diferenca)
+                if e < erro:
+                    melhor, erro = (j, chave, volta), e
+                    if erro <= 1:
+                        break
+        return melhor
+
+    def _trocar(self, destino, chave, volta=None):
+        maq, origem = self._maquinas, self._span
+        maq.mover(chave, origem, destino)
+        if volta is not None:
+            maq.mover(volta, destino, origem)
+        self.movimentos += 1
+        if self._indice is not None:
+            self._atualizar_indice(origem, destino)
+        self._redefine_maquina_makespan()
+
+    def _vizinho_aleatorio(self):
+        m = len(self._maquinas)
+        if m < 2:
+            return None
+        j = int(self.rng.integers(0, m - 1))  # m - 1 para pular a máquina do makespan
+        if j >= self._span:
+            j += 1
+        return j
+
+    # ── Perfil ──────────────────────────────────────────────────────────────
+    # Método de cada fase; as versões medidas sombreiam os da classe apenas
+    # nesta instância, então o laço sem perfil não paga nenhum teste.
+    FASES_PERFIL = {
+        '_primeiro_vizinho':         'vizinho',
+        '_melhor_vizinho':           'vizinho',
+        '_vizinho_aleatorio':        'vizinho',
+        '_melhor_troca':             'troca',
+        '_elegivel':                 'elegivel',
+        '_mover':                    'mover',
+        '_trocar':                   'mover',
+        '_atualizar_indice':         'indice',
+        '_redefine_maquina_makespan': 'redefine',
+    }
+
+    def _instrumentar(self, perfil):
+        for nome, fase in self.FASES_PERFIL.items():
+            setattr(self, nome, perfil.medir(fase, getattr(self, nome)))
+
+    # ── Trajetória ──────────────────────────────────────────────────────────
+    def _iniciar_trajetoria(self):
+        if self.trajetoria is not None:
+            self.trajetoria.registrar(self.iteracoes, 0.0, self._maquinas.makespan[self._span])
+        return self.trajetoria
+
+    def _amostrar(self, inicio):
+        self.trajetoria.registrar(self.iteracoes, (time.perf_counter() - inicio) * 1000,
+                                  self._maquinas.makespan[self._span])
+
+    def _finalizar(self, inicio):
+        self.tempo = (time.perf_counter() - inicio) * 1000
+        self.makespan_final = int(self._maquinas.makespan[self._span])
+        if self.trajetoria is not None:
+            self.trajetoria.registrar(self.iteracoes, self.tempo, self.makespan_final)
+        return self.resultado()
+
+    def makespan_atual(self):
+        return int(self._maquinas.makespan[self._span])
+
+    def atribuicao(self):
+        """Máquina de cada tarefa (array de n posições) na solução atual."""
+        maq = self._maquinas
+        saida = np.empty(len(maq.duracao), dtype=np.int64)
+        for j in range(len(maq)):
+            if isinstance(maq, MaquinasOrdenadas):
+                saida[[c % maq.base for c in maq.ordem[j]]] = j
+                continue
+            k = maq.topo[j]
+            while k != -1:
+                saida[k] = j
+                k = maq.proximo[k]
+        return saida
+
+    def resultado(self):
+        """Campos gravados no arquivo de resultados."""
+        return {
+            'tempo':      self.tempo,
+            'iteracoes':  self.iteracoes,
+            'mk_inicial': self.makespan_inicial,
+            'mk_final':   self.makespan_final,
+            'alpha':      self.parametro_alpha,
+            'gap':        self.gap(),
+        }
+
+    def gap(self):
+        """(makespan final − limite inferior) / limite inferior; 0 é ótimo comprovado."""
+        if self.limite_inferior <= 0:
+            return 0.0
+        return (self.makespan_final - self.limite_inferior) / self.limite_inferior
+
+
+# Nomes usados no arquivo de resultados (os mesmos de Controle.cs)
+PRIMEIRA_ESCOLHA = 'Monótona primeira escolha'
+MELHOR_ESCOLHA   = 'Monótona melhor escolha'
+BLM_RANDOMIZADA  = 'BLM randomizada'
+# Vizinhança ampliada (movimentos e trocas); não existe no programa .NET
+MELHOR_TROCA     = 'Melhor escolha com trocas'
+
+HEURISTICAS = {
+    PRIMEIRA_ESCOLHA: ResolucaoTarefas.executa_primeira_escolha,
+    MELHOR_ESCOLHA:   ResolucaoTarefas.executa_melhor_escolha,
+    BLM_RANDOMIZADA:  ResolucaoTarefas.executa_busca_monotona_randomizada,
+    MELHOR_TROCA:     ResolucaoTarefas.executa_melhor_escolha_trocas,
+}
@@ -0,0 +1,83 @@
+"""
+test_resolucao_tarefas.py
+=========================
+Soluções iniciais (PARTIDAS) e parada por gap quando a solução inicial já
+está dentro da tolerância.
+
+Uso:
+    python -m pytest -q test_resolucao_tarefas.py
+"""
+
+import pytest
+
+from resolucao_tarefas import (ResolucaoTarefas, HEURISTICAS, PARTIDAS, PRIMEIRA_ESCOLHA,
+                               MELHOR_ESCOLHA, BLM_RANDOMIZADA)
+from resolucao_lote import resolver_lote
+
+
+@pytest.mark.parametrize('partida', PARTIDAS)
+def test_partida_distribui_todas_as_tarefas(partida):
+    resolucao = ResolucaoTarefas(200, 7, 0.3, seed=5, partida=partida)
+    maquinas = resolucao._maquinas
+    cargas = [sum(maquinas.tarefas(j)) for j in range(len(maquinas))]
+    assert sum(cargas) == int(maquinas.duracao.sum())
+    assert cargas == [int(c) for c in maquinas.makespan]
+    assert resolucao.makespan_inicial == max(cargas) >= resolucao.limite_inferior
+
+
+@pytest.mark.parametrize('partida', ['guloso', 'lpt'])
+def test_partida_gulosa_respeita_limite_de_graham(partida):
+    # Escalonamento por lista: makespan ≤ Σt/m + max t
+    resolucao = ResolucaoTarefas(500, 12, 0.3, seed=7, partida=partida)
+    duracao = resolucao._maquinas.duracao
+    assert resolucao.makespan_inicial <= duracao.sum() / 12 + duracao.max()
+
+
+def test_lpt_nao_perde_para_o_guloso():
+    for seed in range(5):
+        lpt = ResolucaoTarefas(300, 10, 0.3, seed=seed, partida='lpt')
+        guloso = ResolucaoTarefas(300, 10, 0.3, seed=seed, partida='guloso')
+        assert lpt.makespan_inicial <= guloso.makespan_inicial
+
+
+@pytest.mark.parametrize('heuristica', list(HEURISTICAS))
+@pytest.mark.parametrize('partida', PARTIDAS)
+def test_busca_nao_piora_a_partida(heuristica, partida):
+    res = HEURISTICAS[heuristica](ResolucaoTarefas(60, 5, 0.3, seed=2, partida=partida))
+    assert res['mk_final'] <= res['mk_inicial']
+
+
+@pytest.mark.parametrize('heuristica', list(HEURISTICAS))
+@pytest.mark.parametrize('partida', ['lpt', 'guloso'])
+def test_partida_no_alvo_nao_itera(heuristica, partida):
+    resolucao = ResolucaoTarefas(2500, 50, 0.3, seed=3, tolerancia_gap=0.05, partida=partida)
+    assert resolucao.partida_no_alvo
+    res = HEURISTICAS[heuristica](resolucao)
+    assert res['iteracoes'] == 0
+    assert res['mk_final'] == res['mk_inicial']
+    assert res['gap'] <= 0.05
+
+
+@pytest.mark.parametrize('heuristica', list(HEURISTICAS))
+def test_uma_maquina_ja_e_otima(heuristica):
+    # Com m = 1 o limite inferior é a soma das durações
+    res = HEURISTICAS[heuristica](ResolucaoTarefas(30, 1, 0.3, seed=3, tolerancia_gap=0.0))
+    assert res['iteracoes'] == 0
+    assert res['gap'] == 0.0
+
+
+@pytest.mark.parametrize('heuristica', [PRIMEIRA_ESCOLHA, MELHOR_ESCOLHA, BLM_RANDOMIZADA])
+def test_lote_retira_instancias_no_alvo(heuristica):
+    lote = resolver_lote([(30, 1, 0.3), (40, 4, 0.3)], heuristica, seeds=[3, 4],
+                         tolerancia_gap=0.05)
+    assert lote[0]['iteracoes'] == 0
+    assert lote[1]['iteracoes'] > 0
+    isolada = HEURISTICAS[heuristica](ResolucaoTarefas(30, 1, 0.3, seed=3, tolerancia_gap=0.05))
+    assert lote[0]['iteracoes'] == isolada['iteracoes']
+    assert lote[0]['mk_final'] == isolada['mk_final']
+
+
+def test_sem_tolerancia_busca_normalmente():
+    resolucao = ResolucaoTarefas(2500, 50, 0.3, seed=3, partida='lpt')
+    assert not resolucao.partida_no_alvo
+    assert resolucao.executa_busca_monotona_randomizada()['iteracoes'] > 0